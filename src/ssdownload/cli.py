@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import builtins
+from collections.abc import Coroutine
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +17,7 @@ from .cli_utils import build_filter
 from .client import SuiteSparseDownloader
 from .config import Config
 from .filters import Filter
+from .index_manager import IndexManager
 from .page_scraper import PageScraper
 
 app = typer.Typer(
@@ -56,6 +58,16 @@ def _build_filter_or_exit(**kwargs: Any) -> Filter | None:
         raise typer.Exit(2) from e
 
 
+def _run[T](downloader: SuiteSparseDownloader, coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine, closing the downloader's HTTP client in the same loop."""
+
+    async def run_and_close() -> T:
+        async with downloader:
+            return await coro
+
+    return asyncio.run(run_and_close())
+
+
 @app.command()
 def download(
     identifier: str = typer.Argument(..., help="Matrix name or group/name"),
@@ -101,14 +113,16 @@ def download(
         if "/" in identifier and group is None:
             # Format: group/name
             group_name, matrix_name = identifier.split("/", 1)
-            result = asyncio.run(downloader.download(group_name, matrix_name, format))
+            result = _run(
+                downloader, downloader.download(group_name, matrix_name, format)
+            )
         elif group is not None:
             # Explicit group provided
-            result = asyncio.run(downloader.download(group, identifier, format))
+            result = _run(downloader, downloader.download(group, identifier, format))
         else:
             # Just matrix name - search for group automatically
             console.print(f"🔍 Searching for matrix '{identifier}'...")
-            result = asyncio.run(downloader.download_by_name(identifier, format))
+            result = _run(downloader, downloader.download_by_name(identifier, format))
 
         console.print(f"✓ Downloaded: {result}")
     except Exception as e:
@@ -139,7 +153,7 @@ def get(
 
     try:
         console.print(f"🔍 Searching for matrix '{name}'...")
-        result = asyncio.run(downloader.download_by_name(name, format))
+        result = _run(downloader, downloader.download_by_name(name, format))
         console.print(f"✓ Downloaded: {result}")
     except Exception as e:
         console.print(f"✗ Error: {e}", style="red")
@@ -152,7 +166,7 @@ def groups():
     downloader = SuiteSparseDownloader()
 
     try:
-        groups = asyncio.run(downloader._get_available_groups())
+        groups = _run(downloader, downloader._get_available_groups())
         sorted_groups = sorted(groups)
 
         console.print(f"\n[bold]Available Groups ({len(sorted_groups)} total):[/bold]")
@@ -278,10 +292,10 @@ def bulk(
 
     async def run_bulk() -> builtins.list[Path]:
         if needs_page and filter_obj is not None:
-            index_downloader = SuiteSparseDownloader()
-            matrices = await _list_with_page_filter(
-                index_downloader, filter_obj, max_files
-            )
+            async with SuiteSparseDownloader() as index_downloader:
+                matrices = await _list_with_page_filter(
+                    index_downloader, filter_obj, max_files
+                )
             if not matrices:
                 return []
             return await downloader.bulk_download(
@@ -292,7 +306,7 @@ def bulk(
         return await downloader.bulk_download(filter_obj, format, None, max_files)
 
     try:
-        results = asyncio.run(run_bulk())
+        results = _run(downloader, run_bulk())
         console.print(f"✓ Downloaded {len(results)} matrices")
     except Exception as e:
         console.print(f"✗ Error: {e}", style="red")
@@ -386,7 +400,9 @@ def list(
 
         if needs_page and filter_obj is not None:
             # Two-phase filtering: CSV first, then page scraping
-            page_results = asyncio.run(_list_with_page_filter(downloader, filter_obj))
+            page_results = _run(
+                downloader, _list_with_page_filter(downloader, filter_obj)
+            )
             total_count = len(page_results)
             if limit is not None:
                 page_results = page_results[:limit]
@@ -704,7 +720,9 @@ def clean_cache(
 
     cache_dir = Config.get_default_cache_dir()
     cache_files = [
-        ("CSV index cache", cache_dir / "ssstats_cache.json"),
+        ("CSV index cache", cache_dir / IndexManager.INDEX_CACHE_FILENAME),
+        ("CSV index cache", cache_dir / IndexManager.LEGACY_INDEX_CACHE_FILENAME),
+        ("CSV index ETag", cache_dir / IndexManager.ETAG_CACHE_FILENAME),
         ("Page info cache", cache_dir / PageScraper.PAGE_CACHE_FILENAME),
     ]
 
@@ -1,58 +1,54 @@
 """CLI utility functions for SuiteSparse downloader."""
 
 import math
+from functools import lru_cache
 from typing import Any
 
 from .filters import Filter
 
 
+def _range_bound_to_int(text: str, label: str) -> int:
+    """Convert one bound of a range string to an int, truncating decimals."""
+    try:
+        float_val = float(text)
+    except ValueError as e:
+        raise ValueError(f"Invalid {label} value: {text}") from e
+    if not math.isfinite(float_val):
+        raise ValueError(f"Invalid {label} value: {text} (infinity or NaN)")
+    return int(float_val)
+
+
+@lru_cache(maxsize=4096)
 def parse_range(value: str) -> tuple[int | None, int | None]:
-    """Parse a range string like '1000:5000' or ':5000' or '1000:'."""
+    """Parse a range string like '1000:5000' or ':5000' or '1000:'.
+
+    Results are memoized; invalid values raise ValueError and are not cached.
+    """
     if not value or value.strip() == "":
         raise ValueError("Empty range value")
 
-    if ":" not in value:
-        # Single value, treat as exact match
-        try:
-            float_val = float(value)
-            if not math.isfinite(float_val):
-                raise ValueError(f"Invalid range value: {value} (infinity or NaN)")
-            val = int(float_val)
-            return (val, val)
-        except ValueError as e:
-            raise ValueError(f"Invalid range value: {value}") from e
+    min_text, sep, max_text = value.partition(":")
 
-    parts = value.split(":", 1)
+    if not sep:
+        # Single value, treat as exact match
+        val = _range_bound_to_int(value, "range")
+        return (val, val)
 
     # Handle the case where value is just ":"
-    if not parts[0] and not parts[1]:
+    if not min_text and not max_text:
         raise ValueError("Invalid range: both min and max are empty")
 
-    min_val = None
-    if parts[0]:
-        try:
-            float_min = float(parts[0])
-            if not math.isfinite(float_min):
-                raise ValueError(f"Invalid min value: {parts[0]} (infinity or NaN)")
-            min_val = int(float_min)
-        except ValueError as e:
-            raise ValueError(f"Invalid min value: {parts[0]}") from e
-
-    max_val = None
-    if parts[1]:
-        try:
-            float_max = float(parts[1])
-            if not math.isfinite(float_max):
-                raise ValueError(f"Invalid max value: {parts[1]} (infinity or NaN)")
-            max_val = int(float_max)
-        except ValueError as e:
-            raise ValueError(f"Invalid max value: {parts[1]}") from e
-
+    min_val = _range_bound_to_int(min_text, "min") if min_text else None
+    max_val = _range_bound_to_int(max_text, "max") if max_text else None
     return (min_val, max_val)
 
 
+@lru_cache(maxsize=4096)
 def parse_float_range(value: str) -> tuple[float | None, float | None]:
-    """Parse a range string into float values, e.g. '1e3:1e6' or ':1e4'."""
+    """Parse a range string into float values, e.g. '1e3:1e6' or ':1e4'.
+
+    Results are memoized like parse_range.
+    """
     if not value or value.strip() == "":
         raise ValueError("Empty range value")
 
@@ -140,8 +136,8 @@ def build_filter(
 
     # Parse range filters (integer)
     if size:
-        filter_kwargs["n_rows"] = parse_range(size)
-        filter_kwargs["n_cols"] = parse_range(size)
+        # rows/cols below override the matching side of size
+        filter_kwargs["n_rows"] = filter_kwargs["n_cols"] = parse_range(size)
     if rows:
         filter_kwargs["n_rows"] = parse_range(rows)
     if cols:
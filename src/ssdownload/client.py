@@ -4,6 +4,7 @@ import asyncio
 from pathlib import Path
 from typing import Any
 
+import httpx
 from rich.console import Console
 from rich.progress import (
     BarColumn,
@@ -17,7 +18,9 @@ from .config import Config
 from .downloader import FileDownloader
 from .exceptions import MatrixNotFoundError
 from .filters import Filter
+from .http_client import SharedHTTPClient
 from .index_manager import IndexManager
+from .search_index import SearchIndex
 
 
 class SuiteSparseDownloader:
@@ -32,6 +35,7 @@ class SuiteSparseDownloader:
         extract_archives: bool = True,
         keep_archives: bool = False,
         flat_structure: bool = False,
+        client: httpx.AsyncClient | None = None,
     ):
         """Initialize the downloader.
 
@@ -45,6 +49,8 @@ class SuiteSparseDownloader:
             extract_archives: Whether to automatically extract tar.gz files (default: True)
             keep_archives: Whether to keep original tar.gz files after extraction (default: False)
             flat_structure: Whether to save files directly in output directory without group subdirectories (default: False)
+            client: HTTP client to use for all requests. If None, a keep-alive
+                   client is created on first use and closed by aclose().
         """
         self.cache_dir = Path(cache_dir or Path.cwd())
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -57,15 +63,29 @@ class SuiteSparseDownloader:
         self.flat_structure = flat_structure
 
         self.console = Console()
+        # One connection pool for index, checksum and file requests
+        self.http_client = SharedHTTPClient(timeout, client)
         # IndexManager uses system cache by default, but can be overridden for downloads
         index_cache_dir = None if cache_dir is None else self.cache_dir
-        self.index_manager = IndexManager(index_cache_dir)
+        self.index_manager = IndexManager(index_cache_dir, self.http_client)
         self.file_downloader = FileDownloader(
             verify_checksums=verify_checksums,
             timeout=timeout,
             extract_archives=extract_archives,
             keep_archives=keep_archives,
+            http_client=self.http_client,
         )
+        self._search_index: SearchIndex | None = None
+
+    async def aclose(self) -> None:
+        """Close the HTTP client used for index and file requests."""
+        await self.http_client.aclose()
+
+    async def __aenter__(self) -> "SuiteSparseDownloader":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
 
     async def download(
         self,
@@ -141,11 +161,11 @@ class SuiteSparseDownloader:
 
         return final_path
 
-    async def _get_available_groups(self):
+    async def _get_available_groups(self) -> frozenset[str]:
         """Get all available groups from the index.
 
         Returns:
-            Set of group names
+            Frozen set of group names
         """
         return await self.index_manager.get_groups()
 
@@ -191,7 +211,31 @@ class SuiteSparseDownloader:
         if filter_obj is None:
             return matrices
 
-        return [matrix for matrix in matrices if filter_obj.matches(matrix)]
+        search_index = self._get_search_index(matrices)
+        if not search_index.could_match(filter_obj):
+            return []
+
+        rows = search_index.candidates(filter_obj)
+        if rows is None:
+            return [matrix for matrix in matrices if filter_obj.matches(matrix)]
+
+        if search_index.is_exact(filter_obj):
+            return [matrices[i] for i in rows]
+
+        return [matrices[i] for i in rows if filter_obj.matches(matrices[i])]
+
+    def _get_search_index(self, matrices: list[dict[str, Any]]) -> SearchIndex:
+        """Get the search index for the given matrices, rebuilding it on refresh.
+
+        Args:
+            matrices: Matrix index as returned by the index manager
+
+        Returns:
+            SearchIndex built from ``matrices``
+        """
+        if self._search_index is None or self._search_index.matrices is not matrices:
+            self._search_index = SearchIndex(matrices)
+        return self._search_index
 
     async def bulk_download(
         self,
@@ -200,6 +244,7 @@ class SuiteSparseDownloader:
         output_dir: str | Path | None = None,
         max_files: int | None = None,
         matrices: list[dict[str, Any]] | None = None,
+        smallest_first: bool = False,
     ) -> list[Path]:
         """Download multiple matrices matching filter criteria.
 
@@ -209,9 +254,11 @@ class SuiteSparseDownloader:
             output_dir: Output directory
             max_files: Maximum number of files to download
             matrices: Pre-resolved matrix metadata (e.g. after page-scraped filtering)
+            smallest_first: Look up file sizes first and start the smallest
+                downloads first; files of unknown size are started last
 
         Returns:
-            List of paths to downloaded files
+            List of paths to downloaded files, in the order of the matrices
         """
         if matrices is None:
             matrices = await self.find_matrices(filter_obj)
@@ -224,29 +271,20 @@ class SuiteSparseDownloader:
 
         self.console.print(f"Found {len(matrices)} matrices to download")
 
-        # Create download tasks
-        semaphore = asyncio.Semaphore(self.workers)
-        downloaded_paths = []
+        # Downloads are started in this order; results keep the input order
+        order = list(range(len(matrices)))
+        if smallest_first:
+            sizes = await self.head_sizes(matrices, format_type)
+            order.sort(
+                key=lambda i: sizes.get(
+                    (matrices[i].get("group", ""), matrices[i].get("name", "")),
+                    float("inf"),
+                )
+            )
 
-        async def download_with_semaphore(matrix: dict[str, Any]) -> Path | None:
-            async with semaphore:
-                try:
-                    group = matrix.get("group", "")
-                    name = matrix.get("name", "")
-                    if not group or not name:
-                        return None
+        # At most self.workers downloads run at once; the rest wait here
+        semaphore = asyncio.Semaphore(self.workers)
 
-                    path = await self.download(
-                        group, name, format_type, output_dir, _show_progress=False
-                    )
-                    return path
-                except Exception as e:
-                    self.console.print(
-                        f"Failed to download {matrix.get('name', 'unknown')}: {e}"
-                    )
-                    return None
-
-        # Execute downloads
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -256,17 +294,68 @@ class SuiteSparseDownloader:
         ) as progress:
             main_task = progress.add_task("Overall progress", total=len(matrices))
 
-            tasks = [download_with_semaphore(matrix) for matrix in matrices]
+            async def download_with_semaphore(matrix: dict[str, Any]) -> Path | None:
+                async with semaphore:
+                    try:
+                        group = matrix.get("group", "")
+                        name = matrix.get("name", "")
+                        if not group or not name:
+                            return None
+
+                        return await self.download(
+                            group, name, format_type, output_dir, _show_progress=False
+                        )
+                    except Exception as e:
+                        self.console.print(
+                            f"Failed to download {matrix.get('name', 'unknown')}: {e}"
+                        )
+                        return None
+                    finally:
+                        progress.advance(main_task)
 
-            for i, coro in enumerate(asyncio.as_completed(tasks)):
-                result = await coro
-                if result:
-                    downloaded_paths.append(result)
-                progress.update(main_task, completed=i + 1)
+            # The semaphore wakes waiters in FIFO order, so downloads start in
+            # the order the coroutines are passed to gather
+            started = await asyncio.gather(
+                *(download_with_semaphore(matrices[i]) for i in order)
+            )
 
+        results: list[Path | None] = [None] * len(matrices)
+        for i, path in zip(order, started, strict=True):
+            results[i] = path
+        downloaded_paths = [path for path in results if path]
         self.console.print(f"Successfully downloaded {len(downloaded_paths)} matrices")
         return downloaded_paths
 
+    async def head_sizes(
+        self, matrices: list[dict[str, Any]], format_type: str = "mat"
+    ) -> dict[tuple[str, str], int]:
+        """Look up download sizes with concurrent HEAD requests.
+
+        Args:
+            matrices: Matrix metadata dictionaries
+            format_type: File format ('mat', 'mm', 'rb')
+
+        Returns:
+            Mapping of (group, name) to file size in bytes, for the matrices
+            whose size the server reported
+        """
+        specs = [
+            (matrix.get("group", ""), matrix.get("name", "")) for matrix in matrices
+        ]
+        specs = [spec for spec in dict.fromkeys(specs) if all(spec)]
+        semaphore = asyncio.Semaphore(Config.MAX_CONNECTIONS)
+
+        async def head_with_semaphore(spec: tuple[str, str]) -> int | None:
+            async with semaphore:
+                return await self.file_downloader.get_content_length(*spec, format_type)
+
+        sizes = await asyncio.gather(*(head_with_semaphore(spec) for spec in specs))
+        return {
+            spec: size
+            for spec, size in zip(specs, sizes, strict=True)
+            if size is not None
+        }
+
     def list_matrices(
         self,
         filter_obj: Filter | None = None,
@@ -299,7 +388,16 @@ class SuiteSparseDownloader:
             return [], 0
         except RuntimeError:
             # No event loop running, safe to use asyncio.run
-            return asyncio.run(self._list_matrices_async(filter_obj, limit))
+            return asyncio.run(self._list_matrices_and_close(filter_obj, limit))
+
+    async def _list_matrices_and_close(
+        self,
+        filter_obj: Filter | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """List matrices, then close the HTTP client bound to this event loop."""
+        async with self:
+            return await self._list_matrices_async(filter_obj, limit)
 
     async def _list_matrices_async(
         self,
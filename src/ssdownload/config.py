@@ -17,17 +17,98 @@ Attributes:
     DEFAULT_WORKERS: Default number of concurrent workers
     MAX_WORKERS: Maximum allowed concurrent workers
     DEFAULT_TIMEOUT: Default HTTP timeout in seconds
-    CHUNK_SIZE: File download chunk size in bytes
+    CHUNK_SIZE: Chunk size in bytes for reading local files
+    DOWNLOAD_CHUNK_SIZE: Chunk size in bytes for streaming downloads to disk
+    EXTRACT_READ_SIZE: Bytes of compressed archive data read at a time
+    EXTRACT_COPY_SIZE: Buffer size in bytes for writing extracted files
 """
 
+import importlib.util
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import httpx
 from platformdirs import user_cache_dir
 
+# URL path segment and file extension for each supported format
+_FORMAT_TABLE = {
+    "mat": ("mat", ".mat"),
+    "mm": ("MM", ".tar.gz"),
+    "rb": ("RB", ".tar.gz"),
+}
+
+
+# Room for every matrix of the collection (a few thousand) in every format
+_URL_CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def _build_matrix_url(base_url: str, group: str, name: str, format_type: str) -> str:
+    """Build a matrix download URL, memoized for repeated lookups."""
+    try:
+        format_dir, ext = _FORMAT_TABLE[format_type]
+    except KeyError:
+        raise ValueError(f"Unsupported format: {format_type}") from None
+    return f"{base_url}/{format_dir}/{group}/{name}{ext}"
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def _build_checksum_url(base_url: str, group: str, name: str, format_type: str) -> str:
+    """Build a matrix checksum URL, memoized for repeated lookups."""
+    return f"{_build_matrix_url(base_url, group, name, format_type)}.md5"
+
+
+@lru_cache(maxsize=1)
+def _h2_available() -> bool:
+    """Check once whether the optional ``h2`` package is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+@lru_cache(maxsize=8)
+def _build_http_client_config(
+    timeout: float,
+    max_connections: int,
+    max_keepalive_connections: int,
+    keepalive_expiry: float,
+    user_agent: str,
+    http2: bool,
+) -> Mapping[str, Any]:
+    """Build a read-only httpx client configuration, memoized per settings."""
+    return MappingProxyType(
+        {
+            "timeout": httpx.Timeout(timeout),
+            "limits": httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            "follow_redirects": True,
+            "headers": MappingProxyType({"User-Agent": user_agent}),
+            "http2": http2,
+        }
+    )
+
+
+@lru_cache(maxsize=4)
+def _default_cache_dir(
+    env_override: str | None, xdg_cache_home: str | None, home: str | None
+) -> Path:
+    """Resolve the default cache directory, memoized per relevant environment.
+
+    The arguments are only the cache key: platformdirs reads the same
+    variables itself, so changing any of them resolves the directory again.
+    """
+    if env_override:
+        return Path(env_override)
+
+    # Use platformdirs for system-appropriate cache directory
+    return Path(user_cache_dir("ssdownload", appauthor=False))
+
 
 @dataclass
 class Config:
@@ -46,37 +127,44 @@ class Config:
     DEFAULT_WORKERS: int = 4
     DEFAULT_TIMEOUT: float = 30.0
     CHUNK_SIZE: int = 8192
+    DOWNLOAD_CHUNK_SIZE: int = 1024 * 1024
+
+    # Archive extraction settings
+    EXTRACT_READ_SIZE: int = 128 * 1024
+    EXTRACT_COPY_SIZE: int = 2 * 1024 * 1024
 
     # HTTP client settings
     MAX_CONNECTIONS: int = 10
-    MAX_KEEPALIVE_CONNECTIONS: int = 5
+    MAX_KEEPALIVE_CONNECTIONS: int = 10
+    KEEPALIVE_EXPIRY: float = 30.0  # Seconds an idle connection is kept open
     USER_AGENT: str = "ssdownload/0.3.1 (Python SuiteSparse downloader)"
 
     @classmethod
-    def get_http_client_config(cls, timeout: float | None = None) -> dict[str, Any]:
+    def get_http_client_config(cls, timeout: float | None = None) -> Mapping[str, Any]:
         """Get HTTP client configuration for httpx.AsyncClient.
 
         Args:
             timeout: Custom timeout in seconds. If None, uses DEFAULT_TIMEOUT.
 
         Returns:
-            Dictionary containing httpx client configuration with timeout,
-            connection limits, redirect settings, and user agent.
+            Read-only mapping containing httpx client configuration with
+            timeout, connection limits, redirect settings, and user agent.
+            HTTP/2 is enabled when the optional ``h2`` package is installed.
+            The mapping is shared between calls with the same settings.
 
         Example:
             >>> config = Config.get_http_client_config(timeout=30.0)
             >>> async with httpx.AsyncClient(**config) as client:
             ...     response = await client.get("https://example.com")
         """
-        return {
-            "timeout": httpx.Timeout(timeout or cls.DEFAULT_TIMEOUT),
-            "limits": httpx.Limits(
-                max_connections=cls.MAX_CONNECTIONS,
-                max_keepalive_connections=cls.MAX_KEEPALIVE_CONNECTIONS,
-            ),
-            "follow_redirects": True,
-            "headers": {"User-Agent": cls.USER_AGENT},
-        }
+        return _build_http_client_config(
+            timeout or cls.DEFAULT_TIMEOUT,
+            cls.MAX_CONNECTIONS,
+            cls.MAX_KEEPALIVE_CONNECTIONS,
+            cls.KEEPALIVE_EXPIRY,
+            cls.USER_AGENT,
+            _h2_available(),
+        )
 
     @classmethod
     def get_file_extension(cls, format_type: str) -> str:
@@ -94,8 +182,7 @@ class Config:
             >>> Config.get_file_extension("mm")
             '.tar.gz'
         """
-        extensions = {"mat": ".mat", "mm": ".tar.gz", "rb": ".tar.gz"}
-        return extensions.get(format_type, ".mat")
+        return _FORMAT_TABLE.get(format_type, _FORMAT_TABLE["mat"])[1]
 
     @classmethod
     def get_matrix_url(cls, group: str, name: str, format_type: str = "mat") -> str:
@@ -116,14 +203,8 @@ class Config:
             >>> Config.get_matrix_url("Boeing", "ct20stif", "mat")
             'https://suitesparse-collection-website.herokuapp.com/mat/Boeing/ct20stif.mat'
         """
-        if format_type == "mat":
-            return f"{cls.FILES_BASE_URL}/mat/{group}/{name}.mat"
-        elif format_type == "mm":
-            return f"{cls.FILES_BASE_URL}/MM/{group}/{name}.tar.gz"
-        elif format_type == "rb":
-            return f"{cls.FILES_BASE_URL}/RB/{group}/{name}.tar.gz"
-        else:
-            raise ValueError(f"Unsupported format: {format_type}")
+        # The base URL is part of the cache key so overriding it stays effective
+        return _build_matrix_url(cls.FILES_BASE_URL, group, name, format_type)
 
     @classmethod
     def get_checksum_url(cls, group: str, name: str, format_type: str = "mat") -> str:
@@ -141,8 +222,7 @@ class Config:
             >>> Config.get_checksum_url("Boeing", "ct20stif", "mat")
             'https://suitesparse-collection-website.herokuapp.com/mat/Boeing/ct20stif.mat.md5'
         """
-        base_url = cls.get_matrix_url(group, name, format_type)
-        return f"{base_url}.md5"
+        return _build_checksum_url(cls.FILES_BASE_URL, group, name, format_type)
 
     @classmethod
     def get_default_cache_dir(cls) -> Path:
@@ -163,9 +243,8 @@ class Config:
             PosixPath('/home/user/.cache/ssdownload')
         """
         # Allow override via environment variable
-        env_cache_dir = os.getenv("SSDOWNLOAD_CACHE_DIR")
-        if env_cache_dir:
-            return Path(env_cache_dir)
-
-        # Use platformdirs for system-appropriate cache directory
-        return Path(user_cache_dir("ssdownload", appauthor=False))
+        return _default_cache_dir(
+            os.getenv("SSDOWNLOAD_CACHE_DIR"),
+            os.getenv("XDG_CACHE_HOME"),
+            os.getenv("HOME"),
+        )
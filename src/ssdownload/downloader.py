@@ -4,7 +4,8 @@ This module provides the FileDownloader class that handles downloading matrix
 files from the SuiteSparse Matrix Collection with advanced features:
 
 - Resume support for interrupted downloads using HTTP Range requests
-- MD5 checksum verification for data integrity
+- MD5 checksum verification for data integrity, recorded in a .md5 sidecar
+  so unchanged files are not hashed again
 - Progress tracking integration with Rich progress bars
 - Configurable timeout and retry behavior
 - Efficient streaming downloads with chunked reading
@@ -28,15 +29,33 @@ them to the final location after successful completion and verification.
 For compressed formats (MM/RB), archives are automatically extracted.
 """
 
+import asyncio
+import contextlib
 import hashlib
+import os
 import tarfile
 from pathlib import Path
+from typing import Literal
 
 import httpx
 from rich.progress import Progress, TaskID
 
+try:
+    import rapidgzip
+except ImportError:  # rapidgzip is an optional speedup for archive extraction
+    rapidgzip = None
+
 from .config import Config
 from .exceptions import ChecksumError, DownloadError
+from .http_client import SharedHTTPClient
+
+# Priority order for selecting the main file of an extracted archive
+_MAIN_FILE_PRIORITY = {
+    ".mtx": 0,  # Matrix Market format
+    ".rua": 1,  # Rutherford Boeing format (real unsymmetric assembled)
+    ".rsa": 1,  # Rutherford Boeing format (real symmetric assembled)
+    ".rb": 2,  # Rutherford Boeing format alternative
+}
 
 
 class FileDownloader:
@@ -48,6 +67,8 @@ class FileDownloader:
         timeout: float | None = None,
         extract_archives: bool = True,
         keep_archives: bool = False,
+        http_client: SharedHTTPClient | None = None,
+        parallel_extract: bool = True,
     ):
         """Initialize the file downloader.
 
@@ -56,11 +77,27 @@ class FileDownloader:
             timeout: HTTP request timeout in seconds
             extract_archives: Whether to automatically extract tar.gz files
             keep_archives: Whether to keep original tar.gz files after extraction
+            http_client: HTTP client shared with other components. If None, the
+                        downloader creates its own.
+            parallel_extract: Whether to decompress archives on all CPU cores
+                             when the optional ``rapidgzip`` package is installed
         """
         self.verify_checksums = verify_checksums
         self.timeout = timeout or Config.DEFAULT_TIMEOUT
         self.extract_archives = extract_archives
         self.keep_archives = keep_archives
+        self.http_client = http_client or SharedHTTPClient(self.timeout)
+        self.parallel_extract = parallel_extract
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        await self.http_client.aclose()
+
+    async def __aenter__(self) -> "FileDownloader":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
 
     async def download_file(
         self,
@@ -87,11 +124,24 @@ class FileDownloader:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         temp_path = output_path.with_suffix(output_path.suffix + ".part")
 
+        # An archive extracted by a previous run needs neither download nor
+        # extraction, even if the archive itself was removed afterwards
+        if format_type in ["mm", "rb"] and self.extract_archives:
+            extracted_path = await self._find_extracted_file(output_path, format_type)
+            if extracted_path is not None:
+                if progress and task_id:
+                    progress.update(
+                        task_id,
+                        completed=100,
+                        description=f"✓ {extracted_path.name} (existing)",
+                    )
+                return extracted_path
+
         # Check if file already exists and is valid
         if output_path.exists():
             # If we have a checksum, verify it
             if expected_md5:
-                if await self._verify_file_checksum(output_path, expected_md5):
+                if await self._verify_existing_file(output_path, expected_md5):
                     if progress and task_id:
                         progress.update(
                             task_id, completed=100, description=f"✓ {output_path.name}"
@@ -133,13 +183,17 @@ class FileDownloader:
         await self._download_with_resume(url, temp_path, progress, task_id)
 
         # Verify checksum if provided
-        if expected_md5 and self.verify_checksums:
-            if not await self._verify_file_checksum(temp_path, expected_md5):
+        verified_md5 = expected_md5 if self.verify_checksums else None
+        if verified_md5:
+            if not await self._verify_file_checksum(temp_path, verified_md5):
                 temp_path.unlink(missing_ok=True)
                 raise ChecksumError(f"Checksum mismatch for {output_path.name}")
 
-        # Move temp file to final location
-        temp_path.rename(output_path)
+        # Move temp file to final location; replace() is a single atomic rename
+        # that also overwrites a stale file that failed verification
+        temp_path.replace(output_path)
+        if verified_md5:
+            self._record_verified_checksum(output_path, verified_md5)
 
         if progress and task_id:
             progress.update(task_id, description=f"✓ {output_path.name}")
@@ -170,33 +224,37 @@ class FileDownloader:
             headers["Range"] = f"bytes={resume_pos}-"
 
         try:
-            async with httpx.AsyncClient(
-                **Config.get_http_client_config(self.timeout)
-            ) as client:
-                async with client.stream("GET", url, headers=headers) as response:
-                    response.raise_for_status()
-
-                    # Get total size for progress tracking
-                    total_size = None
-                    if "content-length" in response.headers:
-                        content_length = int(response.headers["content-length"])
-                        total_size = content_length + resume_pos
-
-                    if progress and task_id and total_size:
-                        progress.update(task_id, total=total_size, completed=resume_pos)
-
-                    # Download with resume
-                    mode = "ab" if resume_pos > 0 else "wb"
-                    with open(temp_path, mode) as f:
-                        downloaded = resume_pos
-                        async for chunk in response.aiter_bytes(
-                            chunk_size=Config.CHUNK_SIZE
-                        ):
-                            f.write(chunk)
-                            downloaded += len(chunk)
-
-                            if progress and task_id:
-                                progress.update(task_id, completed=downloaded)
+            client = self.http_client.get_client()
+            async with client.stream("GET", url, headers=headers) as response:
+                response.raise_for_status()
+
+                # A server that ignores the Range header sends the whole file;
+                # appending that to the partial file would corrupt it
+                if resume_pos > 0 and response.status_code != 206:
+                    resume_pos = 0
+
+                # Get total size for progress tracking
+                total_size = None
+                if "content-length" in response.headers:
+                    content_length = int(response.headers["content-length"])
+                    total_size = content_length + resume_pos
+
+                if progress and task_id and total_size:
+                    progress.update(task_id, total=total_size, completed=resume_pos)
+
+                # Download with resume. Large chunks are written from a worker
+                # thread so disk writes overlap with other downloads' network I/O.
+                mode = "ab" if resume_pos > 0 else "wb"
+                with open(temp_path, mode) as f:
+                    downloaded = resume_pos
+                    async for chunk in response.aiter_bytes(
+                        chunk_size=Config.DOWNLOAD_CHUNK_SIZE
+                    ):
+                        await asyncio.to_thread(f.write, chunk)
+                        downloaded += len(chunk)
+
+                        if progress and task_id:
+                            progress.update(task_id, completed=downloaded)
         except (httpx.TimeoutException, httpx.ConnectError, httpx.HTTPStatusError) as e:
             from .exceptions import DownloadError
 
@@ -223,12 +281,54 @@ class FileDownloader:
         if not file_path.exists():
             return False
 
-        hasher = hashlib.md5()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(Config.CHUNK_SIZE), b""):
-                hasher.update(chunk)
+        # Hashing a large file is CPU-bound; keep it off the event loop
+        actual_md5 = await asyncio.to_thread(self._compute_digest, file_path)
+        return actual_md5.lower() == expected_md5.lower()
 
-        return hasher.hexdigest().lower() == expected_md5.lower()
+    async def _verify_existing_file(self, file_path: Path, expected_md5: str) -> bool:
+        """Verify a previously downloaded file, re-hashing it only if needed.
+
+        A file verified before is recorded in a ``<file>.md5`` sidecar. It is
+        trusted without reading it again as long as it has not been modified
+        since the sidecar was written.
+
+        Args:
+            file_path: Path to file to verify
+            expected_md5: Expected MD5 hash
+
+        Returns:
+            True if checksum matches
+        """
+        sidecar = file_path.with_name(file_path.name + ".md5")
+        try:
+            recorded_md5 = sidecar.read_text(encoding="utf-8").split()[0]
+            unchanged = file_path.stat().st_mtime_ns <= sidecar.stat().st_mtime_ns
+        except (OSError, IndexError):
+            recorded_md5, unchanged = "", False
+        if unchanged and recorded_md5.lower() == expected_md5.lower():
+            return True
+
+        if not await self._verify_file_checksum(file_path, expected_md5):
+            return False
+        self._record_verified_checksum(file_path, expected_md5)
+        return True
+
+    def _record_verified_checksum(self, file_path: Path, md5: str) -> None:
+        """Write the ``<file>.md5`` sidecar of a file whose checksum matched."""
+        sidecar = file_path.with_name(file_path.name + ".md5")
+        try:
+            sidecar.write_text(f"{md5.lower()}  {file_path.name}\n", encoding="utf-8")
+        except OSError:
+            pass  # Without a sidecar the file is simply verified again
+
+    def _compute_digest(self, file_path: Path, algorithm: str = "md5") -> str:
+        """Compute the hex digest of a file with the given hashlib algorithm."""
+        # file_digest reads into one reusable buffer (in C where possible), and
+        # usedforsecurity=False keeps MD5 available on FIPS-restricted builds.
+        with open(file_path, "rb") as f:
+            return hashlib.file_digest(
+                f, lambda: hashlib.new(algorithm, usedforsecurity=False)
+            ).hexdigest()
 
     async def get_checksum(
         self, group: str, name: str, format_type: str = "mat"
@@ -245,17 +345,38 @@ class FileDownloader:
         """
         try:
             checksum_url = Config.get_checksum_url(group, name, format_type)
-            async with httpx.AsyncClient(
-                **Config.get_http_client_config(self.timeout)
-            ) as client:
-                response = await client.get(checksum_url)
-                if response.status_code == 200:
-                    return response.text.strip().split()[0]
+            response = await self.http_client.get_client().get(checksum_url)
+            if response.status_code == 200:
+                return response.text.strip().split()[0]
         except Exception:
             pass  # Checksum not available
 
         return None
 
+    async def get_content_length(
+        self, group: str, name: str, format_type: str = "mat"
+    ) -> int | None:
+        """Get the size of a matrix file without downloading it.
+
+        Args:
+            group: Matrix group name
+            name: Matrix name
+            format_type: File format
+
+        Returns:
+            Size in bytes from the Content-Length header if available,
+            None otherwise
+        """
+        try:
+            url = Config.get_matrix_url(group, name, format_type)
+            response = await self.http_client.get_client().head(url)
+            if response.status_code == 200:
+                return int(response.headers["content-length"])
+        except Exception:
+            pass  # Size not available
+
+        return None
+
     async def _handle_extraction(
         self,
         archive_path: Path,
@@ -278,7 +399,13 @@ class FileDownloader:
             progress.update(task_id, description=f"📂 Extracting {archive_path.name}")
 
         try:
-            extracted_path = await self._extract_archive(archive_path)
+            # With verification enabled the extracted data is hashed while it
+            # is written, so the marker never costs a second read of the file
+            digests: dict[Path, str] | None = {} if self.verify_checksums else None
+            extracted_path = await self._extract_archive(archive_path, digests)
+            self._write_extraction_marker(
+                extracted_path, digests.get(extracted_path) if digests else None
+            )
 
             # Handle archive cleanup based on keep_archives setting
             if not self.keep_archives:
@@ -303,42 +430,138 @@ class FileDownloader:
         except Exception as e:
             raise DownloadError(f"Failed to extract {archive_path.name}: {e}") from e
 
-    async def _extract_archive(self, archive_path: Path) -> Path:
+    def _expected_extracted_path(self, archive_path: Path, format_type: str) -> Path:
+        """Predict where the main file of a SuiteSparse archive is extracted.
+
+        SuiteSparse archives contain a ``<name>/`` directory holding
+        ``<name>.mtx`` (Matrix Market) or ``<name>.rb`` (Rutherford Boeing).
+
+        Args:
+            archive_path: Path to the tar.gz archive
+            format_type: File format ("mm", "rb")
+
+        Returns:
+            Expected path of the extracted main file
+        """
+        name = archive_path.name.removesuffix(".tar.gz")
+        ext = ".mtx" if format_type == "mm" else ".rb"
+        return archive_path.parent / name / f"{name}{ext}"
+
+    async def _find_extracted_file(
+        self, archive_path: Path, format_type: str
+    ) -> Path | None:
+        """Find a main file completely extracted from this archive before.
+
+        An extraction is complete once its ``.sha256`` marker has been written.
+        With checksum verification enabled, the file is re-hashed against the
+        digest in the marker; a marker without a digest cannot be verified.
+
+        Args:
+            archive_path: Path to the tar.gz archive
+            format_type: File format ("mm", "rb")
+
+        Returns:
+            Path to the extracted main file, or None if it must be re-extracted
+        """
+        target = self._expected_extracted_path(archive_path, format_type)
+        marker = target.with_name(target.name + ".sha256")
+        try:
+            if not marker.exists() or target.stat().st_size == 0:
+                return None
+            expected_sha256 = next(iter(marker.read_text(encoding="utf-8").split()), "")
+        except OSError:
+            return None
+
+        if self.verify_checksums:
+            if not expected_sha256:
+                return None
+            actual_sha256 = await asyncio.to_thread(
+                self._compute_digest, target, "sha256"
+            )
+            if actual_sha256 != expected_sha256:
+                return None
+
+        return target
+
+    def _write_extraction_marker(
+        self, extracted_path: Path, sha256: str | None = None
+    ) -> None:
+        """Record a completed extraction in a ``.sha256`` file next to it.
+
+        Args:
+            extracted_path: Path to the extracted main file
+            sha256: SHA-256 of the extracted file, if it was hashed during
+                   extraction. Without it the marker is left empty.
+        """
+        marker = extracted_path.with_name(extracted_path.name + ".sha256")
+        temp_marker = marker.with_name(marker.name + ".part")
+        try:
+            temp_marker.write_text(
+                f"{sha256}  {extracted_path.name}\n" if sha256 else ""
+            )
+            # Atomic, so a marker is never seen half written
+            temp_marker.replace(marker)
+        except OSError:
+            pass  # Without a marker the archive is simply extracted again
+
+    async def _extract_archive(
+        self, archive_path: Path, digests: dict[Path, str] | None = None
+    ) -> Path:
         """Extract tar.gz archive and return path to the main file.
 
+        Decompression runs in a worker thread so concurrent downloads keep
+        making progress while an archive is extracted.
+
         Args:
             archive_path: Path to the tar.gz archive
+            digests: If given, filled with the SHA-256 of every extracted
+                    regular file, computed as its data is written
 
         Returns:
             Path to the extracted main file
         """
+        return await asyncio.to_thread(
+            self._extract_archive_sync, archive_path, digests
+        )
+
+    def _extract_archive_sync(
+        self, archive_path: Path, digests: dict[Path, str] | None = None
+    ) -> Path:
+        """Blocking implementation of :meth:`_extract_archive`."""
         extract_dir = archive_path.parent
         temp_files = []
+        sizes: dict[Path, int] = {}
 
         try:
-            with tarfile.open(archive_path, "r:gz") as tar:
-                # Security validation: prevent path traversal attacks
-                self._validate_tar_members(tar)
-
-                # Record files that will be extracted for cleanup on error
-                temp_files = [
-                    extract_dir / member.name
-                    for member in tar.getmembers()
-                    if member.isfile()
-                ]
-
-                # Extract all files
-                tar.extractall(path=extract_dir)
+            # Stream mode decompresses the archive once; listing the members
+            # first and extracting afterwards would decompress it twice
+            with contextlib.ExitStack() as stack:
+                tar = self._open_archive(archive_path, stack)
+                for member in tar:
+                    # Security validation: prevent path traversal attacks
+                    self._validate_tar_member(member)
+
+                    # Record files that will be extracted for cleanup on error
+                    if member.isfile():
+                        temp_files.append(extract_dir / member.name)
+                        sizes[temp_files[-1]] = member.size
+
+                    if member.isfile() and digests is not None:
+                        digests[temp_files[-1]] = self._extract_and_hash(
+                            tar, member, temp_files[-1]
+                        )
+                    else:
+                        tar.extract(member, path=extract_dir)
 
-                # Find extracted files that actually exist
-                extracted_files = [f for f in temp_files if f.exists() and f.is_file()]
+            # Find extracted files that actually exist
+            extracted_files = [f for f in temp_files if f.is_file()]
 
-                if not extracted_files:
-                    raise DownloadError("No files were extracted from archive")
+            if not extracted_files:
+                raise DownloadError("No files were extracted from archive")
 
-                # Find the main matrix file
-                main_file = self._find_main_file(extracted_files)
-                return main_file
+            # Find the main matrix file
+            main_file = self._find_main_file(extracted_files, sizes)
+            return main_file
 
         except Exception as e:
             # Cleanup partially extracted files on error
@@ -353,6 +576,68 @@ class FileDownloader:
                 raise
             raise DownloadError(f"Archive extraction failed: {e}") from e
 
+    def _extract_and_hash(
+        self, tar: tarfile.TarFile, member: tarfile.TarInfo, target: Path
+    ) -> str:
+        """Extract a regular file member, hashing its data as it is written.
+
+        Args:
+            tar: Archive positioned at ``member``
+            member: Regular file member to extract
+            target: Path to write the member to
+
+        Returns:
+            Hex SHA-256 digest of the member's data
+        """
+        source = tar.extractfile(member)
+        assert source is not None  # Always set for regular files
+        target.parent.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        with source, target.open("wb") as f:
+            while chunk := source.read(Config.EXTRACT_COPY_SIZE):
+                digest.update(chunk)
+                f.write(chunk)
+        # Same permissions and modification time as tar.extract() would set
+        tar.chmod(member, str(target))
+        tar.utime(member, str(target))
+        return digest.hexdigest()
+
+    def _open_archive(
+        self, archive_path: Path, stack: contextlib.ExitStack
+    ) -> tarfile.TarFile:
+        """Open a tar.gz archive for a single streaming pass over its members.
+
+        Args:
+            archive_path: Path to the tar.gz archive
+            stack: Exit stack that closes the archive and its decompressor
+
+        Returns:
+            TarFile in stream mode
+        """
+        mode: Literal["r|", "r|gz"]
+        if self.parallel_extract and rapidgzip is not None:
+            # rapidgzip decodes independent deflate blocks on a thread pool
+            fileobj = stack.enter_context(
+                rapidgzip.open(str(archive_path), parallelization=os.cpu_count() or 1)
+            )
+            mode = "r|"
+        else:
+            # tarfile opens the file itself and reads EXTRACT_READ_SIZE bytes
+            # of compressed data at a time, which bypasses the file's own
+            # buffer; wrapping it in a larger BufferedReader measured slower
+            fileobj = None
+            mode = "r|gz"
+
+        tar = stack.enter_context(
+            tarfile.open(
+                archive_path, mode, fileobj=fileobj, bufsize=Config.EXTRACT_READ_SIZE
+            )
+        )
+        # TarFile reads copybufsize when copying member data out; typeshed
+        # declares neither the attribute nor the tarfile.open() keyword
+        tar.copybufsize = Config.EXTRACT_COPY_SIZE  # type: ignore[attr-defined]
+        return tar
+
     def _validate_tar_members(self, tar: tarfile.TarFile) -> None:
         """Validate tar members for security (prevent path traversal).
 
@@ -363,47 +648,56 @@ class FileDownloader:
             DownloadError: If unsafe tar members are found
         """
         for member in tar.getmembers():
-            # Check for absolute paths
-            if member.name.startswith("/"):
-                raise DownloadError(
-                    f"Unsafe tar member with absolute path: {member.name}"
-                )
+            self._validate_tar_member(member)
 
-            # Check for parent directory references
-            if ".." in member.name:
-                raise DownloadError(
-                    f"Unsafe tar member with parent reference: {member.name}"
-                )
+    def _validate_tar_member(self, member: tarfile.TarInfo) -> None:
+        """Validate a single tar member for security (prevent path traversal).
+
+        Args:
+            member: TarInfo of the member to validate
 
-            # Check for excessively long paths
-            if len(member.name) > 255:
-                raise DownloadError(f"Tar member name too long: {member.name}")
+        Raises:
+            DownloadError: If the member is unsafe
+        """
+        # Check for absolute paths
+        if member.name.startswith("/"):
+            raise DownloadError(f"Unsafe tar member with absolute path: {member.name}")
+
+        # Check for parent directory references
+        if ".." in member.name:
+            raise DownloadError(
+                f"Unsafe tar member with parent reference: {member.name}"
+            )
 
-    def _find_main_file(self, extracted_files: list[Path]) -> Path:
+        # Check for excessively long paths
+        if len(member.name) > 255:
+            raise DownloadError(f"Tar member name too long: {member.name}")
+
+    def _find_main_file(
+        self, extracted_files: list[Path], sizes: dict[Path, int] | None = None
+    ) -> Path:
         """Find the main matrix file from extracted files.
 
         Args:
             extracted_files: List of extracted file paths
+            sizes: Size of each extracted file in bytes, e.g. from the tar
+                  headers. If None, the files are stat'ed.
 
         Returns:
             Path to the main matrix file
         """
-        # Priority order for file selection
-        patterns = [
-            "*.mtx",  # Matrix Market format
-            "*.rua",  # Rutherford Boeing format
-            "*.rb",  # Rutherford Boeing format alternative
-            "*",  # Any other file
-        ]
-
-        for pattern in patterns:
-            matches = [f for f in extracted_files if f.match(pattern)]
-            if matches:
-                # If multiple matches, return the largest file
-                return max(matches, key=lambda f: f.stat().st_size)
-
-        # Fallback: return the largest file
         if extracted_files:
-            return max(extracted_files, key=lambda f: f.stat().st_size)
+            if sizes is None:
+                sizes = {f: f.stat().st_size for f in extracted_files}
+
+            # Highest priority suffix first; among equal suffixes the largest
+            # file, and the first one listed on a tie
+            return min(
+                extracted_files,
+                key=lambda f: (
+                    _MAIN_FILE_PRIORITY.get(f.suffix.lower(), len(_MAIN_FILE_PRIORITY)),
+                    -sizes[f],
+                ),
+            )
 
         raise DownloadError("No suitable main file found in extracted archive")
@@ -1,10 +1,79 @@
 """Filter classes for SuiteSparse Matrix Collection."""
 
+import dataclasses
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
+Predicate = Callable[[dict[str, Any]], bool]
 
-@dataclass
+# Page-scraped range fields, checked in this order
+_PAGE_RANGE_FIELDS = (
+    "condition_number",
+    "matrix_norm",
+    "numerical_rank",
+    "null_space_dim",
+    "num_strong_components",
+    "num_dmperm_blocks",
+    "structural_rank",
+)
+
+
+def _get_rows(matrix_info: dict[str, Any]) -> int | None:
+    """Get the number of rows, accepting either field name."""
+    return matrix_info.get("num_rows", matrix_info.get("rows"))
+
+
+def _get_cols(matrix_info: dict[str, Any]) -> int | None:
+    """Get the number of columns, accepting either field name."""
+    return matrix_info.get("num_cols", matrix_info.get("cols"))
+
+
+def _get_nnz(matrix_info: dict[str, Any]) -> int | None:
+    """Get the number of nonzeros, accepting either field name."""
+    return matrix_info.get("nnz", matrix_info.get("nonzeros"))
+
+
+def _key_getter(key: str) -> Callable[[dict[str, Any]], Any]:
+    """Build a getter returning ``matrix_info[key]`` or None."""
+    return lambda matrix_info: matrix_info.get(key)
+
+
+def _range_predicate(
+    getter: Callable[[dict[str, Any]], int | float | None],
+    range_filter: tuple[int | float | None, int | float | None],
+) -> Predicate:
+    """Build a predicate checking that a value falls within a range filter.
+
+    Args:
+        getter: Function extracting the value from matrix metadata
+        range_filter: Tuple of (min, max) where either can be None
+
+    Returns:
+        Predicate that is False for missing or out-of-range values
+    """
+    min_val, max_val = range_filter
+
+    def check_range(matrix_info: dict[str, Any]) -> bool:
+        value = getter(matrix_info)
+        if value is None:
+            return False
+        if min_val is not None and value < min_val:
+            return False
+        if max_val is not None and value > max_val:
+            return False
+        return True
+
+    return check_range
+
+
+def _contains_predicate(key: str, term: str) -> Predicate:
+    """Build a case-insensitive partial-match predicate for a string field."""
+    needle = term.lower()
+    return lambda matrix_info: needle in matrix_info.get(key, "").lower()
+
+
+@dataclass(frozen=True)
 class Filter:
     """Filter for SuiteSparse Matrix Collection matrices.
 
@@ -50,6 +119,18 @@ class Filter:
     cholesky_candidate: bool | None = None
     square: bool | None = None
 
+    # ``field`` is shadowed by the attribute above, so use the module path
+    _predicates: list[Predicate] = dataclasses.field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Compile the configured criteria into a list of predicates.
+
+        The filter is frozen, so the compiled predicates cannot go stale.
+        """
+        object.__setattr__(self, "_predicates", self._compile_predicates())
+
     def matches(self, matrix_info: dict[str, Any]) -> bool:
         """Check if a matrix matches this filter.
 
@@ -59,147 +140,85 @@ class Filter:
         Returns:
             True if matrix matches all filter criteria
         """
-        # Check SPD (Symmetric Positive Definite) - must be symmetric AND positive definite AND real
-        if self.spd is not None:
-            if self.spd:
-                # When SPD is required, use the calculated SPD flag
-                spd_flag = matrix_info.get("spd", False)
-                if not spd_flag:
-                    return False
-            else:
-                # When SPD is explicitly False, exclude SPD matrices
-                spd_flag = matrix_info.get("spd", False)
-                if spd_flag:
-                    return False
-
-        # Check positive definite flag
-        if self.posdef is not None and matrix_info.get("posdef") != self.posdef:
-            return False
-
-        # Check matrix shape
-        if self.square is not None:
-            rows = matrix_info.get("num_rows", matrix_info.get("rows"))
-            cols = matrix_info.get("num_cols", matrix_info.get("cols"))
-            if rows is None or cols is None or (rows == cols) != self.square:
-                return False
-
-        # Check number of rows
-        if self.n_rows is not None:
-            rows = matrix_info.get("num_rows", matrix_info.get("rows"))
-            if not self._check_range(rows, self.n_rows):
-                return False
-
-        # Check number of columns
-        if self.n_cols is not None:
-            cols = matrix_info.get("num_cols", matrix_info.get("cols"))
-            if not self._check_range(cols, self.n_cols):
+        for predicate in self._predicates:
+            if not predicate(matrix_info):
                 return False
+        return True
 
-        # Check number of nonzeros
-        if self.nnz is not None:
-            nonzeros = matrix_info.get("nnz", matrix_info.get("nonzeros"))
-            if not self._check_range(nonzeros, self.nnz):
-                return False
+    def _compile_predicates(self) -> list[Predicate]:
+        """Build one predicate per criterion that is set on this filter.
 
-        # Check field type
-        if self.field is not None:
-            field_type = matrix_info.get("field", "").lower()
-            if self.field.lower() not in field_type:
-                return False
+        Unset criteria contribute nothing, so ``matches`` only evaluates the
+        checks the filter actually needs, with thresholds bound in advance.
 
-        # Check group
-        if self.group is not None:
-            group_name = matrix_info.get("group", "")
-            if self.group.lower() not in group_name.lower():
-                return False
+        Returns:
+            List of predicates that must all hold for a matrix to match
+        """
+        predicates: list[Predicate] = []
 
-        # Check name
+        # matches() stops at the first failing predicate, so the criteria that
+        # reject the most matrices come first: name, group and kind have many
+        # distinct values (case-insensitive partial match)
         if self.name is not None:
-            matrix_name = matrix_info.get("name", "")
-            if self.name.lower() not in matrix_name.lower():
-                return False
-
-        # Check kind
+            predicates.append(_contains_predicate("name", self.name))
+        if self.group is not None:
+            predicates.append(_contains_predicate("group", self.group))
         if self.kind is not None:
-            kind_type = matrix_info.get("kind", "").lower()
-            if self.kind.lower() not in kind_type:
-                return False
+            predicates.append(_contains_predicate("kind", self.kind))
 
-        # Check structure
-        if self.structure is not None:
-            struct_type = matrix_info.get("structure", "").lower()
-            if self.structure.lower() not in struct_type:
-                return False
+        # Check SPD (Symmetric Positive Definite) using the calculated SPD flag
+        if self.spd is not None:
+            spd = self.spd
+            predicates.append(lambda m: bool(m.get("spd", False)) == spd)
 
-        # Page-scraped filters (condition number, norm, rank, etc.)
-        if self.condition_number is not None:
-            cond = matrix_info.get("condition_number")
-            if not self._check_range(cond, self.condition_number):
-                return False
+        # Check positive definite flag
+        if self.posdef is not None:
+            posdef = self.posdef
+            predicates.append(lambda m: m.get("posdef") == posdef)
 
-        if self.matrix_norm is not None:
-            norm = matrix_info.get("matrix_norm")
-            if not self._check_range(norm, self.matrix_norm):
-                return False
+        # Check matrix shape
+        if self.square is not None:
+            square = self.square
 
-        if self.numerical_rank is not None:
-            rank = matrix_info.get("numerical_rank")
-            if not self._check_range(rank, self.numerical_rank):
-                return False
+            def check_square(m: dict[str, Any]) -> bool:
+                rows = _get_rows(m)
+                cols = _get_cols(m)
+                return (
+                    rows is not None and cols is not None and (rows == cols) == square
+                )
 
-        if self.null_space_dim is not None:
-            nsd = matrix_info.get("null_space_dim")
-            if not self._check_range(nsd, self.null_space_dim):
-                return False
+            predicates.append(check_square)
 
-        if self.num_strong_components is not None:
-            nsc = matrix_info.get("num_strong_components")
-            if not self._check_range(nsc, self.num_strong_components):
-                return False
+        # Check dimensions and number of nonzeros
+        if self.n_rows is not None:
+            predicates.append(_range_predicate(_get_rows, self.n_rows))
+        if self.n_cols is not None:
+            predicates.append(_range_predicate(_get_cols, self.n_cols))
+        if self.nnz is not None:
+            predicates.append(_range_predicate(_get_nnz, self.nnz))
 
-        if self.num_dmperm_blocks is not None:
-            ndb = matrix_info.get("num_dmperm_blocks")
-            if not self._check_range(ndb, self.num_dmperm_blocks):
-                return False
+        # Check the remaining string fields, which have few distinct values
+        if self.field is not None:
+            predicates.append(_contains_predicate("field", self.field))
+        if self.structure is not None:
+            predicates.append(_contains_predicate("structure", self.structure))
 
-        if self.structural_rank is not None:
-            sr = matrix_info.get("structural_rank")
-            if not self._check_range(sr, self.structural_rank):
-                return False
+        # Page-scraped filters (condition number, norm, rank, etc.)
+        for key in _PAGE_RANGE_FIELDS:
+            range_filter = getattr(self, key)
+            if range_filter is not None:
+                predicates.append(_range_predicate(_key_getter(key), range_filter))
 
         if self.cholesky_candidate is not None:
-            cc = matrix_info.get("cholesky_candidate")
-            if cc is None or cc != self.cholesky_candidate:
-                return False
-
-        return True
+            cholesky_candidate = self.cholesky_candidate
 
-    def _check_range(
-        self,
-        value: int | float | None,
-        range_filter: tuple[int | float | None, int | float | None],
-    ) -> bool:
-        """Check if a value falls within a range filter.
+            def check_cholesky(m: dict[str, Any]) -> bool:
+                cc = m.get("cholesky_candidate")
+                return cc is not None and cc == cholesky_candidate
 
-        Args:
-            value: The value to check
-            range_filter: Tuple of (min, max) where either can be None
+            predicates.append(check_cholesky)
 
-        Returns:
-            True if value is within range
-        """
-        if value is None:
-            return False
-
-        min_val, max_val = range_filter
-
-        if min_val is not None and value < min_val:
-            return False
-
-        if max_val is not None and value > max_val:
-            return False
-
-        return True
+        return predicates
 
     def requires_page_data(self) -> bool:
         """Check if this filter requires data from matrix web pages.
@@ -207,18 +226,8 @@ class Filter:
         Returns:
             True if any page-scraped filter fields are set
         """
-        return any(
-            getattr(self, field) is not None
-            for field in (
-                "condition_number",
-                "matrix_norm",
-                "numerical_rank",
-                "null_space_dim",
-                "num_strong_components",
-                "num_dmperm_blocks",
-                "structural_rank",
-                "cholesky_candidate",
-            )
+        return self.cholesky_candidate is not None or any(
+            getattr(self, key) is not None for key in _PAGE_RANGE_FIELDS
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -0,0 +1,108 @@
+"""Shared HTTP client for SuiteSparse requests.
+
+Creating an ``httpx.AsyncClient`` per request means every index, checksum and
+file request pays for a new TCP connection and TLS handshake. SharedHTTPClient
+lazily creates one keep-alive client and hands it out for every request, so
+requests to the same host reuse pooled connections.
+
+An httpx client is bound to the event loop it was first used in, while the
+synchronous API and the CLI call ``asyncio.run`` once per operation. The
+client is therefore recreated when it is used from a different event loop,
+and the stale client is closed so its pooled sockets are released.
+
+Example:
+    >>> from ssdownload.http_client import SharedHTTPClient
+    >>>
+    >>> http = SharedHTTPClient(timeout=60.0)
+    >>> response = await http.get_client().get("https://sparse.tamu.edu")
+    >>> await http.aclose()
+"""
+
+import asyncio
+import contextlib
+
+import httpx
+
+from .config import Config
+
+
+class SharedHTTPClient:
+    """Lazily created ``httpx.AsyncClient`` reused across requests."""
+
+    def __init__(
+        self, timeout: float | None = None, client: httpx.AsyncClient | None = None
+    ):
+        """Initialize the shared client.
+
+        Args:
+            timeout: HTTP request timeout in seconds for the created client
+            client: Externally managed client to use instead. It is never
+                   recreated or closed by this object.
+        """
+        self.timeout = timeout
+        self._client = client
+        self._owns_client = client is None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._closing: set[asyncio.Task[None]] = set()
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Get the client, creating it if needed.
+
+        Must be called from within a running event loop.
+
+        Returns:
+            HTTP client to issue requests with
+        """
+        if not self._owns_client:
+            assert self._client is not None
+            return self._client
+
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is None
+            or self._client.is_closed
+            or self._client_loop is not loop
+        ):
+            if self._client is not None and not self._client.is_closed:
+                # Keep a reference so the close task is not garbage collected
+                task = loop.create_task(
+                    _close_stale_client(self._client, self._client_loop)
+                )
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+            self._client = httpx.AsyncClient(
+                **Config.get_http_client_config(self.timeout)
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the client if it was created by this object."""
+        if self._owns_client and self._client is not None:
+            client = self._client
+            self._client = None
+            if self._client_loop is asyncio.get_running_loop():
+                await client.aclose()
+            else:
+                await _close_stale_client(client, self._client_loop)
+
+
+async def _close_stale_client(
+    client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None
+) -> None:
+    """Close a client created in another event loop.
+
+    Args:
+        client: Client to close
+        loop: Event loop the client was created in
+    """
+    if loop is not None and loop.is_running():
+        # The loop is alive in another thread; close the client where it lives
+        future = asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        with contextlib.suppress(Exception):
+            await asyncio.wrap_future(future)
+        return
+
+    # The loop has finished, so its transports can only be torn down directly
+    with contextlib.suppress(Exception):
+        await client.aclose()
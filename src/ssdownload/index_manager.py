@@ -35,36 +35,91 @@ The CSV format from SuiteSparse contains the following columns (UFstats.csv form
 - Pattern entries (number of zero and explicit zero entries in the sparse matrix)
 """
 
+import csv
+import gzip
+import io
 import json
+import os
+import sys
 import time
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup for the JSON disk cache
+    orjson = None
+
 from .config import Config
 from .exceptions import IndexError
+from .http_client import SharedHTTPClient
+
+# Low-cardinality string fields shared across many matrices
+_INTERNED_FIELDS = ("group", "kind", "field", "structure")
+
+# Parsed disk caches shared by all IndexManager instances in the process, keyed
+# by cache file and its modification time so a rewritten file is never served
+# stale. Only the latest entry per file is kept.
+_DISK_INDEX_CACHE: dict[tuple[Path, int], list[dict[str, Any]]] = {}
+
+
+def _remember_disk_index(index_file: Path, matrices: list[dict[str, Any]]) -> None:
+    """Record the parsed contents of a disk cache file for other instances."""
+    try:
+        mtime_ns = index_file.stat().st_mtime_ns
+    except OSError:
+        return
+    for key in [key for key in _DISK_INDEX_CACHE if key[0] == index_file]:
+        del _DISK_INDEX_CACHE[key]
+    _DISK_INDEX_CACHE[(index_file, mtime_ns)] = matrices
 
 
 class IndexManager:
     """Manages the SuiteSparse matrix index from CSV."""
 
-    def __init__(self, cache_dir: Path | None = None):
+    INDEX_CACHE_FILENAME = "ssstats_cache.json.gz"
+    # Uncompressed cache written by earlier versions; read and then replaced
+    LEGACY_INDEX_CACHE_FILENAME = "ssstats_cache.json"
+    ETAG_CACHE_FILENAME = "ssstats_cache.etag"
+
+    def __init__(
+        self, cache_dir: Path | None = None, http_client: SharedHTTPClient | None = None
+    ):
         """Initialize the index manager.
 
         Args:
             cache_dir: Directory to store cached index files. If None, uses the
                       system default cache directory.
+            http_client: HTTP client shared with other components. If None, the
+                        index manager creates its own.
 
         Note:
             The cache directory will be created if it doesn't exist.
-            Cache files are stored as JSON for fast loading.
+            The index is cached as gzip-compressed JSON.
         """
         self.cache_dir = cache_dir or Config.get_default_cache_dir()
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._csv_index_cache: list[dict[str, Any]] | None = None
         self._csv_index_cache_time: float = 0
-        self._groups_cache: set[str] | None = None
+        self._groups_cache: frozenset[str] | None = None
+        # Matrix name -> row, with the index list it was built from
+        self._name_index: dict[Any, int] = {}
+        self._name_index_source: list[dict[str, Any]] | None = None
+        self._index_etag: str | None = None
+        self.http_client = http_client or SharedHTTPClient()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        await self.http_client.aclose()
+
+    async def __aenter__(self) -> "IndexManager":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
 
     async def get_index(self, force_refresh: bool = False) -> list[dict[str, Any]]:
         """Get the matrix index from SuiteSparse CSV file.
@@ -85,38 +140,120 @@ class IndexManager:
         ):
             return self._csv_index_cache
 
-        # Try to load from disk cache
-        index_file = self.cache_dir / "ssstats_cache.json"
+        # Try to load from disk cache, falling back to a legacy uncompressed one
+        cache_file = self.cache_dir / self.INDEX_CACHE_FILENAME
+        legacy_file = self.cache_dir / self.LEGACY_INDEX_CACHE_FILENAME
+        index_file = (
+            legacy_file
+            if not cache_file.exists() and legacy_file.exists()
+            else cache_file
+        )
         if not force_refresh and index_file.exists():
             try:
                 stat = index_file.stat()
                 if (current_time - stat.st_mtime) < Config.CACHE_TTL:
-                    with open(index_file, encoding="utf-8") as f:
-                        cached_data = json.load(f)
-                        if isinstance(cached_data, list):
-                            self._csv_index_cache = cached_data
-                            self._csv_index_cache_time = current_time
-                            return self._csv_index_cache
-            except (json.JSONDecodeError, OSError):
+                    # Another instance may already have parsed this file
+                    cached_data = _DISK_INDEX_CACHE.get((index_file, stat.st_mtime_ns))
+                    if cached_data is None:
+                        cached_data = self._load_index_from_disk(index_file)
+                        if cached_data is not None:
+                            _remember_disk_index(index_file, cached_data)
+                    if cached_data is not None:
+                        self._set_index_cache(cached_data, current_time)
+                        return cached_data
+            except OSError:
                 pass
 
-        # Fetch fresh CSV index
-        matrices = await self._fetch_csv_index()
+        # Revalidate a stale disk cache with the ETag it was fetched with, so an
+        # unchanged index is neither downloaded nor re-parsed
+        etag_file = self.cache_dir / self.ETAG_CACHE_FILENAME
+        etag = None
+        if not force_refresh and index_file.exists():
+            etag = self._load_etag(etag_file)
+
+        matrices = await self._fetch_csv_index_if_modified(etag)
+        if matrices is None:
+            # 304 Not Modified: the stale disk cache is still current
+            matrices = self._load_index_from_disk(index_file)
+            if matrices is not None:
+                if index_file == cache_file:
+                    try:
+                        os.utime(index_file)
+                    except OSError:
+                        pass
+                    _remember_disk_index(index_file, matrices)
+                else:
+                    self._replace_disk_cache(matrices)
+            else:
+                # Disk cache became unreadable; fall back to a full fetch
+                matrices = await self._fetch_csv_index()
+                self._cache_fetched_index(matrices, etag_file)
+        else:
+            # Cache to disk
+            self._cache_fetched_index(matrices, etag_file)
 
-        # Cache to disk
-        self._save_index_to_disk(matrices, index_file)
+        self._set_index_cache(matrices, current_time)
+        return matrices
 
+    def _set_index_cache(
+        self, matrices: list[dict[str, Any]], cache_time: float
+    ) -> None:
+        """Store the index in memory, invalidating data derived from the old one."""
+        if matrices is not self._csv_index_cache:
+            self._groups_cache = None
         self._csv_index_cache = matrices
-        self._csv_index_cache_time = current_time
-        return matrices
+        self._csv_index_cache_time = cache_time
 
     async def _fetch_csv_index(self) -> list[dict[str, Any]]:
-        """Fetch and parse CSV index from remote."""
+        """Fetch and parse CSV index from remote.
+
+        Returns:
+            List of matrix metadata dictionaries
+        """
+        response = await self._request_csv_index()
+        return self._parse_csv_response(response)
+
+    async def _fetch_csv_index_if_modified(
+        self, etag: str | None
+    ) -> list[dict[str, Any]] | None:
+        """Fetch and parse CSV index from remote unless it matches ``etag``.
+
+        Args:
+            etag: ETag of the cached index. If given, the request is made
+                  conditional; otherwise the index is always fetched.
+
+        Returns:
+            List of matrix metadata dictionaries, or None if the server
+            reported that the index matching ``etag`` is not modified
+        """
+        if not etag:
+            return await self._fetch_csv_index()
+
+        response = await self._request_csv_index({"If-None-Match": etag})
+        if response.status_code == 304:
+            return None
+        return self._parse_csv_response(response)
+
+    async def _request_csv_index(
+        self, headers: dict[str, str] | None = None
+    ) -> httpx.Response:
+        """Request the CSV index, recording its ETag in ``self._index_etag``.
+
+        Args:
+            headers: Extra request headers, e.g. for a conditional request
+
+        Returns:
+            Successful or 304 Not Modified response
+        """
+        self._index_etag = None
         try:
-            async with httpx.AsyncClient(**Config.get_http_client_config()) as client:
-                response = await client.get(Config.CSV_INDEX_URL)
-                response.raise_for_status()
-                csv_content = response.text
+            client = self.http_client.get_client()
+            response = await client.get(Config.CSV_INDEX_URL, headers=headers)
+            if headers and response.status_code == 304:
+                return response
+            response.raise_for_status()
+            self._index_etag = response.headers.get("etag")
+            return response
         except (httpx.TimeoutException, httpx.ConnectError, httpx.HTTPStatusError) as e:
             from .exceptions import NetworkError
 
@@ -126,6 +263,15 @@ class IndexManager:
 
             raise IndexError(f"Error fetching CSV index: {e}") from e
 
+    def _parse_csv_response(self, response: httpx.Response) -> list[dict[str, Any]]:
+        """Parse a CSV index response into matrix dictionaries."""
+        try:
+            csv_content = response.text
+        except Exception as e:
+            from .exceptions import IndexError
+
+            raise IndexError(f"Error fetching CSV index: {e}") from e
+
         try:
             return self._parse_csv_content(csv_content)
         except Exception as e:
@@ -136,16 +282,13 @@ class IndexManager:
     def _parse_csv_content(self, csv_content: str) -> list[dict[str, Any]]:
         """Parse CSV content into matrix dictionaries."""
         matrices = []
-        lines = csv_content.strip().split("\n")
+        # csv.reader tokenizes the whole body in C instead of splitting each
+        # line in Python; it also handles CRLF line endings.
+        reader = csv.reader(io.StringIO(csv_content.strip()))
 
         # Skip first two lines (count and date)
-        data_lines = lines[2:]
-
-        for index, line in enumerate(data_lines):
-            if not line.strip():
-                continue
-
-            matrix_info = self._parse_csv_line(line)
+        for index, parts in enumerate(islice(reader, 2, None)):
+            matrix_info = self._parse_csv_row(parts)
             if matrix_info:
                 # Add matrix ID based on position (1-indexed)
                 matrix_info["matrix_id"] = index + 1
@@ -155,61 +298,51 @@ class IndexManager:
 
     def _parse_csv_line(self, line: str) -> dict[str, Any] | None:
         """Parse a single CSV line into matrix info."""
-        parts = line.split(",")
+        return self._parse_csv_row(next(csv.reader([line]), []))
+
+    def _parse_csv_row(self, parts: list[str]) -> dict[str, Any] | None:
+        """Parse the fields of a single CSV row into matrix info."""
         if len(parts) < 12:
             return None
 
         try:
-            # Parse based on official UFstats.csv format
+            # Parse based on official UFstats.csv format. Each field is
+            # converted once into a local and the dictionary is built in one go.
+            rows = int(parts[2])
+            cols = int(parts[3])
+            nnz = int(parts[4])
+            real = bool(int(parts[5]))
+            posdef = bool(int(parts[8]))
+            numerical_sym = float(parts[10])
+            # Consider matrices with >99% numerical symmetry as symmetric
+            symmetric = numerical_sym >= 0.99
+
             matrix_info = {
-                "group": parts[0],
+                "group": sys.intern(parts[0]),
                 "name": parts[1],
-                "rows": int(parts[2]),
-                "cols": int(parts[3]),
-                "nnz": int(parts[4]),
-                "real": bool(int(parts[5])),  # isReal: 1=real, 0=complex
+                "rows": rows,
+                "cols": cols,
+                "nnz": nnz,
+                "real": real,  # isReal: 1=real, 0=complex
                 "binary": bool(int(parts[6])),  # isBinary: 1=binary, 0=not
-                "complex": not bool(int(parts[5])),  # If not real, assume complex
+                "complex": not real,  # If not real, assume complex
                 "2d_3d": bool(int(parts[7])),  # isND: 1=2D/3D discretization
-                "posdef": bool(int(parts[8])),  # posdef: 1=positive definite, 0=not
+                "posdef": posdef,  # posdef: 1=positive definite, 0=not
                 "pattern_symmetry": float(parts[9]),  # Pattern symmetry (0-1)
-                "numerical_symmetry": float(parts[10]),  # Numerical symmetry (0-1)
-                "kind": parts[11] if len(parts) > 11 else "",
-                "pattern_entries": int(parts[12])
-                if len(parts) > 12
-                else int(
-                    parts[4]
-                ),  # number of zero (and explicit zero) entries in the sparse matrix
+                "numerical_symmetry": numerical_sym,  # Numerical symmetry (0-1)
+                "kind": sys.intern(parts[11]),
+                # number of zero (and explicit zero) entries in the sparse matrix
+                "pattern_entries": int(parts[12]) if len(parts) > 12 else nnz,
+                "symmetric": symmetric,
+                # SPD: symmetric AND positive definite AND real AND square
+                "spd": symmetric and posdef and real and rows == cols,
+                # Derived fields for compatibility
+                "num_rows": rows,
+                "num_cols": cols,
+                "nonzeros": nnz,
             }
-
-            # Derive symmetric flag from numerical_symmetry
-            # Consider matrices with >99% numerical symmetry as symmetric
-            numerical_sym = matrix_info["numerical_symmetry"]
-            matrix_info["symmetric"] = (
-                isinstance(numerical_sym, int | float) and numerical_sym >= 0.99
-            )
-
-            # Calculate SPD (Symmetric Positive Definite): symmetric AND positive definite AND real AND square
-            is_square = matrix_info["rows"] == matrix_info["cols"]
-            matrix_info["spd"] = (
-                matrix_info["symmetric"]
-                and matrix_info["posdef"]
-                and matrix_info["real"]
-                and is_square
-            )
-
-            # Add derived fields for compatibility
-            matrix_info.update(
-                {
-                    "num_rows": matrix_info["rows"],
-                    "num_cols": matrix_info["cols"],
-                    "nonzeros": matrix_info["nnz"],
-                    "field": self._get_field_type(matrix_info),
-                    "structure": "symmetric"
-                    if matrix_info["symmetric"]
-                    else "unsymmetric",
-                }
-            )
+            matrix_info["field"] = self._get_field_type(matrix_info)
+            matrix_info["structure"] = "symmetric" if symmetric else "unsymmetric"
 
             return matrix_info
 
@@ -225,27 +358,123 @@ class IndexManager:
         else:
             return "complex"
 
+    def _cache_fetched_index(
+        self, matrices: list[dict[str, Any]], etag_file: Path
+    ) -> None:
+        """Save a freshly fetched index to disk together with its ETag."""
+        if self._replace_disk_cache(matrices):
+            self._save_etag(self._index_etag, etag_file)
+        else:
+            # The ETag must never describe an older file left on disk, or a
+            # 304 would keep that stale index alive indefinitely
+            self._save_etag(None, etag_file)
+
+    def _replace_disk_cache(self, matrices: list[dict[str, Any]]) -> bool:
+        """Save the index to the disk cache and drop any legacy cache file.
+
+        Returns:
+            True if the disk cache was written
+        """
+        cache_file = self.cache_dir / self.INDEX_CACHE_FILENAME
+        if not self._save_index_to_disk(matrices, cache_file):
+            return False
+        _remember_disk_index(cache_file, matrices)
+        try:
+            (self.cache_dir / self.LEGACY_INDEX_CACHE_FILENAME).unlink(missing_ok=True)
+        except OSError:
+            pass
+        return True
+
     def _save_index_to_disk(
         self, matrices: list[dict[str, Any]], index_file: Path
-    ) -> None:
-        """Save index to disk cache."""
+    ) -> bool:
+        """Save index to disk cache, gzip-compressed if the file ends in .gz.
+
+        Returns:
+            True if the cache file was written, False if writing failed
+        """
+        if orjson is not None:
+            data = orjson.dumps(matrices)
+        else:
+            data = json.dumps(matrices, separators=(",", ":")).encode("utf-8")
+        if index_file.suffix == ".gz":
+            # Level 1 already removes most of the repeated keys at a fraction
+            # of the cost of higher levels
+            data = gzip.compress(data, compresslevel=1)
+        temp_file = index_file.with_name(index_file.name + ".tmp")
         try:
-            with open(index_file, "w", encoding="utf-8") as f:
-                json.dump(matrices, f, indent=2)
+            temp_file.write_bytes(data)
+            # Atomic, so an interrupted write never leaves a torn cache file
+            temp_file.replace(index_file)
+        except OSError:
+            # Cache write failure is not critical
+            try:
+                temp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return False
+        return True
+
+    def _load_index_from_disk(self, index_file: Path) -> list[dict[str, Any]] | None:
+        """Load index from disk cache, ignoring its age.
+
+        Returns:
+            Cached matrix list, or None if the cache is missing or invalid
+        """
+        try:
+            data = index_file.read_bytes()
+            if index_file.suffix == ".gz":
+                data = gzip.decompress(data)
+            # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+            cached_data = orjson.loads(data) if orjson is not None else json.loads(data)
+        except (ValueError, OSError, EOFError):
+            # ValueError covers JSON and UTF-8 decoding errors, OSError
+            # covers read errors and corrupt gzip data
+            return None
+        if not isinstance(cached_data, list):
+            return None
+
+        # JSON decoding allocates a new string per value; share the few
+        # distinct group/kind/field/structure values across all matrices.
+        for matrix in cached_data:
+            if isinstance(matrix, dict):
+                for key in _INTERNED_FIELDS:
+                    value = matrix.get(key)
+                    if isinstance(value, str):
+                        matrix[key] = sys.intern(value)
+        return cached_data
+
+    def _load_etag(self, etag_file: Path) -> str | None:
+        """Load the ETag of the disk cached index."""
+        try:
+            return etag_file.read_text(encoding="utf-8").strip() or None
+        except OSError:
+            return None
+
+    def _save_etag(self, etag: str | None, etag_file: Path) -> None:
+        """Save (or clear) the ETag of the disk cached index."""
+        try:
+            if etag:
+                etag_file.write_text(etag, encoding="utf-8")
+            else:
+                etag_file.unlink(missing_ok=True)
         except OSError:
             pass  # Cache write failure is not critical
 
-    async def get_groups(self) -> set[str]:
+    async def get_groups(self) -> frozenset[str]:
         """Get all available groups from the index.
 
+        The set is computed once and reused until the index is refreshed. It
+        is immutable so the cached object can be handed out directly.
+
         Returns:
-            Set of group names
+            Frozen set of group names
         """
         if self._groups_cache is not None:
             return self._groups_cache
 
         matrices = await self.get_index()
-        groups = {matrix["group"] for matrix in matrices}
+        groups = frozenset(matrix["group"] for matrix in matrices)
         self._groups_cache = groups
         return groups
 
@@ -259,12 +488,16 @@ class IndexManager:
             Matrix info dictionary if found, None otherwise
         """
         matrices = await self.get_index()
-
-        for matrix in matrices:
-            if matrix["name"] == name:
-                return matrix
-
-        return None
+        if matrices is not self._name_index_source:
+            # Built once per index list; the first matrix with a name wins
+            name_index: dict[Any, int] = {}
+            for i, matrix in enumerate(matrices):
+                name_index.setdefault(matrix["name"], i)
+            self._name_index = name_index
+            self._name_index_source = matrices
+
+        row = self._name_index.get(name)
+        return None if row is None else matrices[row]
 
     async def find_matrix_group(self, name: str) -> str | None:
         """Find the group for a matrix by name.
@@ -0,0 +1,278 @@
+"""In-memory lookup structures for searching the matrix index.
+
+The SearchIndex is built once from the list returned by
+``IndexManager.get_index()`` and reused for every query against that list, so
+repeated searches do not have to re-derive the same data from every matrix.
+
+It keeps:
+- An inverted index from each lowercased categorical value (group, name,
+  field, kind, structure) to the rows holding it, so partial-match terms are
+  compared against each distinct value once per query
+- One bitmask per row for the boolean criteria (spd, posdef, square), so any
+  combination of them is a single bit test per row, memoized per combination
+- Row indices sorted by number of rows, columns and nonzeros, so range
+  criteria become two binary searches and only the most selective range
+  has to be turned into a candidate set. Rows whose value cannot be ordered
+  (NaN, non-numeric) are kept aside and always left to Filter.matches.
+- Number of rows, columns and nonzeros as per-field columns (struct of
+  arrays), so range checks on candidates need no dictionary lookups
+
+Filters using only these criteria are answered exactly by the index. For
+any other filter, Filter.matches is still applied to the narrowed
+candidates, so results are identical to a full scan.
+
+Example:
+    >>> from ssdownload.filters import Filter
+    >>> from ssdownload.search_index import SearchIndex
+    >>>
+    >>> search_index = SearchIndex(matrices)
+    >>> search_index.could_match(Filter(name="does_not_exist"))
+    False
+    >>> rows = search_index.candidates(Filter(group="HB", n_rows=(None, 100)))
+"""
+
+import dataclasses
+import math
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+from .filters import Filter, _get_cols, _get_nnz, _get_rows
+
+# Filter attributes backed by the inverted index, with the matrix key they match
+_CATEGORICAL_FIELDS = ("group", "name", "field", "kind", "structure")
+
+# Filter boolean attributes backed by the row bitmasks, with the bits a row
+# carries when it matches the attribute set to True and to False
+_FLAG_SPD, _FLAG_NOT_SPD = 1, 2
+_FLAG_POSDEF, _FLAG_NOT_POSDEF = 4, 8
+_FLAG_SQUARE, _FLAG_RECTANGULAR = 16, 32
+_FLAG_CRITERIA = {
+    "spd": (_FLAG_SPD, _FLAG_NOT_SPD),
+    "posdef": (_FLAG_POSDEF, _FLAG_NOT_POSDEF),
+    "square": (_FLAG_SQUARE, _FLAG_RECTANGULAR),
+}
+
+# Filter range attributes backed by sorted row indices
+_RANGE_GETTERS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "n_rows": _get_rows,
+    "n_cols": _get_cols,
+    "nnz": _get_nnz,
+}
+
+# Filter attributes the index answers exactly
+_INDEXED_CRITERIA = frozenset((*_CATEGORICAL_FIELDS, *_FLAG_CRITERIA, *_RANGE_GETTERS))
+
+
+class SearchIndex:
+    """Precomputed lookups over a parsed matrix index."""
+
+    def __init__(self, matrices: list[dict[str, Any]]):
+        """Build lookup structures for the given matrices.
+
+        Args:
+            matrices: Matrix metadata dictionaries as returned by IndexManager
+        """
+        self.matrices = matrices
+
+        # Inverted index: field -> lowercased value -> row indices
+        self._inverted: dict[str, dict[str, set[int]]] = {
+            key: defaultdict(set) for key in _CATEGORICAL_FIELDS
+        }
+        # Boolean criteria packed into one int per row (see _FLAG_CRITERIA)
+        self._flags: list[int] = []
+        self._flag_rows: dict[int, set[int]] = {}
+        # Values Filter.matches would treat differently from the index (e.g.
+        # a non-string group) make the index inexact; matches() then decides.
+        self._exact = True
+        for i, matrix in enumerate(matrices):
+            for key in _CATEGORICAL_FIELDS:
+                value = matrix.get(key)
+                if isinstance(value, str):
+                    self._inverted[key][value.lower()].add(i)
+                elif value is not None:
+                    self._exact = False
+            self._flags.append(self._row_flags(matrix))
+
+        # Lowercased, newline-joined names allow a single substring scan to
+        # prove that a name/group term cannot match any matrix.
+        self._group_text = "\n".join(self._inverted["group"])
+        self._name_text = "\n".join(self._inverted["name"])
+
+        # Range columns: one value per row, None where missing or unusable
+        self._columns: dict[str, list[int | float | None]] = {}
+        # Range indices: row indices sorted by value, plus the sorted values
+        self._sorted_rows: dict[str, list[int]] = {}
+        self._sorted_keys: dict[str, list[int | float]] = {}
+        # Rows with a value that cannot be ordered, e.g. NaN, which
+        # Filter.matches may still accept; they are candidates for any range
+        self._unordered_rows: dict[str, set[int]] = {}
+        for attr, getter in _RANGE_GETTERS.items():
+            column: list[int | float | None] = []
+            unordered: set[int] = set()
+            for i, matrix in enumerate(matrices):
+                value = getter(matrix)
+                if not isinstance(value, int | float) or (
+                    isinstance(value, float) and math.isnan(value)
+                ):
+                    if value is not None:
+                        self._exact = False
+                        unordered.add(i)
+                    value = None
+                column.append(value)
+            self._unordered_rows[attr] = unordered
+            values = sorted(
+                (value, i) for i, value in enumerate(column) if value is not None
+            )
+            self._columns[attr] = column
+            self._sorted_keys[attr] = [value for value, _ in values]
+            self._sorted_rows[attr] = [i for _, i in values]
+
+    def could_match(self, filter_obj: Filter) -> bool:
+        """Check whether any matrix could satisfy the filter's group/name terms.
+
+        Args:
+            filter_obj: Filter criteria
+
+        Returns:
+            False if the filter's group or name term occurs in no matrix,
+            True otherwise (the full filter still has to be evaluated)
+        """
+        if filter_obj.group is not None:
+            if filter_obj.group.lower() not in self._group_text:
+                return False
+
+        if filter_obj.name is not None:
+            if filter_obj.name.lower() not in self._name_text:
+                return False
+
+        return True
+
+    def candidates(self, filter_obj: Filter) -> list[int] | None:
+        """Narrow the rows that may match a filter using the indices.
+
+        Args:
+            filter_obj: Filter criteria
+
+        Returns:
+            Sorted row indices that may match (a superset of the real
+            matches, exact when ``is_exact`` holds), or None if the filter
+            has no indexed criteria
+        """
+        row_sets: list[set[int]] = []
+
+        for key in _CATEGORICAL_FIELDS:
+            term = getattr(filter_obj, key)
+            # An empty term matches every matrix, including ones missing the key
+            if term:
+                row_sets.append(self._rows_containing(key, term))
+
+        mask = 0
+        for attr, (true_flag, false_flag) in _FLAG_CRITERIA.items():
+            value = getattr(filter_obj, attr)
+            if value is not None:
+                mask |= true_flag if value else false_flag
+        if mask:
+            row_sets.append(self._rows_with_flags(mask))
+
+        # Binary search sizes every range in O(log n). Only the most selective
+        # range becomes a set; the others are checked against the columns.
+        range_slices = [
+            (attr, range_filter, *self._range_bounds(attr, range_filter))
+            for attr in _RANGE_GETTERS
+            if (range_filter := getattr(filter_obj, attr)) is not None
+        ]
+        range_slices.sort(key=lambda s: s[3] - s[2])
+        if range_slices:
+            attr, _, start, stop = range_slices[0]
+            row_sets.append(
+                set(self._sorted_rows[attr][start:stop]) | self._unordered_rows[attr]
+            )
+
+        if not row_sets:
+            return None
+
+        # Start from the smallest set so intersection cost is bounded by it
+        # rather than by the largest (often the "matches everything") set.
+        row_sets.sort(key=len)
+        smallest = row_sets[0]
+        if not smallest:
+            return []
+        rows = sorted(smallest.intersection(*row_sets[1:]))
+
+        for attr, (min_val, max_val), _, _ in range_slices[1:]:
+            column = self._columns[attr]
+            unordered = self._unordered_rows[attr]
+            rows = [
+                i
+                for i in rows
+                if i in unordered
+                or (
+                    (value := column[i]) is not None
+                    and (min_val is None or value >= min_val)
+                    and (max_val is None or value <= max_val)
+                )
+            ]
+        return rows
+
+    def is_exact(self, filter_obj: Filter) -> bool:
+        """Check whether ``candidates`` gives exactly the matches of a filter.
+
+        Args:
+            filter_obj: Filter criteria
+
+        Returns:
+            True if every criterion set on the filter is answered by the
+            index, so Filter.matches need not be applied to the candidates
+        """
+        return self._exact and all(
+            getattr(filter_obj, f.name) is None
+            for f in dataclasses.fields(filter_obj)
+            if f.init and f.name not in _INDEXED_CRITERIA
+        )
+
+    @staticmethod
+    def _row_flags(matrix: dict[str, Any]) -> int:
+        """Compute the boolean-criteria bitmask of one matrix, as matches() would."""
+        flags = _FLAG_SPD if matrix.get("spd", False) else _FLAG_NOT_SPD
+
+        # Filter.matches compares posdef with ==, so a missing value matches
+        # neither True nor False
+        posdef = matrix.get("posdef")
+        for value, flag in ((True, _FLAG_POSDEF), (False, _FLAG_NOT_POSDEF)):
+            if posdef == value:
+                flags |= flag
+
+        rows = _get_rows(matrix)
+        cols = _get_cols(matrix)
+        if rows is not None and cols is not None:
+            flags |= _FLAG_SQUARE if rows == cols else _FLAG_RECTANGULAR
+        return flags
+
+    def _rows_with_flags(self, mask: int) -> set[int]:
+        """Get rows carrying every bit of ``mask``, memoized per mask."""
+        rows = self._flag_rows.get(mask)
+        if rows is None:
+            rows = {i for i, flags in enumerate(self._flags) if flags & mask == mask}
+            self._flag_rows[mask] = rows
+        return rows
+
+    def _rows_containing(self, key: str, term: str) -> set[int]:
+        """Get rows whose ``key`` value contains ``term`` (case-insensitive)."""
+        needle = term.lower()
+        rows: set[int] = set()
+        for value, value_rows in self._inverted[key].items():
+            if needle in value:
+                rows |= value_rows
+        return rows
+
+    def _range_bounds(
+        self, attr: str, range_filter: tuple[int | None, int | None]
+    ) -> tuple[int, int]:
+        """Get the slice of ``_sorted_rows[attr]`` within an inclusive range."""
+        keys = self._sorted_keys[attr]
+        min_val, max_val = range_filter
+        start = 0 if min_val is None else bisect_left(keys, min_val)
+        stop = len(keys) if max_val is None else bisect_right(keys, max_val)
+        return start, stop
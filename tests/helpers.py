@@ -1,5 +1,7 @@
 """Shared test helpers."""
 
+from typing import Any
+
 from click import unstyle
 from click.testing import Result
 
@@ -7,3 +9,27 @@ from click.testing import Result
 def plain_output(result: Result) -> str:
     """Return CLI output without ANSI styling."""
     return unstyle(result.stdout)
+
+
+class FakeAsyncClient:
+    """Stand-in for ``httpx.AsyncClient`` with the given request methods.
+
+    Use it as the return value of a patched ``httpx.AsyncClient`` when a test
+    needs to count client constructions; otherwise prefer a real client over
+    ``httpx.MockTransport``.
+    """
+
+    is_closed = False
+
+    def __init__(self, get: Any = None, stream: Any = None):
+        self.get = get
+        self.stream = stream
+
+    async def __aenter__(self) -> "FakeAsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    async def aclose(self) -> None:
+        return None
@@ -0,0 +1,29 @@
+"""Shared fixtures for integration tests."""
+
+import asyncio
+
+import pytest
+
+from ssdownload.client import SuiteSparseDownloader
+
+
+@pytest.fixture(scope="session")
+def warm_downloader():
+    """Downloader whose index and group set are fetched once per session.
+
+    Priming runs on its own event loop; the HTTP client is closed afterwards
+    and recreated lazily on whichever loop a test runs in.
+    """
+    downloader = SuiteSparseDownloader()
+
+    async def prime():
+        try:
+            await downloader.index_manager.get_index()
+            await downloader._get_available_groups()
+        except Exception as e:
+            pytest.skip(f"API not available: {e}")
+        finally:
+            await downloader.aclose()
+
+    asyncio.run(prime())
+    return downloader
@@ -80,7 +80,7 @@ class TestAPIIntegration:
         # Get available groups
         groups = await downloader._get_available_groups()
         assert len(groups) > 0
-        assert isinstance(groups, set | list)
+        assert isinstance(groups, frozenset)
 
         # Test finding a specific matrix by name
         if "HB" in groups:
@@ -327,6 +327,7 @@ class TestAPIRealDownload:
             filter_obj=filter_obj,
             format_type="mat",
             max_files=2,  # Download only 2 files
+            smallest_first=True,
         )
 
         assert len(downloaded_paths) <= 2
@@ -6,7 +6,6 @@ from pathlib import Path
 
 import pytest
 
-from ssdownload.client import SuiteSparseDownloader
 from ssdownload.filters import Filter
 
 
@@ -21,9 +20,9 @@ class TestRealAPIIntegration:
         with tempfile.TemporaryDirectory() as temp_dir:
             yield Path(temp_dir)
 
-    async def test_real_matrix_search(self):
+    async def test_real_matrix_search(self, warm_downloader):
         """Test actual matrix search with real API."""
-        downloader = SuiteSparseDownloader()
+        downloader = warm_downloader
 
         # Search for small matrices to keep test fast
         filter_obj = Filter(n_rows=(None, 100))  # Very small matrices
@@ -46,9 +45,9 @@ class TestRealAPIIntegration:
             if rows:
                 assert rows <= 100
 
-    async def test_real_matrix_info_retrieval(self):
+    async def test_real_matrix_info_retrieval(self, warm_downloader):
         """Test retrieving info for a known matrix."""
-        downloader = SuiteSparseDownloader()
+        downloader = warm_downloader
 
         # Use a well-known small matrix from HB collection
         try:
@@ -72,15 +71,15 @@ class TestRealAPIIntegration:
         except Exception as e:
             pytest.skip(f"API not available: {e}")
 
-    async def test_real_group_listing(self):
+    async def test_real_group_listing(self, warm_downloader):
         """Test listing real matrix groups."""
-        downloader = SuiteSparseDownloader()
+        downloader = warm_downloader
 
         try:
             # Get actual groups from the API
             groups = await downloader.get_available_groups()
 
-            assert isinstance(groups, set)
+            assert isinstance(groups, frozenset)
             assert len(groups) > 0
 
             # Known groups that should exist
@@ -91,9 +90,9 @@ class TestRealAPIIntegration:
         except Exception as e:
             pytest.skip(f"API not available: {e}")
 
-    async def test_real_spd_filter(self):
+    async def test_real_spd_filter(self, warm_downloader):
         """Test SPD filtering with real data."""
-        downloader = SuiteSparseDownloader()
+        downloader = warm_downloader
 
         try:
             # Get SPD matrices
@@ -111,9 +110,9 @@ class TestRealAPIIntegration:
         except Exception as e:
             pytest.skip(f"API not available: {e}")
 
-    async def test_real_field_filter(self):
+    async def test_real_field_filter(self, warm_downloader):
         """Test field type filtering with real data."""
-        downloader = SuiteSparseDownloader()
+        downloader = warm_downloader
 
         try:
             # Test real field filter
@@ -126,9 +125,9 @@ class TestRealAPIIntegration:
         except Exception as e:
             pytest.skip(f"API not available: {e}")
 
-    async def test_real_size_filter(self):
+    async def test_real_size_filter(self, warm_downloader):
         """Test size filtering with real data."""
-        downloader = SuiteSparseDownloader()
+        downloader = warm_downloader
 
         try:
             # Test size range filter
@@ -147,9 +146,9 @@ class TestRealAPIIntegration:
         except Exception as e:
             pytest.skip(f"API not available: {e}")
 
-    def test_matrix_not_found_error(self):
+    def test_matrix_not_found_error(self, warm_downloader):
         """Test error handling for non-existent matrices."""
-        downloader = SuiteSparseDownloader()
+        downloader = warm_downloader
 
         # Try to search for a matrix that definitely doesn't exist
         non_existent_filter = Filter(name="this_matrix_definitely_does_not_exist_12345")
@@ -159,9 +158,9 @@ class TestRealAPIIntegration:
         assert matrices == []
         assert total == 0
 
-    async def test_concurrent_requests(self):
+    async def test_concurrent_requests(self, warm_downloader):
         """Test that concurrent API requests work correctly."""
-        downloader = SuiteSparseDownloader()
+        downloader = warm_downloader
 
         try:
             # Create multiple concurrent requests
@@ -184,9 +183,9 @@ class TestRealAPIIntegration:
         except Exception as e:
             pytest.skip(f"Concurrent API calls not supported: {e}")
 
-    async def test_api_response_consistency(self):
+    async def test_api_response_consistency(self, warm_downloader):
         """Test that API responses are consistent across calls."""
-        downloader = SuiteSparseDownloader()
+        downloader = warm_downloader
 
         try:
             # Make the same request twice
@@ -207,9 +206,9 @@ class TestRealAPIIntegration:
         except Exception as e:
             pytest.skip(f"API consistency test failed: {e}")
 
-    async def test_api_data_quality(self):
+    async def test_api_data_quality(self, warm_downloader):
         """Test that API returns well-formed data."""
-        downloader = SuiteSparseDownloader()
+        downloader = warm_downloader
 
         try:
             matrices, _ = downloader.list_matrices(Filter(), limit=10)
@@ -251,9 +250,9 @@ class TestRealAPIIntegration:
         except Exception as e:
             pytest.skip(f"API data quality test failed: {e}")
 
-    async def test_limit_parameter_effectiveness(self):
+    async def test_limit_parameter_effectiveness(self, warm_downloader):
         """Test that limit parameter actually works."""
-        downloader = SuiteSparseDownloader()
+        downloader = warm_downloader
 
         try:
             # Test different limits
@@ -0,0 +1,14 @@
+"""Hypothesis profiles for property-based tests.
+
+The filter and range-parsing logic is deterministic and small, so the default
+"fast" profile runs fewer examples without a per-example deadline. Set
+``HYPOTHESIS_PROFILE=thorough`` for a deeper run (e.g. nightly CI).
+"""
+
+import os
+
+from hypothesis import settings
+
+settings.register_profile("fast", max_examples=50, deadline=None)
+settings.register_profile("thorough", max_examples=500, deadline=None)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "fast"))
@@ -1,6 +1,6 @@
 """Property-based tests for filter functionality."""
 
-from hypothesis import assume, given
+from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from ssdownload.filters import Filter
@@ -11,11 +11,12 @@ class TestFilterProperties:
 
     @given(
         min_size=st.integers(1, 10000),
-        max_size=st.integers(1, 10000),
+        span=st.integers(0, 9999),
     )
-    def test_size_filter_range_properties(self, min_size, max_size):
+    def test_size_filter_range_properties(self, min_size, span):
         """Test that size filters maintain mathematical properties."""
-        assume(min_size <= max_size)
+        # Derive an ordered range instead of rejecting unordered draws
+        max_size = min(min_size + span, 10000)
 
         # Size is typically the max of rows and cols, so we test both dimensions
         filter_obj = Filter(n_rows=(min_size, max_size), n_cols=(min_size, max_size))
@@ -94,6 +95,8 @@ class TestFilterProperties:
         }
         assert not filter_obj.matches(matrix_bad_rows)
 
+    # The property holds for any pattern; a few dozen examples suffice
+    @settings(max_examples=25)
     @given(
         name_pattern=st.text(
             min_size=1,
@@ -1,16 +1,35 @@
 """Property-based tests for range parsing utilities."""
 
+from functools import lru_cache
+
 import pytest
 from hypothesis import assume, given
 from hypothesis import strategies as st
 
 from ssdownload.cli_utils import parse_range
 
+# Strategies shared by the tests below
+_LARGE_INT = st.integers(min_value=0, max_value=10**9)
+_NONNEG_INT = st.integers(min_value=0, max_value=10**6)
+_POS_INT = st.integers(min_value=1, max_value=10**6)
+_BASE = st.integers(min_value=1, max_value=999)
+_EXP = st.integers(min_value=0, max_value=6)
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_number_string(s: str) -> bool:
+    """Check if string represents a valid number that parse_range can handle."""
+    try:
+        float(s)
+        return True
+    except ValueError:
+        return False
+
 
 class TestRangeParsingProperties:
     """Test mathematical properties of range parsing."""
 
-    @given(value=st.integers(min_value=0, max_value=10**9))
+    @given(value=_LARGE_INT)
     def test_single_value_parsing(self, value):
         """Test that single values create proper ranges."""
         result = parse_range(str(value))
@@ -21,13 +40,11 @@ class TestRangeParsingProperties:
         # Property: Result should be a valid range
         assert result[0] <= result[1]
 
-    @given(
-        min_val=st.integers(min_value=0, max_value=10**6),
-        max_val=st.integers(min_value=0, max_value=10**6),
-    )
-    def test_range_parsing_properties(self, min_val, max_val):
+    @given(min_val=_NONNEG_INT, span=_NONNEG_INT)
+    def test_range_parsing_properties(self, min_val, span):
         """Test properties of range parsing."""
-        assume(min_val <= max_val)
+        # Derive an ordered range instead of rejecting unordered draws
+        max_val = min_val + span
 
         range_str = f"{min_val}:{max_val}"
         result = parse_range(range_str)
@@ -38,7 +55,7 @@ class TestRangeParsingProperties:
         # Property: Result should be ordered
         assert result[0] <= result[1]
 
-    @given(max_val=st.integers(min_value=1, max_value=10**6))
+    @given(max_val=_POS_INT)
     def test_open_start_range(self, max_val):
         """Test open start ranges."""
         range_str = f":{max_val}"
@@ -50,7 +67,7 @@ class TestRangeParsingProperties:
         # Property: Second element should be the specified max
         assert result[1] == max_val
 
-    @given(min_val=st.integers(min_value=0, max_value=10**6))
+    @given(min_val=_NONNEG_INT)
     def test_open_end_range(self, min_val):
         """Test open end ranges."""
         range_str = f"{min_val}:"
@@ -62,14 +79,10 @@ class TestRangeParsingProperties:
         # Property: First element should be the specified min
         assert result[0] == min_val
 
-    @given(
-        base=st.integers(min_value=1, max_value=999),
-        exp1=st.integers(min_value=0, max_value=6),
-        exp2=st.integers(min_value=0, max_value=6),
-    )
-    def test_scientific_notation_parsing(self, base, exp1, exp2):
+    @given(base=_BASE, exp1=_EXP, exp_span=_EXP)
+    def test_scientific_notation_parsing(self, base, exp1, exp_span):
         """Test scientific notation parsing properties."""
-        assume(exp1 <= exp2)  # Ensure proper ordering
+        exp2 = min(exp1 + exp_span, 6)  # Ensure proper ordering
 
         val1 = base * (10**exp1)
         val2 = base * (10**exp2)
@@ -123,7 +136,7 @@ class TestRangeParsingProperties:
 
     @given(
         invalid_input=st.text().filter(
-            lambda x: (x and ":" not in x and not _is_valid_number_string(x))
+            lambda x: x and ":" not in x and not _is_valid_number_string(x)
         )
     )
     def test_invalid_input_handling(self, invalid_input):
@@ -131,12 +144,3 @@ class TestRangeParsingProperties:
         # Property: Invalid inputs should raise ValueError
         with pytest.raises(ValueError):
             parse_range(invalid_input)
-
-
-def _is_valid_number_string(s: str) -> bool:
-    """Check if string represents a valid number that parse_range can handle."""
-    try:
-        float(s)
-        return True
-    except ValueError:
-        return False
@@ -0,0 +1,31 @@
+"""Shared fixtures for unit tests."""
+
+from functools import cache
+from typing import Any
+
+import pytest
+import typer
+from click.testing import CliRunner, Result
+
+
+@cache
+def _click_command(app: typer.Typer) -> Any:
+    """Convert a Typer app to its Click command once per test session."""
+    return typer.main.get_command(app)
+
+
+class TyperCliRunner(CliRunner):
+    """CLI runner for Typer apps that reuses the converted Click command.
+
+    ``typer.testing.CliRunner`` converts the app on every invoke, which
+    takes longer than running most commands under test.
+    """
+
+    def invoke(self, app: typer.Typer, *args: Any, **kwargs: Any) -> Result:
+        return super().invoke(_click_command(app), *args, **kwargs)
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """CLI runner shared by all tests; it keeps no state between invocations."""
+    return TyperCliRunner()
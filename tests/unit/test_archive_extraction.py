@@ -1,15 +1,47 @@
 """Tests for archive extraction functionality."""
 
+import hashlib
+import io
+import os
+import random
+import shutil
 import tarfile
-import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from ssdownload.config import Config
 from ssdownload.downloader import FileDownloader
 from ssdownload.exceptions import DownloadError
 
+SAMPLE_MATRIX = "%%MatrixMarket matrix coordinate real general\n5 5 3\n"
+
+
+@pytest.fixture(scope="session")
+def sample_targz(tmp_path_factory):
+    """Archive holding a single ``matrix.mtx``, built once per session."""
+    archive_path = tmp_path_factory.mktemp("sample") / "test.tar.gz"
+    matrix_file = archive_path.parent / "matrix.mtx"
+    matrix_file.write_text(SAMPLE_MATRIX)
+
+    with tarfile.open(archive_path, "w:gz", compresslevel=1) as tar:
+        tar.add(matrix_file, arcname="matrix.mtx")
+
+    matrix_file.unlink()
+    return archive_path
+
+
+def tar_with_member(name: str) -> io.BytesIO:
+    """Build an in-memory tar.gz archive holding one file called ``name``."""
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w:gz", compresslevel=1) as tar:
+        tarinfo = tarfile.TarInfo(name)
+        tarinfo.size = 4
+        tar.addfile(tarinfo, io.BytesIO(b"data"))
+    archive.seek(0)
+    return archive
+
 
 class TestArchiveExtraction:
     """Test archive extraction functionality."""
@@ -20,308 +52,345 @@ class TestArchiveExtraction:
         downloader = FileDownloader()
         assert downloader.extract_archives is True
         assert downloader.keep_archives is False
+        assert downloader.parallel_extract is True
 
         # Test custom values
-        downloader = FileDownloader(extract_archives=False, keep_archives=True)
+        downloader = FileDownloader(
+            extract_archives=False, keep_archives=True, parallel_extract=False
+        )
         assert downloader.extract_archives is False
         assert downloader.keep_archives is True
+        assert downloader.parallel_extract is False
 
-    def test_validate_tar_members_safe(self):
+    def test_validate_tar_members_safe(self, sample_targz):
         """Test tar member validation with safe paths."""
         downloader = FileDownloader()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create a safe test archive
-            archive_path = temp_path / "test.tar.gz"
-            test_file = temp_path / "test.mtx"
-            test_file.write_text("test matrix data")
-
-            with tarfile.open(archive_path, "w:gz") as tar:
-                tar.add(test_file, arcname="test.mtx")
-
-            # Validate should pass for safe archive
-            with tarfile.open(archive_path, "r:gz") as tar:
-                downloader._validate_tar_members(tar)  # Should not raise
+        # Validate should pass for safe archive
+        with tarfile.open(sample_targz, "r:gz") as tar:
+            downloader._validate_tar_members(tar)  # Should not raise
 
     def test_validate_tar_members_unsafe_absolute_path(self):
         """Test tar member validation rejects absolute paths."""
         downloader = FileDownloader()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create archive with absolute path using TarInfo directly
-            archive_path = temp_path / "unsafe.tar.gz"
-            test_file = temp_path / "test.mtx"
-            test_file.write_text("test matrix data")
-
-            with tarfile.open(archive_path, "w:gz") as tar:
-                # Create TarInfo with absolute path manually
-                tarinfo = tar.gettarinfo(test_file)
-                tarinfo.name = "/etc/passwd"  # Force absolute path
-                with open(test_file, "rb") as f:
-                    tar.addfile(tarinfo, f)
-
-            # Validation should fail
-            with tarfile.open(archive_path, "r:gz") as tar:
-                with pytest.raises(DownloadError, match="absolute path"):
-                    downloader._validate_tar_members(tar)
+        # Validation should fail
+        archive = tar_with_member("/etc/passwd")
+        with tarfile.open(fileobj=archive, mode="r:gz") as tar:
+            with pytest.raises(DownloadError, match="absolute path"):
+                downloader._validate_tar_members(tar)
 
     def test_validate_tar_members_unsafe_parent_reference(self):
         """Test tar member validation rejects parent directory references."""
         downloader = FileDownloader()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create archive with parent reference
-            archive_path = temp_path / "unsafe.tar.gz"
-            test_file = temp_path / "test.mtx"
-            test_file.write_text("test matrix data")
-
-            with tarfile.open(archive_path, "w:gz") as tar:
-                tar.add(test_file, arcname="../../../etc/passwd")  # Parent reference
-
-            # Validation should fail
-            with tarfile.open(archive_path, "r:gz") as tar:
-                with pytest.raises(DownloadError, match="parent reference"):
-                    downloader._validate_tar_members(tar)
-
-    def test_find_main_file_matrix_market(self):
-        """Test finding main file prioritizes .mtx files."""
+        # Validation should fail
+        archive = tar_with_member("../../../etc/passwd")
+        with tarfile.open(fileobj=archive, mode="r:gz") as tar:
+            with pytest.raises(DownloadError, match="parent reference"):
+                downloader._validate_tar_members(tar)
+
+    @pytest.mark.parametrize(
+        ("sizes", "expected"),
+        [
+            ({"readme.txt": 12, "matrix.mtx": 12, "other.dat": 12}, "matrix.mtx"),
+            ({"readme.txt": 12, "matrix.rua": 12, "other.dat": 12}, "matrix.rua"),
+            ({"small.txt": 5, "large.dat": 10_000_000}, "large.dat"),
+        ],
+        ids=["matrix_market", "rutherford_boeing", "largest_fallback"],
+    )
+    def test_find_main_file(self, tmp_path, sizes, expected):
+        """Test .mtx files are preferred, then .rua files, then the largest file."""
         downloader = FileDownloader()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create test files
-            files = [
-                temp_path / "readme.txt",
-                temp_path / "matrix.mtx",  # Should be selected
-                temp_path / "other.dat",
-            ]
+        files = [tmp_path / name for name in sizes]
+        for f in files:
+            f.touch()
+            os.truncate(f, sizes[f.name])  # Sparse, so no data is written
 
-            for f in files:
-                f.write_text("test content")
+        main_file = downloader._find_main_file(files)
+        assert main_file.name == expected
 
-            main_file = downloader._find_main_file(files)
-            assert main_file.name == "matrix.mtx"
-
-    def test_find_main_file_rutherford_boeing(self):
-        """Test finding main file prioritizes .rua files when no .mtx."""
+    async def test_extract_archive_success(self, tmp_path, sample_targz):
+        """Test successful archive extraction."""
         downloader = FileDownloader()
+        archive_path = shutil.copy(sample_targz, tmp_path / "test.tar.gz")
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create test files
-            files = [
-                temp_path / "readme.txt",
-                temp_path / "matrix.rua",  # Should be selected
-                temp_path / "other.dat",
-            ]
+        # Extract archive
+        extracted_path = await downloader._extract_archive(archive_path)
 
-            for f in files:
-                f.write_text("test content")
+        assert extracted_path.exists()
+        assert extracted_path.name == "matrix.mtx"
+        assert extracted_path.read_text() == SAMPLE_MATRIX
 
-            main_file = downloader._find_main_file(files)
-            assert main_file.name == "matrix.rua"
-
-    def test_find_main_file_largest_fallback(self):
-        """Test finding main file falls back to largest file."""
+    def test_find_main_file_uses_given_sizes(self):
+        """Test known sizes pick the largest file without touching the disk."""
         downloader = FileDownloader()
+        files = [Path("m/readme.txt"), Path("m/a.mtx"), Path("m/b.mtx")]
+        sizes = {files[0]: 900, files[1]: 10, files[2]: 20}
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create test files with different sizes
-            small_file = temp_path / "small.txt"
-            small_file.write_text("small")
+        assert downloader._find_main_file(files, sizes) == Path("m/b.mtx")
 
-            large_file = temp_path / "large.dat"
-            large_file.write_text("this is a much larger file content")
-
-            files = [small_file, large_file]
-
-            main_file = downloader._find_main_file(files)
-            assert main_file.name == "large.dat"
-
-    async def test_extract_archive_success(self):
-        """Test successful archive extraction."""
+    def test_find_main_file_ignores_suffix_case(self):
+        """Test upper-case and symmetric Rutherford Boeing suffixes are ranked."""
+        downloader = FileDownloader()
+        files = [Path("m/notes.txt"), Path("m/matrix.RSA"), Path("m/matrix.MTX")]
+        sizes = dict.fromkeys(files, 100)
+
+        assert downloader._find_main_file(files, sizes) == Path("m/matrix.MTX")
+        assert downloader._find_main_file(files[:2], sizes) == Path("m/matrix.RSA")
+
+    @pytest.mark.parametrize("parallel_extract", [True, False])
+    async def test_extract_archive_large_file(self, parallel_extract, tmp_path):
+        """Test a file spanning many read and copy buffers is extracted intact."""
+        downloader = FileDownloader(parallel_extract=parallel_extract)
+
+        archive_path = tmp_path / "large.tar.gz"
+        test_content = random.Random(0).randbytes(3 * 1024 * 1024 + 7)
+        matrix_file = tmp_path / "matrix.mtx"
+        matrix_file.write_bytes(test_content)
+
+        with tarfile.open(archive_path, "w:gz", compresslevel=1) as tar:
+            tar.add(matrix_file, arcname="large/large.mtx")
+        matrix_file.unlink()
+
+        with (
+            patch.object(Config, "EXTRACT_READ_SIZE", 64 * 1024),
+            patch.object(Config, "EXTRACT_COPY_SIZE", 256 * 1024),
+        ):
+            digests = {}
+            extracted_path = await downloader._extract_archive(archive_path, digests)
+
+        assert extracted_path == tmp_path / "large" / "large.mtx"
+        assert extracted_path.read_bytes() == test_content
+        assert digests == {extracted_path: hashlib.sha256(test_content).hexdigest()}
+
+    async def test_extract_archive_cleanup_on_error(self, tmp_path):
+        """Test cleanup of partially extracted files on error."""
         downloader = FileDownloader()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create test archive
-            archive_path = temp_path / "test.tar.gz"
-            test_content = "%%MatrixMarket matrix coordinate real general\n5 5 3\n"
-
-            # Create temporary file for archiving
-            matrix_file = temp_path / "matrix.mtx"
-            matrix_file.write_text(test_content)
-
-            with tarfile.open(archive_path, "w:gz") as tar:
-                tar.add(matrix_file, arcname="matrix.mtx")
-
-            # Remove original file so we can test extraction
-            matrix_file.unlink()
+        # Create corrupted archive
+        archive_path = tmp_path / "corrupted.tar.gz"
+        archive_path.write_text("not a valid tar.gz file")
 
-            # Extract archive
-            extracted_path = await downloader._extract_archive(archive_path)
+        # Extraction should fail and clean up
+        with pytest.raises(DownloadError):
+            await downloader._extract_archive(archive_path)
 
-            assert extracted_path.exists()
-            assert extracted_path.name == "matrix.mtx"
-            assert extracted_path.read_text() == test_content
+        # Verify no extracted files remain
+        extracted_files = list(tmp_path.glob("*.mtx"))
+        assert len(extracted_files) == 0
 
-    async def test_extract_archive_cleanup_on_error(self):
-        """Test cleanup of partially extracted files on error."""
+    async def test_extract_archive_rejects_unsafe_member_after_files(self, tmp_path):
+        """Test files extracted before an unsafe member are cleaned up."""
         downloader = FileDownloader()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        archive_path = tmp_path / "unsafe.tar.gz"
+        test_file = tmp_path / "source.mtx"
+        test_file.write_text("test matrix data")
 
-            # Create corrupted archive
-            archive_path = temp_path / "corrupted.tar.gz"
-            archive_path.write_text("not a valid tar.gz file")
+        with tarfile.open(archive_path, "w:gz", compresslevel=1) as tar:
+            tar.add(test_file, arcname="matrix/matrix.mtx")
+            tar.add(test_file, arcname="../escaped.mtx")
 
-            # Extraction should fail and clean up
-            with pytest.raises(DownloadError):
-                await downloader._extract_archive(archive_path)
+        with pytest.raises(DownloadError, match="parent reference"):
+            await downloader._extract_archive(archive_path)
 
-            # Verify no extracted files remain
-            extracted_files = list(temp_path.glob("*.mtx"))
-            assert len(extracted_files) == 0
+        assert not (tmp_path / "matrix" / "matrix.mtx").exists()
+        assert not (tmp_path.parent / "escaped.mtx").exists()
 
-    async def test_handle_extraction_keep_archive(self):
+    async def test_handle_extraction_keep_archive(self, tmp_path, sample_targz):
         """Test extraction with archive keeping enabled."""
         downloader = FileDownloader(keep_archives=True)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create test archive
-            archive_path = temp_path / "test.tar.gz"
-            matrix_file = temp_path / "matrix.mtx"
-            matrix_file.write_text("test matrix")
+        archive_path = shutil.copy(sample_targz, tmp_path / "test.tar.gz")
+        matrix_file = tmp_path / "matrix.mtx"
 
-            with tarfile.open(archive_path, "w:gz") as tar:
-                tar.add(matrix_file, arcname="matrix.mtx")
+        # Mock the extraction to avoid complexity
+        with patch.object(downloader, "_extract_archive", return_value=matrix_file):
+            matrix_file.write_text("test matrix")  # Stands in for the extracted file
 
-            matrix_file.unlink()  # Remove original
+            result = await downloader._handle_extraction(archive_path, "mm")
 
-            # Mock the extraction to avoid complexity
-            with patch.object(downloader, "_extract_archive", return_value=matrix_file):
-                matrix_file.write_text("test matrix")  # Recreate for test
+            # Archive should still exist
+            assert archive_path.exists()
+            assert result == matrix_file
 
-                result = await downloader._handle_extraction(archive_path, "mm")
-
-                # Archive should still exist
-                assert archive_path.exists()
-                assert result == matrix_file
-
-    async def test_handle_extraction_remove_archive(self):
+    async def test_handle_extraction_remove_archive(self, tmp_path, sample_targz):
         """Test extraction with archive removal (default)."""
         downloader = FileDownloader(keep_archives=False)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create test archive
-            archive_path = temp_path / "test.tar.gz"
-            matrix_file = temp_path / "matrix.mtx"
-            matrix_file.write_text("test matrix")
+        archive_path = shutil.copy(sample_targz, tmp_path / "test.tar.gz")
+        matrix_file = tmp_path / "matrix.mtx"
 
-            with tarfile.open(archive_path, "w:gz") as tar:
-                tar.add(matrix_file, arcname="matrix.mtx")
+        # Mock the extraction to avoid complexity
+        with patch.object(downloader, "_extract_archive", return_value=matrix_file):
+            matrix_file.write_text("test matrix")  # Stands in for the extracted file
 
-            matrix_file.unlink()  # Remove original
+            result = await downloader._handle_extraction(archive_path, "mm")
 
-            # Mock the extraction to avoid complexity
-            with patch.object(downloader, "_extract_archive", return_value=matrix_file):
-                matrix_file.write_text("test matrix")  # Recreate for test
+            # Archive should be removed
+            assert not archive_path.exists()
+            assert result == matrix_file
 
-                result = await downloader._handle_extraction(archive_path, "mm")
-
-                # Archive should be removed
-                assert not archive_path.exists()
-                assert result == matrix_file
-
-    async def test_download_file_with_extraction(self):
+    async def test_download_file_with_extraction(self, tmp_path):
         """Test download_file method with format_type triggering extraction."""
         downloader = FileDownloader(extract_archives=True, keep_archives=False)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            archive_path = temp_path / "test.tar.gz"
-            extracted_path = temp_path / "test.mtx"
+        archive_path = tmp_path / "test.tar.gz"
+        extracted_path = tmp_path / "test.mtx"
 
-            # Create temp file that will be renamed
-            temp_part_path = archive_path.with_suffix(archive_path.suffix + ".part")
+        # Create temp file that will be renamed
+        temp_part_path = archive_path.with_suffix(archive_path.suffix + ".part")
 
-            def mock_download_side_effect(*args, **kwargs):
-                # Create the .part file that download_with_resume would create
-                temp_part_path.write_text("test archive content")
+        def mock_download_side_effect(*args, **kwargs):
+            # Create the .part file that download_with_resume would create
+            temp_part_path.write_text("test archive content")
 
-            # Mock the download and extraction process
+        # Mock the download and extraction process
+        with patch.object(
+            downloader,
+            "_download_with_resume",
+            side_effect=mock_download_side_effect,
+        ) as mock_download:
             with patch.object(
-                downloader,
-                "_download_with_resume",
-                side_effect=mock_download_side_effect,
-            ) as mock_download:
-                with patch.object(
-                    downloader, "_handle_extraction", return_value=extracted_path
-                ) as mock_extract:
-                    result = await downloader.download_file(
-                        url="http://example.com/test.tar.gz",
-                        output_path=archive_path,
-                        format_type="mm",  # Should trigger extraction
-                    )
-
-                    # Should have called download
-                    mock_download.assert_called_once()
-
-                    # Should have called extraction for mm format
-                    mock_extract.assert_called_once_with(archive_path, "mm", None, None)
-
-                    # Should return extracted path
-                    assert result == extracted_path
-
-    async def test_download_file_no_extraction_for_mat(self):
-        """Test download_file method doesn't extract for MAT format."""
-        downloader = FileDownloader(extract_archives=True)
+                downloader, "_handle_extraction", return_value=extracted_path
+            ) as mock_extract:
+                result = await downloader.download_file(
+                    url="http://example.com/test.tar.gz",
+                    output_path=archive_path,
+                    format_type="mm",  # Should trigger extraction
+                )
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            mat_path = temp_path / "test.mat"
+                # Should have called download
+                mock_download.assert_called_once()
 
-            # Create temp file that will be renamed
-            temp_part_path = mat_path.with_suffix(mat_path.suffix + ".part")
+                # Should have called extraction for mm format
+                mock_extract.assert_called_once_with(archive_path, "mm", None, None)
 
-            def mock_download_side_effect(*args, **kwargs):
-                # Create the .part file that download_with_resume would create
-                temp_part_path.write_text("test matrix content")
+                # Should return extracted path
+                assert result == extracted_path
 
-            # Mock the download process
-            with patch.object(
-                downloader,
-                "_download_with_resume",
-                side_effect=mock_download_side_effect,
-            ) as mock_download:
-                with patch.object(downloader, "_handle_extraction") as mock_extract:
-                    result = await downloader.download_file(
-                        url="http://example.com/test.mat",
-                        output_path=mat_path,
-                        format_type="mat",  # Should NOT trigger extraction
-                    )
-
-                    # Should have called download
-                    mock_download.assert_called_once()
-
-                    # Should NOT have called extraction for mat format
-                    mock_extract.assert_not_called()
-
-                    # Should return original path
-                    assert result == mat_path
+    async def test_download_file_no_extraction_for_mat(self, tmp_path):
+        """Test download_file method doesn't extract for MAT format."""
+        downloader = FileDownloader(extract_archives=True)
+
+        mat_path = tmp_path / "test.mat"
+
+        # Create temp file that will be renamed
+        temp_part_path = mat_path.with_suffix(mat_path.suffix + ".part")
+
+        def mock_download_side_effect(*args, **kwargs):
+            # Create the .part file that download_with_resume would create
+            temp_part_path.write_text("test matrix content")
+
+        # Mock the download process
+        with patch.object(
+            downloader,
+            "_download_with_resume",
+            side_effect=mock_download_side_effect,
+        ) as mock_download:
+            with patch.object(downloader, "_handle_extraction") as mock_extract:
+                result = await downloader.download_file(
+                    url="http://example.com/test.mat",
+                    output_path=mat_path,
+                    format_type="mat",  # Should NOT trigger extraction
+                )
+
+                # Should have called download
+                mock_download.assert_called_once()
+
+                # Should NOT have called extraction for mat format
+                mock_extract.assert_not_called()
+
+                # Should return original path
+                assert result == mat_path
+
+    async def test_download_file_skips_completed_extraction(self, tmp_path):
+        """Test a previously extracted archive is neither downloaded nor extracted."""
+        downloader = FileDownloader(verify_checksums=True)
+
+        archive_path = tmp_path / "test.tar.gz"
+
+        # Build a SuiteSparse-style archive: test/test.mtx
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "test.mtx").write_text("%%MatrixMarket matrix\n")
+        with tarfile.open(archive_path, "w:gz", compresslevel=1) as tar:
+            tar.add(source_dir / "test.mtx", arcname="test/test.mtx")
+
+        extracted_path = await downloader._handle_extraction(archive_path, "mm")
+        assert extracted_path == tmp_path / "test" / "test.mtx"
+        assert not archive_path.exists()
+
+        with patch.object(downloader, "_download_with_resume") as mock_download:
+            result = await downloader.download_file(
+                url="http://example.com/test.tar.gz",
+                output_path=archive_path,
+                format_type="mm",
+            )
+
+            assert result == extracted_path
+            mock_download.assert_not_called()
+
+    async def test_find_extracted_file_rejects_modified_file(self, tmp_path):
+        """Test a modified extracted file fails verification against its marker."""
+        downloader = FileDownloader(verify_checksums=True)
+
+        archive_path = tmp_path / "test.tar.gz"
+        extracted_path = downloader._expected_extracted_path(archive_path, "mm")
+        extracted_path.parent.mkdir()
+        extracted_path.write_text("original")
+        downloader._write_extraction_marker(
+            extracted_path, hashlib.sha256(b"original").hexdigest()
+        )
+
+        assert await downloader._find_extracted_file(archive_path, "mm") == (
+            extracted_path
+        )
+
+        extracted_path.write_text("modified")
+        assert await downloader._find_extracted_file(archive_path, "mm") is None
+
+        # Without verification the marker alone marks the extraction complete
+        downloader.verify_checksums = False
+        assert await downloader._find_extracted_file(archive_path, "mm") == (
+            extracted_path
+        )
+
+    @pytest.mark.parametrize("verify_checksums", [True, False])
+    async def test_handle_extraction_hashes_while_extracting(
+        self, tmp_path, sample_targz, verify_checksums
+    ):
+        """Test the marker digest comes from extraction, never a second read."""
+        downloader = FileDownloader(verify_checksums=verify_checksums)
+        archive_path = shutil.copy(sample_targz, tmp_path / "test.tar.gz")
+
+        with patch.object(downloader, "_compute_digest") as mock_digest:
+            extracted_path = await downloader._handle_extraction(archive_path, "mm")
+
+        mock_digest.assert_not_called()
+        assert extracted_path.read_text() == SAMPLE_MATRIX
+        marker = extracted_path.with_name("matrix.mtx.sha256")
+        if verify_checksums:
+            expected = hashlib.sha256(SAMPLE_MATRIX.encode()).hexdigest()
+            assert marker.read_text() == f"{expected}  matrix.mtx\n"
+        else:
+            assert marker.read_text() == ""
+
+    async def test_find_extracted_file_unverifiable_marker(self, tmp_path):
+        """Test a marker without a digest only satisfies unverified lookups."""
+        downloader = FileDownloader(verify_checksums=False)
+
+        archive_path = tmp_path / "test.tar.gz"
+        extracted_path = downloader._expected_extracted_path(archive_path, "mm")
+        extracted_path.parent.mkdir()
+        extracted_path.write_text("original")
+        downloader._write_extraction_marker(extracted_path)
+
+        assert await downloader._find_extracted_file(archive_path, "mm") == (
+            extracted_path
+        )
+
+        downloader.verify_checksums = True
+        assert await downloader._find_extracted_file(archive_path, "mm") is None
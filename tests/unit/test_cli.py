@@ -4,7 +4,7 @@ import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from typer.testing import CliRunner
+import pytest
 
 from ssdownload import __version__
 from ssdownload.cli import app
@@ -15,58 +15,68 @@ from tests.helpers import plain_output
 class TestCLI:
     """Test CLI functionality."""
 
-    def setup_method(self):
-        """Set up test runner."""
-        self.runner = CliRunner()
-
-    def test_parse_range_single_value(self):
-        """Test parsing single value as range."""
-        result = parse_range("1000")
-        assert result == (1000, 1000)
-
-    def test_parse_range_full_range(self):
-        """Test parsing full range."""
-        result = parse_range("1000:5000")
-        assert result == (1000, 5000)
-
-    def test_parse_range_open_start(self):
-        """Test parsing range with open start."""
-        result = parse_range(":5000")
-        assert result == (None, 5000)
-
-    def test_parse_range_open_end(self):
-        """Test parsing range with open end."""
-        result = parse_range("1000:")
-        assert result == (1000, None)
-
-    def test_parse_range_scientific_notation(self):
-        """Test parsing range with scientific notation."""
-        result = parse_range("1e3:5e6")
-        assert result == (1000, 5000000)
-
-    def test_help_command(self):
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("1000", (1000, 1000)),
+            ("1000:5000", (1000, 5000)),
+            (":5000", (None, 5000)),
+            ("1000:", (1000, None)),
+            ("1e3:5e6", (1000, 5000000)),
+        ],
+        ids=[
+            "single_value",
+            "full_range",
+            "open_start",
+            "open_end",
+            "scientific_notation",
+        ],
+    )
+    def test_parse_range(self, value, expected):
+        """Test parsing range strings into (min, max) tuples."""
+        assert parse_range(value) == expected
+
+    def test_parse_range_invalid_bounds(self):
+        """Test invalid bounds are reported with the offending value."""
+        with pytest.raises(ValueError, match=r"Invalid max value: inf \(infinity"):
+            parse_range("10:inf")
+        with pytest.raises(ValueError, match="Invalid min value: abc"):
+            parse_range("abc:10")
+        with pytest.raises(ValueError, match="both min and max are empty"):
+            parse_range(":")
+
+    def test_parse_range_is_memoized(self):
+        """Test repeated range strings are served from the cache."""
+        parse_range.cache_clear()
+
+        assert parse_range("10:20") is parse_range("10:20")
+        assert parse_range.cache_info().hits == 1
+
+    def test_help_command(self, runner):
         """Test help command displays correctly."""
-        result = self.runner.invoke(app, ["--help"])
+        result = runner.invoke(app, ["--help"])
         assert result.exit_code == 0
         assert "Download sparse matrices" in result.stdout
 
-    def test_version_option(self):
+    def test_version_option(self, runner):
         """Test version option displays the package version."""
-        result = self.runner.invoke(app, ["--version"])
+        result = runner.invoke(app, ["--version"])
 
         assert result.exit_code == 0
         assert result.stdout == f"ssdl {__version__}\n"
 
-    def test_version_option_is_shown_in_help(self):
+    def test_version_option_is_shown_in_help(self, runner):
         """Test version option is listed in top-level help."""
-        result = self.runner.invoke(app, ["--help"], color=True)
+        result = runner.invoke(app, ["--help"], color=True)
 
         assert result.exit_code == 0
         assert "--version" in plain_output(result)
 
     @patch("ssdownload.cli.SuiteSparseDownloader")
     @patch("ssdownload.cli.asyncio.run")
-    def test_download_command_success(self, mock_asyncio_run, mock_downloader_class):
+    def test_download_command_success(
+        self, mock_asyncio_run, mock_downloader_class, runner
+    ):
         """Test successful single matrix download."""
         # Mock downloader instance
         mock_downloader = MagicMock()
@@ -76,7 +86,7 @@ class TestCLI:
         mock_path = Path("/fake/path/Boeing/ct20stif.mat")
         mock_asyncio_run.return_value = mock_path
 
-        result = self.runner.invoke(
+        result = runner.invoke(
             app, ["download", "Boeing/ct20stif", "--format", "mat", "--workers", "2"]
         )
 
@@ -98,25 +108,27 @@ class TestCLI:
 
     @patch("ssdownload.cli.SuiteSparseDownloader")
     @patch("ssdownload.cli.asyncio.run")
-    def test_download_command_error(self, mock_asyncio_run, mock_downloader_class):
+    def test_download_command_error(
+        self, mock_asyncio_run, mock_downloader_class, runner
+    ):
         """Test download command with error."""
         mock_downloader_class.return_value = MagicMock()
         mock_asyncio_run.side_effect = Exception("Download failed")
 
-        result = self.runner.invoke(app, ["download", "Boeing/ct20stif"])
+        result = runner.invoke(app, ["download", "Boeing/ct20stif"])
 
         assert result.exit_code == 1
         assert "Error:" in result.stdout
 
     @patch("ssdownload.cli.SuiteSparseDownloader")
     @patch("ssdownload.cli.asyncio.run")
-    def test_bulk_command_basic(self, mock_asyncio_run, mock_downloader_class):
+    def test_bulk_command_basic(self, mock_asyncio_run, mock_downloader_class, runner):
         """Test basic bulk download command."""
         mock_downloader = MagicMock()
         mock_downloader_class.return_value = mock_downloader
         mock_asyncio_run.return_value = [Path("/fake/path1"), Path("/fake/path2")]
 
-        result = self.runner.invoke(
+        result = runner.invoke(
             app, ["bulk", "--spd", "--format", "mm", "--max-files", "10"]
         )
 
@@ -131,12 +143,14 @@ class TestCLI:
 
     @patch("ssdownload.cli.SuiteSparseDownloader")
     @patch("ssdownload.cli.asyncio.run")
-    def test_bulk_command_with_filters(self, mock_asyncio_run, mock_downloader_class):
+    def test_bulk_command_with_filters(
+        self, mock_asyncio_run, mock_downloader_class, runner
+    ):
         """Test bulk command with various filters."""
         mock_downloader_class.return_value = MagicMock()
         mock_asyncio_run.return_value = []
 
-        result = self.runner.invoke(
+        result = runner.invoke(
             app,
             [
                 "bulk",
@@ -167,7 +181,7 @@ class TestCLI:
         )
 
     @patch("ssdownload.cli.SuiteSparseDownloader")
-    def test_list_command_basic(self, mock_downloader_class):
+    def test_list_command_basic(self, mock_downloader_class, runner):
         """Test basic list command."""
         # Mock matrices data
         mock_matrices = [
@@ -193,7 +207,7 @@ class TestCLI:
         mock_downloader.list_matrices.return_value = (mock_matrices, len(mock_matrices))
         mock_downloader_class.return_value = mock_downloader
 
-        result = self.runner.invoke(app, ["list", "--limit", "10"])
+        result = runner.invoke(app, ["list", "--limit", "10"])
 
         assert result.exit_code == 0
         assert "Boeing/ct20stif" in result.stdout
@@ -206,7 +220,7 @@ class TestCLI:
         )
 
     @patch("ssdownload.cli.SuiteSparseDownloader")
-    def test_list_command_verbose(self, mock_downloader_class):
+    def test_list_command_verbose(self, mock_downloader_class, runner):
         """Test list command with verbose output."""
         mock_matrices = [
             {
@@ -224,7 +238,7 @@ class TestCLI:
         mock_downloader.list_matrices.return_value = (mock_matrices, len(mock_matrices))
         mock_downloader_class.return_value = mock_downloader
 
-        result = self.runner.invoke(app, ["list", "--verbose"])
+        result = runner.invoke(app, ["list", "--verbose"])
 
         assert result.exit_code == 0
         # In verbose mode, should show separate columns
@@ -233,13 +247,13 @@ class TestCLI:
         assert "52329" in result.stdout
 
     @patch("ssdownload.cli.SuiteSparseDownloader")
-    def test_list_command_with_filters(self, mock_downloader_class):
+    def test_list_command_with_filters(self, mock_downloader_class, runner):
         """Test list command with filters."""
         mock_downloader = MagicMock()
         mock_downloader.list_matrices.return_value = ([], 0)
         mock_downloader_class.return_value = mock_downloader
 
-        result = self.runner.invoke(
+        result = runner.invoke(
             app, ["list", "--spd", "--size", "1000:10000", "--field", "real"]
         )
 
@@ -247,7 +261,7 @@ class TestCLI:
         assert "No matrices found" in result.stdout
 
     @patch("ssdownload.cli.SuiteSparseDownloader")
-    def test_info_command_success(self, mock_downloader_class):
+    def test_info_command_success(self, mock_downloader_class, runner):
         """Test info command with existing matrix."""
         mock_matrix = {
             "group": "Boeing",
@@ -264,12 +278,12 @@ class TestCLI:
 
         mock_downloader = MagicMock()
         mock_downloader.list_matrices.return_value = ([mock_matrix], 1)
-        mock_downloader._get_matrix_url.side_effect = (
-            lambda g, n, f: f"https://sparse.tamu.edu/{f}/{g}/{n}.ext"
+        mock_downloader._get_matrix_url.side_effect = lambda g, n, f: (
+            f"https://sparse.tamu.edu/{f}/{g}/{n}.ext"
         )
         mock_downloader_class.return_value = mock_downloader
 
-        result = self.runner.invoke(app, ["info", "Boeing/ct20stif"])
+        result = runner.invoke(app, ["info", "Boeing/ct20stif"])
 
         assert result.exit_code == 0
         assert "Boeing/ct20stif" in result.stdout
@@ -277,30 +291,28 @@ class TestCLI:
         assert "Download URLs" in result.stdout
 
     @patch("ssdownload.cli.SuiteSparseDownloader")
-    def test_info_command_not_found(self, mock_downloader_class):
+    def test_info_command_not_found(self, mock_downloader_class, runner):
         """Test info command with non-existent matrix."""
         mock_downloader = MagicMock()
         mock_downloader.list_matrices.return_value = ([], 0)
         mock_downloader_class.return_value = mock_downloader
 
-        result = self.runner.invoke(app, ["info", "NonExistent/matrix"])
+        result = runner.invoke(app, ["info", "NonExistent/matrix"])
 
         assert result.exit_code == 1
         assert "not found" in result.stdout
 
-    def test_command_help_messages(self):
+    @pytest.mark.parametrize("cmd", ["download", "bulk", "list", "info", "clean-cache"])
+    def test_command_help_messages(self, cmd, runner):
         """Test that all commands have proper help messages."""
-        commands = ["download", "bulk", "list", "info", "clean-cache"]
-
-        for cmd in commands:
-            result = self.runner.invoke(app, [cmd, "--help"])
-            assert result.exit_code == 0
-            assert len(result.stdout) > 50  # Should have substantial help text
+        result = runner.invoke(app, [cmd, "--help"])
+        assert result.exit_code == 0
+        assert len(result.stdout) > 50  # Should have substantial help text
 
-    def test_shape_options_are_shown_in_filter_command_help(self):
+    def test_shape_options_are_shown_in_filter_command_help(self, runner):
         """List and bulk help should expose both shape filters."""
         for command in ("list", "bulk"):
-            result = self.runner.invoke(app, [command, "--help"], color=True)
+            result = runner.invoke(app, [command, "--help"], color=True)
             output = plain_output(result)
 
             assert result.exit_code == 0
@@ -308,103 +320,95 @@ class TestCLI:
             assert "--rectangle" in output
 
     @patch("ssdownload.cli.SuiteSparseDownloader")
-    def test_list_square_filter(self, mock_downloader_class):
+    def test_list_square_filter(self, mock_downloader_class, runner):
         """List should pass a square filter to the downloader."""
         mock_downloader = MagicMock()
         mock_downloader.list_matrices.return_value = ([], 0)
         mock_downloader_class.return_value = mock_downloader
 
-        result = self.runner.invoke(app, ["list", "--square"])
+        result = runner.invoke(app, ["list", "--square"])
 
         assert result.exit_code == 0
         filter_obj = mock_downloader.list_matrices.call_args.args[0]
         assert filter_obj.square is True
 
     @patch("ssdownload.cli.SuiteSparseDownloader")
-    def test_bulk_rectangle_filter(self, mock_downloader_class):
+    def test_bulk_rectangle_filter(self, mock_downloader_class, runner):
         """Bulk should pass a rectangular filter to the download workflow."""
         mock_downloader = MagicMock()
         mock_downloader.bulk_download = AsyncMock(return_value=[])
         mock_downloader_class.return_value = mock_downloader
 
-        result = self.runner.invoke(app, ["bulk", "--rectangle"])
+        result = runner.invoke(app, ["bulk", "--rectangle"])
 
         assert result.exit_code == 0
         filter_obj = mock_downloader.bulk_download.await_args.args[0]
         assert filter_obj.square is False
 
-    def test_shape_options_are_mutually_exclusive(self):
+    def test_shape_options_are_mutually_exclusive(self, runner):
         """Commands should clearly reject conflicting shape filters."""
         for command in ("list", "bulk"):
-            result = self.runner.invoke(app, [command, "--square", "--rectangle"])
+            result = runner.invoke(app, [command, "--square", "--rectangle"])
 
             assert result.exit_code == 2
             assert "--square and --rectangle cannot be used together" in result.stdout
 
     @patch("ssdownload.cli.Config.get_default_cache_dir")
-    def test_clean_cache_no_cache_file(self, mock_cache_dir):
+    def test_clean_cache_no_cache_file(self, mock_cache_dir, runner, tmp_path):
         """Test clean-cache command when no cache file exists."""
-        import tempfile
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_dir = Path(temp_dir)
-            mock_cache_dir.return_value = cache_dir
+        cache_dir = tmp_path
+        mock_cache_dir.return_value = cache_dir
 
-            result = self.runner.invoke(app, ["clean-cache", "--yes"])
+        result = runner.invoke(app, ["clean-cache", "--yes"])
 
-            assert result.exit_code == 0
-            assert "No cache files found" in result.stdout
-            assert "cache is already clean" in result.stdout
+        assert result.exit_code == 0
+        assert "No cache files found" in result.stdout
+        assert "cache is already clean" in result.stdout
 
     @patch("ssdownload.cli.Config.get_default_cache_dir")
-    def test_clean_cache_with_existing_file(self, mock_cache_dir):
+    def test_clean_cache_with_existing_file(self, mock_cache_dir, runner, tmp_path):
         """Test clean-cache command with existing cache file."""
-        import tempfile
+        cache_dir = tmp_path
+        cache_file = cache_dir / "ssstats_cache.json"
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_dir = Path(temp_dir)
-            cache_file = cache_dir / "ssstats_cache.json"
+        # Create a fake cache file
+        cache_file.write_text('{"test": "data"}')
 
-            # Create a fake cache file
-            cache_file.write_text('{"test": "data"}')
+        mock_cache_dir.return_value = cache_dir
 
-            mock_cache_dir.return_value = cache_dir
+        result = runner.invoke(app, ["clean-cache", "--yes"])
 
-            result = self.runner.invoke(app, ["clean-cache", "--yes"])
-
-            assert result.exit_code == 0
-            assert "CSV index cache cleared" in result.stdout
-            assert "Next operation will download fresh data" in result.stdout
-            assert not cache_file.exists()
+        assert result.exit_code == 0
+        assert "CSV index cache cleared" in result.stdout
+        assert "Next operation will download fresh data" in result.stdout
+        assert not cache_file.exists()
 
     @patch("ssdownload.cli.Config.get_default_cache_dir")
-    def test_clean_cache_shows_cache_info(self, mock_cache_dir):
+    def test_clean_cache_shows_cache_info(self, mock_cache_dir, runner, tmp_path):
         """Test clean-cache command shows cache file information."""
-        import tempfile
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_dir = Path(temp_dir)
-            cache_file = cache_dir / "ssstats_cache.json"
+        cache_dir = tmp_path
+        cache_file = cache_dir / "ssstats_cache.json"
 
-            # Create a cache file with known content
-            test_data = '{"test": "data"}' * 100  # Make it bigger
-            cache_file.write_text(test_data)
+        # Create a cache file with known content
+        test_data = '{"test": "data"}' * 100  # Make it bigger
+        cache_file.write_text(test_data)
 
-            mock_cache_dir.return_value = cache_dir
+        mock_cache_dir.return_value = cache_dir
 
-            result = self.runner.invoke(app, ["clean-cache", "--yes"])
+        result = runner.invoke(app, ["clean-cache", "--yes"])
 
-            assert result.exit_code == 0
-            assert str(cache_file) in result.stdout
-            assert "KB" in result.stdout or "MB" in result.stdout
+        assert result.exit_code == 0
+        # Rich wraps long paths at the console width
+        assert str(cache_file) in result.stdout.replace("\n", "")
+        assert "KB" in result.stdout or "MB" in result.stdout
 
     @patch("ssdownload.cli.SuiteSparseDownloader")
     @patch("ssdownload.cli.asyncio.run")
-    def test_download_with_flat_option(self, mock_asyncio_run, mock_downloader):
+    def test_download_with_flat_option(self, mock_asyncio_run, mock_downloader, runner):
         """Test download command with --flat option."""
         mock_asyncio_run.return_value = Path("./ct20stif.mat")
 
-        result = self.runner.invoke(app, ["download", "ct20stif", "--flat"])
+        result = runner.invoke(app, ["download", "ct20stif", "--flat"])
 
         assert result.exit_code == 0
 
@@ -416,7 +420,7 @@ class TestCLI:
     @patch("ssdownload.cli._list_with_page_filter", new_callable=AsyncMock)
     @patch("ssdownload.cli.SuiteSparseDownloader")
     def test_bulk_command_page_filters_use_two_phase(
-        self, mock_downloader_class, mock_list_with_page
+        self, mock_downloader_class, mock_list_with_page, runner
     ):
         """Bulk with page-only filters should enrich via page scraping before download."""
         matched = [{"group": "Boeing", "name": "ct20stif", "condition_number": 1e3}]
@@ -428,7 +432,7 @@ class TestCLI:
         index_downloader = MagicMock()
         mock_downloader_class.side_effect = [download_downloader, index_downloader]
 
-        result = self.runner.invoke(
+        result = runner.invoke(
             app,
             ["bulk", "--cond", ":1e5", "--size", "100:500", "--max-files", "3"],
         )
@@ -442,7 +446,7 @@ class TestCLI:
         assert call_kwargs["format_type"] == "mat"
 
     @patch("ssdownload.cli._list_with_page_filter", new_callable=AsyncMock)
-    def test_list_page_filters_preserve_total_count(self, mock_list_with_page):
+    def test_list_page_filters_preserve_total_count(self, mock_list_with_page, runner):
         """List limit should affect display count, not the page-filtered total count."""
         mock_list_with_page.return_value = [
             {
@@ -457,7 +461,7 @@ class TestCLI:
             for i in range(1, 4)
         ]
 
-        result = self.runner.invoke(app, ["list", "--cond", ":10", "--limit", "2"])
+        result = runner.invoke(app, ["list", "--cond", ":10", "--limit", "2"])
 
         assert result.exit_code == 0
         assert "showing 2 of 3 total" in result.stdout
@@ -495,13 +499,27 @@ class TestCLI:
         assert len(results) == 1
         mock_page_scraper_class.assert_called_once_with()
 
+    def test_run_closes_downloader_on_error(self):
+        """The downloader is closed inside the event loop even if the command fails."""
+        from ssdownload.cli import _run
+
+        downloader = MagicMock()
+
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            _run(downloader, fail())
+
+        downloader.__aexit__.assert_awaited_once()
+
     @patch("ssdownload.cli.SuiteSparseDownloader")
     @patch("ssdownload.cli.asyncio.run")
-    def test_bulk_with_flat_option(self, mock_asyncio_run, mock_downloader):
+    def test_bulk_with_flat_option(self, mock_asyncio_run, mock_downloader, runner):
         """Test bulk command with --flat option."""
         mock_asyncio_run.return_value = [Path("./matrix1.mat"), Path("./matrix2.mat")]
 
-        result = self.runner.invoke(app, ["bulk", "--spd", "--flat"])
+        result = runner.invoke(app, ["bulk", "--spd", "--flat"])
 
         assert result.exit_code == 0
 
@@ -513,12 +531,12 @@ class TestCLI:
     @patch("ssdownload.cli.SuiteSparseDownloader")
     @patch("ssdownload.cli.asyncio.run")
     def test_download_without_flat_option_default(
-        self, mock_asyncio_run, mock_downloader
+        self, mock_asyncio_run, mock_downloader, runner
     ):
         """Test download command without --flat option (default behavior)."""
         mock_asyncio_run.return_value = Path("./Boeing/ct20stif.mat")
 
-        result = self.runner.invoke(app, ["download", "ct20stif"])
+        result = runner.invoke(app, ["download", "ct20stif"])
 
         assert result.exit_code == 0
 
@@ -9,35 +9,28 @@ from ssdownload.filters import Filter
 class TestCliUtils:
     """Test CLI utility functions."""
 
-    def test_parse_range_single_value(self):
-        """Test parsing single value as range."""
-        result = parse_range("1000")
-        assert result == (1000, 1000)
-
-    def test_parse_range_both_values(self):
-        """Test parsing range with both min and max."""
-        result = parse_range("1000:5000")
-        assert result == (1000, 5000)
-
-    def test_parse_range_min_only(self):
-        """Test parsing range with only minimum value."""
-        result = parse_range("1000:")
-        assert result == (1000, None)
-
-    def test_parse_range_max_only(self):
-        """Test parsing range with only maximum value."""
-        result = parse_range(":5000")
-        assert result == (None, 5000)
-
-    def test_parse_range_scientific_notation(self):
-        """Test parsing range with scientific notation."""
-        result = parse_range("1e3:5e3")
-        assert result == (1000, 5000)
-
-    def test_parse_range_float_values(self):
-        """Test parsing range with float values."""
-        result = parse_range("1000.5:5000.7")
-        assert result == (1000, 5000)  # Should convert to int
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("1000", (1000, 1000)),
+            ("1000:5000", (1000, 5000)),
+            ("1000:", (1000, None)),
+            (":5000", (None, 5000)),
+            ("1e3:5e3", (1000, 5000)),
+            ("1000.5:5000.7", (1000, 5000)),  # Should convert to int
+        ],
+        ids=[
+            "single_value",
+            "both_values",
+            "min_only",
+            "max_only",
+            "scientific_notation",
+            "float_values",
+        ],
+    )
+    def test_parse_range(self, value, expected):
+        """Test parsing range strings into (min, max) tuples."""
+        assert parse_range(value) == expected
 
     def test_build_filter_empty(self):
         """Test building filter with no arguments."""
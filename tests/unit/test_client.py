@@ -1,7 +1,8 @@
 """Tests for client module."""
 
-import tempfile
+import asyncio
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -11,7 +12,7 @@ from ssdownload.exceptions import MatrixNotFoundError
 from ssdownload.filters import Filter
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_csv_content():
     """Sample CSV content from SuiteSparse."""
     return """2
@@ -20,10 +21,10 @@ Boeing,ct20stif,52329,52329,1566095,1,0,0,1,0.5,1.0,structural problem,2698463
 HB,bcsstk01,48,48,224,1,0,0,1,1.0,1.0,structural problem,224"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_matrices():
-    """Sample parsed matrix data."""
-    return [
+    """Sample parsed matrix data, shared read-only across the session."""
+    matrices = [
         {
             "group": "Boeing",
             "name": "ct20stif",
@@ -67,13 +68,20 @@ def sample_matrices():
             "posdef": True,
         },
     ]
+    return [MappingProxyType(matrix) for matrix in matrices]
 
 
 @pytest.fixture
-def temp_cache_dir():
+def temp_cache_dir(tmp_path):
     """Temporary cache directory for tests."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+    return tmp_path
+
+
+@pytest.fixture
+def mock_index_manager():
+    """IndexManager class replaced by a mock in the client module."""
+    with patch("ssdownload.client.IndexManager") as mock_class:
+        yield mock_class
 
 
 class TestSuiteSparseDownloader:
@@ -103,7 +111,14 @@ class TestSuiteSparseDownloader:
         assert downloader.timeout == 60.0
         assert downloader.verify_checksums is False
 
-    @patch("ssdownload.client.IndexManager")
+    async def test_shared_http_client(self, temp_cache_dir):
+        """Index and file requests share one HTTP client."""
+        async with SuiteSparseDownloader(cache_dir=temp_cache_dir) as downloader:
+            client = downloader.index_manager.http_client.get_client()
+            assert downloader.file_downloader.http_client.get_client() is client
+
+        assert client.is_closed
+
     async def test_find_matrices_with_filter(self, mock_index_manager, sample_matrices):
         """Test finding matrices with filter."""
         # Mock index manager
@@ -119,7 +134,38 @@ class TestSuiteSparseDownloader:
         assert len(matrices) == 1
         assert matrices[0]["group"] == "Boeing"
 
-    @patch("ssdownload.client.IndexManager")
+    async def test_find_matrices_unknown_name_short_circuits(
+        self, mock_index_manager, sample_matrices
+    ):
+        """Test that filters naming no known matrix skip the full scan."""
+        mock_instance = mock_index_manager.return_value
+        mock_instance.get_index = AsyncMock(return_value=sample_matrices)
+
+        downloader = SuiteSparseDownloader()
+        filter_obj = Filter(group="nonexistent_group", name="nonexistent_matrix")
+
+        with patch.object(Filter, "matches") as mock_matches:
+            matrices = await downloader.find_matrices(filter_obj)
+
+        assert matrices == []
+        mock_matches.assert_not_called()
+
+    async def test_find_matrices_indexed_filter_skips_matches(
+        self, mock_index_manager, sample_matrices
+    ):
+        """Test that filters answered by the search index skip Filter.matches."""
+        mock_instance = mock_index_manager.return_value
+        mock_instance.get_index = AsyncMock(return_value=sample_matrices)
+
+        downloader = SuiteSparseDownloader()
+        filter_obj = Filter(group="HB", spd=True, n_rows=(None, 1000))
+
+        with patch.object(Filter, "matches") as mock_matches:
+            matrices = await downloader.find_matrices(filter_obj)
+
+        assert [m["name"] for m in matrices] == ["bcsstk01"]
+        mock_matches.assert_not_called()
+
     async def test_find_matrices_no_filter(self, mock_index_manager, sample_matrices):
         """Test finding matrices without filter."""
         mock_instance = mock_index_manager.return_value
@@ -132,7 +178,6 @@ class TestSuiteSparseDownloader:
         # Should return all matrices
         assert len(matrices) == 2
 
-    @patch("ssdownload.client.IndexManager")
     async def test_download_by_name_success(self, mock_index_manager, temp_cache_dir):
         """Test downloading matrix by name."""
         mock_instance = mock_index_manager.return_value
@@ -151,7 +196,6 @@ class TestSuiteSparseDownloader:
             mock_download.assert_called_once_with("Boeing", "ct20stif", "mat", None)
             assert result == Path("/fake/path")
 
-    @patch("ssdownload.client.IndexManager")
     async def test_download_by_name_not_found(self, mock_index_manager):
         """Test downloading matrix by name when not found."""
         mock_instance = mock_index_manager.return_value
@@ -164,7 +208,6 @@ class TestSuiteSparseDownloader:
         ):
             await downloader.download_by_name("unknown")
 
-    @patch("ssdownload.client.IndexManager")
     def test_list_matrices_sync(self, mock_index_manager, sample_matrices):
         """Test synchronous matrix listing."""
         downloader = SuiteSparseDownloader()
@@ -181,7 +224,25 @@ class TestSuiteSparseDownloader:
             assert matrices[0]["group"] == "Boeing"
             mock_async.assert_called_once_with(Filter(group="Boeing"), 1)
 
-    @patch("ssdownload.client.IndexManager")
+    def test_list_matrices_sync_closes_http_client(
+        self, mock_index_manager, sample_matrices
+    ):
+        """The synchronous listing closes its client before the loop ends."""
+        downloader = SuiteSparseDownloader()
+
+        with (
+            patch.object(
+                downloader,
+                "_list_matrices_async",
+                new_callable=AsyncMock,
+                return_value=(sample_matrices, len(sample_matrices)),
+            ),
+            patch.object(downloader, "aclose", new_callable=AsyncMock) as mock_close,
+        ):
+            downloader.list_matrices()
+
+        mock_close.assert_awaited_once()
+
     @patch("ssdownload.client.FileDownloader")
     async def test_download_success(
         self, mock_file_downloader, mock_index_manager, temp_cache_dir
@@ -205,7 +266,6 @@ class TestSuiteSparseDownloader:
         assert "Boeing/ct20stif.mat" in call_args[0][0]  # URL
         assert call_args[0][1] == expected_path  # Output path
 
-    @patch("ssdownload.client.IndexManager")
     async def test_bulk_download(self, mock_index_manager, temp_cache_dir):
         """Test bulk download functionality."""
         sample_matrices = [
@@ -232,11 +292,77 @@ class TestSuiteSparseDownloader:
             assert len(result) == 2
             assert mock_download.call_count == 2
 
-    @patch("ssdownload.client.IndexManager")
+    async def test_bulk_download_concurrency_and_order(self, temp_cache_dir):
+        """Downloads overlap up to the worker limit and keep input order."""
+        matrices = [{"group": "G", "name": f"m{i}"} for i in range(6)]
+        downloader = SuiteSparseDownloader(cache_dir=temp_cache_dir, workers=2)
+        running = 0
+        max_running = 0
+
+        async def fake_download(group, name, *args, **kwargs):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            # Earlier matrices finish later
+            await asyncio.sleep(0.01 * (6 - int(name[1:])))
+            running -= 1
+            return temp_cache_dir / group / f"{name}.mat"
+
+        with patch.object(downloader, "download", side_effect=fake_download):
+            result = await downloader.bulk_download(matrices=matrices)
+
+        assert max_running == 2
+        assert [path.stem for path in result] == [m["name"] for m in matrices]
+
+    async def test_bulk_download_smallest_first(self, temp_cache_dir):
+        """Smaller files start first; unknown sizes last; results keep order."""
+        matrices = [{"group": "G", "name": name} for name in ("big", "tiny", "odd")]
+        downloader = SuiteSparseDownloader(cache_dir=temp_cache_dir, workers=1)
+        started = []
+
+        async def fake_download(group, name, *args, **kwargs):
+            started.append(name)
+            return temp_cache_dir / group / f"{name}.mat"
+
+        sizes = {("G", "big"): 10_000, ("G", "tiny"): 10}
+        with (
+            patch.object(downloader, "head_sizes", AsyncMock(return_value=sizes)),
+            patch.object(downloader, "download", side_effect=fake_download),
+        ):
+            result = await downloader.bulk_download(
+                matrices=matrices, smallest_first=True
+            )
+
+        assert started == ["tiny", "big", "odd"]
+        assert [path.stem for path in result] == ["big", "tiny", "odd"]
+
+    async def test_head_sizes(self, temp_cache_dir):
+        """Sizes are looked up once per matrix and unknown sizes are omitted."""
+        downloader = SuiteSparseDownloader(cache_dir=temp_cache_dir)
+        matrices = [
+            {"group": "HB", "name": "bcsstk01"},
+            {"group": "HB", "name": "bcsstk01"},
+            {"group": "SNAP", "name": "gone"},
+        ]
+        lengths = {"bcsstk01": 2048, "gone": None}
+
+        with patch.object(
+            downloader.file_downloader,
+            "get_content_length",
+            AsyncMock(side_effect=lambda group, name, fmt: lengths[name]),
+        ) as mock_length:
+            sizes = await downloader.head_sizes(matrices, "mm")
+
+        assert sizes == {("HB", "bcsstk01"): 2048}
+        assert mock_length.await_count == 2
+        mock_length.assert_any_await("HB", "bcsstk01", "mm")
+
     async def test_get_available_groups(self, mock_index_manager):
         """Test getting available groups."""
         mock_instance = mock_index_manager.return_value
-        mock_instance.get_groups = AsyncMock(return_value={"Boeing", "HB", "SNAP"})
+        mock_instance.get_groups = AsyncMock(
+            return_value=frozenset({"Boeing", "HB", "SNAP"})
+        )
 
         downloader = SuiteSparseDownloader()
         groups = await downloader._get_available_groups()
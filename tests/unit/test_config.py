@@ -1,6 +1,6 @@
 """Tests for config module."""
 
-import os
+import sys
 from pathlib import Path
 
 import pytest
@@ -25,7 +25,8 @@ class TestConfig:
         assert Config.DEFAULT_TIMEOUT == 30.0
         assert Config.CHUNK_SIZE == 8192
         assert Config.MAX_CONNECTIONS == 10
-        assert Config.MAX_KEEPALIVE_CONNECTIONS == 5
+        assert Config.MAX_KEEPALIVE_CONNECTIONS == 10
+        assert Config.KEEPALIVE_EXPIRY == 30.0
         assert "ssdownload" in Config.USER_AGENT
 
     def test_get_http_client_config_default(self):
@@ -40,49 +41,76 @@ class TestConfig:
         assert config["follow_redirects"] is True
         assert config["headers"]["User-Agent"] == Config.USER_AGENT
 
-    def test_get_http_client_config_custom_timeout(self):
-        """Test HTTP client config with custom timeout."""
-        config = Config.get_http_client_config(timeout=60.0)
-
-        # Timeout should be an httpx.Timeout object, but we can't easily test the internal value
-        assert "timeout" in config
+    def test_get_http_client_config_http2(self, monkeypatch):
+        """Test HTTP/2 is enabled only when the h2 package is available."""
+        monkeypatch.setattr("ssdownload.config._h2_available", lambda: False)
+        assert Config.get_http_client_config()["http2"] is False
 
-    def test_get_file_extension_mat(self):
-        """Test file extension for MAT format."""
-        ext = Config.get_file_extension("mat")
-        assert ext == ".mat"
+        monkeypatch.setattr("ssdownload.config._h2_available", lambda: True)
+        config = Config.get_http_client_config()
+        assert config["http2"] is True
+        # Every request shares one client, so the pool must hold idle
+        # connections for all concurrent workers
+        assert config["limits"].max_keepalive_connections >= Config.MAX_WORKERS
+        assert config["limits"].keepalive_expiry == Config.KEEPALIVE_EXPIRY
+
+    def test_h2_lookup_is_cached(self, monkeypatch):
+        """Test the h2 package is looked up once, not on every call."""
+        from ssdownload.config import _h2_available
+
+        lookups = []
+        monkeypatch.setattr(
+            "importlib.util.find_spec", lambda name: lookups.append(name)
+        )
+        _h2_available.cache_clear()
+        try:
+            Config.get_http_client_config()
+            Config.get_http_client_config(timeout=12.0)
+        finally:
+            _h2_available.cache_clear()
 
-    def test_get_file_extension_mm(self):
-        """Test file extension for Matrix Market format."""
-        ext = Config.get_file_extension("mm")
-        assert ext == ".tar.gz"
+        assert lookups == ["h2"]
 
-    def test_get_file_extension_rb(self):
-        """Test file extension for Rutherford-Boeing format."""
-        ext = Config.get_file_extension("rb")
-        assert ext == ".tar.gz"
+    def test_get_http_client_config_is_shared_and_read_only(self):
+        """Test repeated calls reuse one immutable configuration."""
+        config = Config.get_http_client_config(timeout=45.0)
 
-    def test_get_file_extension_unknown(self):
-        """Test file extension for unknown format defaults to MAT."""
-        ext = Config.get_file_extension("unknown")
-        assert ext == ".mat"
+        assert Config.get_http_client_config(timeout=45.0) is config
+        assert Config.get_http_client_config(timeout=46.0) is not config
+        with pytest.raises(TypeError):
+            config["follow_redirects"] = False
+        with pytest.raises(TypeError):
+            config["headers"]["User-Agent"] = "other"
 
-    def test_get_matrix_url_mat(self):
-        """Test matrix URL generation for MAT format."""
-        url = Config.get_matrix_url("Boeing", "ct20stif", "mat")
-        expected = "https://suitesparse-collection-website.herokuapp.com/mat/Boeing/ct20stif.mat"
-        assert url == expected
+    def test_get_http_client_config_custom_timeout(self):
+        """Test HTTP client config with custom timeout."""
+        config = Config.get_http_client_config(timeout=60.0)
 
-    def test_get_matrix_url_mm(self):
-        """Test matrix URL generation for Matrix Market format."""
-        url = Config.get_matrix_url("Boeing", "ct20stif", "mm")
-        expected = "https://suitesparse-collection-website.herokuapp.com/MM/Boeing/ct20stif.tar.gz"
-        assert url == expected
+        # Timeout should be an httpx.Timeout object, but we can't easily test the internal value
+        assert "timeout" in config
 
-    def test_get_matrix_url_rb(self):
-        """Test matrix URL generation for Rutherford-Boeing format."""
-        url = Config.get_matrix_url("Boeing", "ct20stif", "rb")
-        expected = "https://suitesparse-collection-website.herokuapp.com/RB/Boeing/ct20stif.tar.gz"
+    @pytest.mark.parametrize(
+        "format_type,expected_ext",
+        [("mat", ".mat"), ("mm", ".tar.gz"), ("rb", ".tar.gz"), ("unknown", ".mat")],
+    )
+    def test_get_file_extension(self, format_type, expected_ext):
+        """Test file extension per format; unknown formats default to MAT."""
+        assert Config.get_file_extension(format_type) == expected_ext
+
+    @pytest.mark.parametrize(
+        "format_type,expected_path",
+        [
+            ("mat", "mat/Boeing/ct20stif.mat"),
+            ("mm", "MM/Boeing/ct20stif.tar.gz"),
+            ("rb", "RB/Boeing/ct20stif.tar.gz"),
+        ],
+    )
+    def test_get_matrix_url(self, format_type, expected_path):
+        """Test matrix URL generation per format."""
+        url = Config.get_matrix_url("Boeing", "ct20stif", format_type)
+        expected = (
+            f"https://suitesparse-collection-website.herokuapp.com/{expected_path}"
+        )
         assert url == expected
 
     def test_get_matrix_url_default_format(self):
@@ -96,18 +124,39 @@ class TestConfig:
         with pytest.raises(ValueError, match="Unsupported format: invalid"):
             Config.get_matrix_url("Boeing", "ct20stif", "invalid")
 
-    def test_get_checksum_url_mat(self):
-        """Test checksum URL generation for MAT format."""
-        url = Config.get_checksum_url("Boeing", "ct20stif", "mat")
-        expected = "https://suitesparse-collection-website.herokuapp.com/mat/Boeing/ct20stif.mat.md5"
-        assert url == expected
+    def test_get_matrix_url_follows_base_url_override(self, monkeypatch):
+        """Test cached URLs do not outlive a base URL override."""
+        Config.get_matrix_url("Boeing", "ct20stif", "mat")
+        monkeypatch.setattr(Config, "FILES_BASE_URL", "https://mirror.example.com")
 
-    def test_get_checksum_url_mm(self):
-        """Test checksum URL generation for Matrix Market format."""
-        url = Config.get_checksum_url("Boeing", "ct20stif", "mm")
-        expected = "https://suitesparse-collection-website.herokuapp.com/MM/Boeing/ct20stif.tar.gz.md5"
+        url = Config.get_matrix_url("Boeing", "ct20stif", "mat")
+
+        assert url == "https://mirror.example.com/mat/Boeing/ct20stif.mat"
+
+    @pytest.mark.parametrize(
+        "format_type,expected_path",
+        [
+            ("mat", "mat/Boeing/ct20stif.mat.md5"),
+            ("mm", "MM/Boeing/ct20stif.tar.gz.md5"),
+        ],
+    )
+    def test_get_checksum_url(self, format_type, expected_path):
+        """Test checksum URL generation per format."""
+        url = Config.get_checksum_url("Boeing", "ct20stif", format_type)
+        expected = (
+            f"https://suitesparse-collection-website.herokuapp.com/{expected_path}"
+        )
         assert url == expected
 
+    def test_get_checksum_url_follows_base_url_override(self, monkeypatch):
+        """Test cached checksum URLs do not outlive a base URL override."""
+        Config.get_checksum_url("Boeing", "ct20stif", "mat")
+        monkeypatch.setattr(Config, "FILES_BASE_URL", "https://mirror.example.com")
+
+        url = Config.get_checksum_url("Boeing", "ct20stif", "mat")
+
+        assert url == "https://mirror.example.com/mat/Boeing/ct20stif.mat.md5"
+
     def test_get_checksum_url_default_format(self):
         """Test checksum URL generation with default format."""
         url = Config.get_checksum_url("Boeing", "ct20stif")
@@ -127,20 +176,26 @@ class TestConfig:
         # Should be an absolute path
         assert cache_dir.is_absolute()
 
-    def test_get_default_cache_dir_with_env_override(self):
+    def test_get_default_cache_dir_with_env_override(self, monkeypatch):
         """Test cache directory override via environment variable."""
-        # Test with environment variable override
         test_cache_dir = "/tmp/test_ssdownload_cache"
-        original_env = os.environ.get("SSDOWNLOAD_CACHE_DIR")
+        monkeypatch.setenv("SSDOWNLOAD_CACHE_DIR", test_cache_dir)
 
-        try:
-            os.environ["SSDOWNLOAD_CACHE_DIR"] = test_cache_dir
-            cache_dir = Config.get_default_cache_dir()
-            # Convert both to Path objects to handle cross-platform path separators
-            assert Path(str(cache_dir)) == Path(test_cache_dir)
-        finally:
-            # Restore original environment
-            if original_env is not None:
-                os.environ["SSDOWNLOAD_CACHE_DIR"] = original_env
-            else:
-                os.environ.pop("SSDOWNLOAD_CACHE_DIR", None)
+        cache_dir = Config.get_default_cache_dir()
+
+        # Convert both to Path objects to handle cross-platform path separators
+        assert Path(str(cache_dir)) == Path(test_cache_dir)
+
+    def test_get_default_cache_dir_follows_environment(self, monkeypatch, tmp_path):
+        """Test the memoized directory is resolved again when the env changes."""
+        monkeypatch.delenv("SSDOWNLOAD_CACHE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "a"))
+        first = Config.get_default_cache_dir()
+        assert Config.get_default_cache_dir() == first
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "b"))
+        second = Config.get_default_cache_dir()
+
+        if sys.platform.startswith("linux"):
+            assert first == tmp_path / "a" / "ssdownload"
+            assert second == tmp_path / "b" / "ssdownload"
@@ -1,8 +1,8 @@
 """Tests for downloader module."""
 
 import hashlib
-import tempfile
-from pathlib import Path
+import os
+import tracemalloc
 from unittest.mock import AsyncMock, patch
 
 import httpx
@@ -11,13 +11,17 @@ import pytest
 from ssdownload.config import Config
 from ssdownload.downloader import FileDownloader
 from ssdownload.exceptions import ChecksumError
+from ssdownload.http_client import SharedHTTPClient
+from tests.helpers import FakeAsyncClient
+
+TEST_CONTENT = b"test content"
+TEST_MD5 = hashlib.md5(TEST_CONTENT).hexdigest()
 
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """Temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+    return tmp_path
 
 
 class TestFileDownloader:
@@ -43,14 +47,43 @@ class TestFileDownloader:
 
         # Create test file
         test_file = temp_dir / "test.txt"
-        content = b"test content"
+        test_file.write_bytes(TEST_CONTENT)
+
+        result = await downloader._verify_file_checksum(test_file, TEST_MD5)
+        assert result is True
+
+    async def test_verify_file_checksum_large_file(self, temp_dir):
+        """Test checksum verification of a file spanning many read buffers."""
+        downloader = FileDownloader()
+
+        test_file = temp_dir / "large.bin"
+        content = bytes(range(256)) * 4096 + b"tail"
         test_file.write_bytes(content)
 
-        # Calculate expected MD5
         expected_md5 = hashlib.md5(content).hexdigest()
+        assert await downloader._verify_file_checksum(test_file, expected_md5.upper())
+        assert downloader._compute_digest(test_file, "sha256") == (
+            hashlib.sha256(content).hexdigest()
+        )
 
-        result = await downloader._verify_file_checksum(test_file, expected_md5)
-        assert result is True
+    async def test_verify_file_checksum_streams_file(self, temp_dir):
+        """Test checksum verification does not read the whole file into memory."""
+        downloader = FileDownloader()
+
+        test_file = temp_dir / "big.bin"
+        content = os.urandom(16 * 1024 * 1024)
+        test_file.write_bytes(content)
+        expected_md5 = hashlib.md5(content).hexdigest()
+        del content
+
+        tracemalloc.start()
+        try:
+            assert await downloader._verify_file_checksum(test_file, expected_md5)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak < 2 * 1024 * 1024
 
     async def test_verify_file_checksum_mismatch(self, temp_dir):
         """Test file checksum verification with mismatch."""
@@ -58,7 +91,7 @@ class TestFileDownloader:
 
         # Create test file
         test_file = temp_dir / "test.txt"
-        test_file.write_bytes(b"test content")
+        test_file.write_bytes(TEST_CONTENT)
 
         result = await downloader._verify_file_checksum(test_file, "wrong_checksum")
         assert result is False
@@ -72,106 +105,139 @@ class TestFileDownloader:
         result = await downloader._verify_file_checksum(missing_file, "any_checksum")
         assert result is False
 
-    @patch("httpx.AsyncClient")
-    async def test_get_checksum_success(self, mock_client):
+    @pytest.mark.parametrize(
+        ("status", "body", "exc", "expected"),
+        [
+            (200, "abc123def456  ct20stif.mat", None, "abc123def456"),
+            (404, "", None, None),
+            (None, None, httpx.ConnectError("Connection failed"), None),
+        ],
+        ids=["success", "not_found", "exception"],
+    )
+    async def test_get_checksum(self, status, body, exc, expected):
         """Test getting checksum from server."""
-        # Mock HTTP response
-        mock_response = AsyncMock()
-        mock_response.status_code = 200
-        mock_response.text = "abc123def456  ct20stif.mat"
+        requested_urls = []
 
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_response)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock()
-        mock_client.return_value = mock_client_instance
+        def handler(request):
+            requested_urls.append(str(request.url))
+            if exc is not None:
+                raise exc
+            return httpx.Response(status, text=body)
 
-        downloader = FileDownloader()
-
-        result = await downloader.get_checksum("Boeing", "ct20stif", "mat")
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            downloader = FileDownloader(http_client=SharedHTTPClient(client=client))
+            result = await downloader.get_checksum("Boeing", "ct20stif", "mat")
 
-        assert result == "abc123def456"
-        expected_url = Config.get_checksum_url("Boeing", "ct20stif", "mat")
-        mock_client_instance.get.assert_called_once_with(expected_url)
+        assert result == expected
+        assert requested_urls == [Config.get_checksum_url("Boeing", "ct20stif", "mat")]
 
     @patch("httpx.AsyncClient")
-    async def test_get_checksum_not_found(self, mock_client):
-        """Test getting checksum when not available."""
-        # Mock HTTP response with 404
-        mock_response = AsyncMock()
-        mock_response.status_code = 404
-
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_response)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock()
-        mock_client.return_value = mock_client_instance
+    async def test_get_checksum_reuses_client(self, mock_client):
+        """Test repeated checksum lookups share one keep-alive client."""
+        response = httpx.Response(200, text="abc123def456  ct20stif.mat")
+        mock_client.return_value = FakeAsyncClient(get=AsyncMock(return_value=response))
 
         downloader = FileDownloader()
 
-        result = await downloader.get_checksum("Boeing", "ct20stif", "mat")
+        for name in ("ct20stif", "bcsstk01", "west0479"):
+            await downloader.get_checksum("Boeing", name, "mat")
 
-        assert result is None
+        mock_client.assert_called_once()
+        assert mock_client.return_value.get.await_count == 3
 
-    @patch("httpx.AsyncClient")
-    async def test_get_checksum_exception(self, mock_client):
-        """Test getting checksum with exception."""
-        # Mock HTTP client to raise exception
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(
-            side_effect=httpx.RequestError("Connection failed")
-        )
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock()
-        mock_client.return_value = mock_client_instance
+    async def test_get_content_length(self):
+        """Test reading a file size from a HEAD response."""
+        requests = []
 
-        downloader = FileDownloader()
+        def handler(request):
+            requests.append((request.method, str(request.url)))
+            if "missing" in request.url.path:
+                return httpx.Response(404)
+            return httpx.Response(200, headers={"Content-Length": "1234"})
 
-        result = await downloader.get_checksum("Boeing", "ct20stif", "mat")
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            downloader = FileDownloader(http_client=SharedHTTPClient(client=client))
 
-        assert result is None
+            assert await downloader.get_content_length("HB", "bcsstk01") == 1234
+            assert await downloader.get_content_length("HB", "missing") is None
 
-    @patch.object(FileDownloader, "_download_with_resume")
-    async def test_download_with_resume_new_file(self, mock_download, temp_dir):
+        assert requests[0] == ("HEAD", Config.get_matrix_url("HB", "bcsstk01", "mat"))
+
+    async def test_download_with_resume_new_file(self, temp_dir):
         """Test downloading a new file."""
         content = b"test matrix data"
-        downloader = FileDownloader()
-        temp_file = temp_dir / "test.part"
+        requested_ranges = []
 
-        # Create the file that would be created by the download
-        async def mock_download_side_effect(url, path):
-            path.write_bytes(content)
+        def handler(request):
+            requested_ranges.append(request.headers.get("Range"))
+            return httpx.Response(200, content=content)
 
-        mock_download.side_effect = mock_download_side_effect
+        temp_file = temp_dir / "test.part"
 
-        await downloader._download_with_resume("http://example.com/file", temp_file)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            downloader = FileDownloader(http_client=SharedHTTPClient(client=client))
+            await downloader._download_with_resume("http://example.com/file", temp_file)
 
-        assert temp_file.exists()
+        assert requested_ranges == [None]
         assert temp_file.read_bytes() == content
 
-    @patch.object(FileDownloader, "_download_with_resume")
-    async def test_download_with_resume_existing_file(self, mock_download, temp_dir):
+    async def test_download_with_resume_existing_file(self, temp_dir):
         """Test downloading with resume from existing partial file."""
-        initial_content = b"test"
-        additional_content = b" matrix data"
+        content = b"test matrix data"
+
+        def handler(request):
+            start = int(request.headers["Range"][6:-1])
+            return httpx.Response(206, content=content[start:])
 
         # Create partial file
         temp_file = temp_dir / "test.part"
-        temp_file.write_bytes(initial_content)
+        temp_file.write_bytes(content[:4])
 
-        downloader = FileDownloader()
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            downloader = FileDownloader(http_client=SharedHTTPClient(client=client))
+            await downloader._download_with_resume("http://example.com/file", temp_file)
+
+        assert temp_file.read_bytes() == content
+
+    async def test_download_with_resume_streams_in_chunks(self, temp_dir):
+        """Test the response body is streamed to disk across several chunks."""
+        content = bytes(range(256)) * 10
+        requested_ranges = []
+
+        def handler(request):
+            requested_ranges.append(request.headers.get("Range"))
+            start = int(request.headers.get("Range", "bytes=0-")[6:-1])
+            return httpx.Response(206 if start else 200, content=content[start:])
+
+        temp_file = temp_dir / "test.part"
+        temp_file.write_bytes(content[:100])
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            downloader = FileDownloader(http_client=SharedHTTPClient(client=client))
+            with patch.object(Config, "DOWNLOAD_CHUNK_SIZE", 512):
+                await downloader._download_with_resume(
+                    "http://example.com/file", temp_file
+                )
 
-        # Mock download to append additional content
-        async def mock_download_side_effect(url, path):
-            existing_content = path.read_bytes() if path.exists() else b""
-            path.write_bytes(existing_content + additional_content)
+        assert requested_ranges == ["bytes=100-"]
+        assert temp_file.read_bytes() == content
 
-        mock_download.side_effect = mock_download_side_effect
+    async def test_download_with_resume_range_ignored(self, temp_dir):
+        """Test a full response to a Range request replaces the partial file."""
+        content = b"complete matrix data"
 
-        await downloader._download_with_resume("http://example.com/file", temp_file)
+        def handler(request):
+            assert request.headers["Range"] == "bytes=7-"
+            return httpx.Response(200, content=content)
 
-        assert temp_file.exists()
-        assert temp_file.read_bytes() == initial_content + additional_content
+        temp_file = temp_dir / "test.part"
+        temp_file.write_bytes(b"partial")
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            downloader = FileDownloader(http_client=SharedHTTPClient(client=client))
+            await downloader._download_with_resume("http://example.com/file", temp_file)
+
+        assert temp_file.read_bytes() == content
 
     async def test_download_file_existing_valid(self, temp_dir):
         """Test download_file when file already exists and is valid."""
@@ -179,19 +245,43 @@ class TestFileDownloader:
 
         # Create existing file
         output_path = temp_dir / "test.mat"
-        content = b"test content"
-        output_path.write_bytes(content)
-
-        # Calculate expected MD5
-        expected_md5 = hashlib.md5(content).hexdigest()
+        output_path.write_bytes(TEST_CONTENT)
 
         result = await downloader.download_file(
-            "http://example.com/file", output_path, expected_md5
+            "http://example.com/file", output_path, TEST_MD5
         )
 
         assert result == output_path
         assert output_path.exists()
-        assert output_path.read_bytes() == content
+        assert output_path.read_bytes() == TEST_CONTENT
+
+    async def test_download_file_existing_valid_uses_sidecar(self, temp_dir):
+        """Test a file verified before is not hashed again until it changes."""
+        downloader = FileDownloader()
+        output_path = temp_dir / "test.mat"
+        output_path.write_bytes(TEST_CONTENT)
+
+        await downloader.download_file("http://example.com/file", output_path, TEST_MD5)
+        sidecar = temp_dir / "test.mat.md5"
+        assert sidecar.read_text() == f"{TEST_MD5}  test.mat\n"
+
+        with patch.object(FileDownloader, "_verify_file_checksum") as mock_verify:
+            result = await downloader.download_file(
+                "http://example.com/file", output_path, TEST_MD5.upper()
+            )
+        assert result == output_path
+        mock_verify.assert_not_called()
+
+        # A file modified after the sidecar was written is hashed again
+        newer = sidecar.stat().st_mtime_ns + 1_000_000_000
+        os.utime(output_path, ns=(newer, newer))
+        with patch.object(
+            FileDownloader, "_verify_file_checksum", return_value=True
+        ) as mock_verify:
+            await downloader.download_file(
+                "http://example.com/file", output_path, TEST_MD5
+            )
+        mock_verify.assert_called_once_with(output_path, TEST_MD5)
 
     @patch.object(FileDownloader, "_download_with_resume")
     @patch.object(FileDownloader, "_verify_file_checksum")
@@ -235,8 +325,7 @@ class TestFileDownloader:
         mock_verify.return_value = True
 
         # Create temp file
-        content = b"test content"
-        temp_path.write_bytes(content)
+        temp_path.write_bytes(TEST_CONTENT)
 
         result = await downloader.download_file(
             "http://example.com/file", output_path, "valid_checksum"
@@ -244,8 +333,28 @@ class TestFileDownloader:
 
         assert result == output_path
         assert output_path.exists()
-        assert output_path.read_bytes() == content
+        assert output_path.read_bytes() == TEST_CONTENT
         assert not temp_path.exists()  # Temp file should be moved
+        assert (temp_dir / "test.mat.md5").read_text() == "valid_checksum  test.mat\n"
+
+    async def test_download_file_replaces_corrupt_existing_file(self, temp_dir):
+        """Test an existing file failing verification is re-downloaded in place."""
+
+        def handler(request):
+            return httpx.Response(200, content=TEST_CONTENT)
+
+        output_path = temp_dir / "test.mat"
+        output_path.write_bytes(b"corrupt")
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            downloader = FileDownloader(http_client=SharedHTTPClient(client=client))
+            result = await downloader.download_file(
+                "http://example.com/file", output_path, TEST_MD5
+            )
+
+        assert result == output_path
+        assert output_path.read_bytes() == TEST_CONTENT
+        assert not output_path.with_suffix(".mat.part").exists()
 
     @patch.object(FileDownloader, "_download_with_resume")
     async def test_download_file_no_checksum_verification(
@@ -261,8 +370,7 @@ class TestFileDownloader:
         mock_download.return_value = None
 
         # Create temp file
-        content = b"test content"
-        temp_path.write_bytes(content)
+        temp_path.write_bytes(TEST_CONTENT)
 
         result = await downloader.download_file(
             "http://example.com/file",
@@ -272,4 +380,4 @@ class TestFileDownloader:
 
         assert result == output_path
         assert output_path.exists()
-        assert output_path.read_bytes() == content
+        assert output_path.read_bytes() == TEST_CONTENT
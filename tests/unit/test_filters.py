@@ -1,59 +1,50 @@
 """Tests for filters module."""
 
+import dataclasses
+from types import MappingProxyType
+
+import pytest
+
 from ssdownload.filters import Filter
 
+BASE_MATRIX = MappingProxyType(
+    {
+        "name": "test",
+        "group": "test",
+        "num_rows": 100,
+        "num_cols": 100,
+        "nnz": 1000,
+        "symmetric": True,
+        "spd": True,
+        "field": "real",
+    }
+)
+
 
 class TestFilter:
     """Test Filter class."""
 
     def test_empty_filter_matches_all(self):
         """Empty filter should match all matrices."""
-        filter_obj = Filter()
-        matrix_info = {
-            "name": "test_matrix",
-            "group": "test_group",
-            "num_rows": 1000,
-            "nnz": 5000,
-            "spd": True,
-        }
-        assert filter_obj.matches(matrix_info)
+        assert Filter().matches(BASE_MATRIX)
 
     def test_spd_filter(self):
         """Test SPD filtering."""
         filter_obj = Filter(spd=True)
 
         # Should match SPD matrix (symmetric + posdef + square)
-        spd_matrix = {
-            "symmetric": True,
-            "spd": True,
-            "num_rows": 100,
-            "num_cols": 100,
-            "name": "test",
-        }
-        assert filter_obj.matches(spd_matrix)
+        assert filter_obj.matches(BASE_MATRIX)
 
         # Should not match non-SPD matrix
         non_spd_matrix = {"spd": False, "symmetric": False, "name": "test"}
         assert not filter_obj.matches(non_spd_matrix)
 
         # Should not match non-symmetric matrix (spd should be False for non-symmetric)
-        non_symmetric = {
-            "symmetric": False,
-            "spd": False,  # SPD requires symmetric, so this should be False
-            "num_rows": 100,
-            "num_cols": 100,
-            "name": "test",
-        }
+        non_symmetric = {**BASE_MATRIX, "symmetric": False, "spd": False}
         assert not filter_obj.matches(non_symmetric)
 
         # Should not match non-square matrix (spd should be False for non-square)
-        non_square = {
-            "symmetric": True,
-            "spd": False,  # SPD requires square matrix, so this should be False
-            "num_rows": 100,
-            "num_cols": 200,
-            "name": "test",
-        }
+        non_square = {**BASE_MATRIX, "num_cols": 200, "spd": False}
         assert not filter_obj.matches(non_square)
 
     def test_square_filter(self):
@@ -80,99 +71,62 @@ class TestFilter:
         assert not Filter(square=True).matches({"num_rows": 100})
         assert not Filter(square=False).matches({"num_cols": 100})
 
-    def test_size_range_filter(self):
-        """Test size range filtering."""
-        filter_obj = Filter(n_rows=(100, 1000))
-
-        # Should match matrix in range
-        in_range = {"num_rows": 500, "name": "test"}
-        assert filter_obj.matches(in_range)
-
-        # Should not match matrix below range
-        below_range = {"num_rows": 50, "name": "test"}
-        assert not filter_obj.matches(below_range)
-
-        # Should not match matrix above range
-        above_range = {"num_rows": 2000, "name": "test"}
-        assert not filter_obj.matches(above_range)
-
-    def test_open_ended_range(self):
-        """Test open-ended range filters."""
-        # Only minimum
-        min_filter = Filter(nnz=(1000, None))
-        assert min_filter.matches({"nnz": 2000, "name": "test"})
-        assert not min_filter.matches({"nnz": 500, "name": "test"})
-
-        # Only maximum
-        max_filter = Filter(nnz=(None, 1000))
-        assert max_filter.matches({"nnz": 500, "name": "test"})
-        assert not max_filter.matches({"nnz": 2000, "name": "test"})
-
-    def test_string_filters(self):
-        """Test string-based filters."""
-        filter_obj = Filter(group="Boeing", field="real")
-
-        # Should match
-        matching = {
-            "group": "Boeing",
-            "field": "real",
-            "name": "test",
-        }
-        assert filter_obj.matches(matching)
-
-        # Should not match wrong group
-        wrong_group = {
-            "group": "HB",
-            "field": "real",
-            "name": "test",
-        }
-        assert not filter_obj.matches(wrong_group)
+    @pytest.mark.parametrize(
+        ("filter_kwargs", "overrides", "expected"),
+        [
+            ({"n_rows": (100, 1000)}, {"num_rows": 500}, True),
+            ({"n_rows": (100, 1000)}, {"num_rows": 50}, False),
+            ({"n_rows": (100, 1000)}, {"num_rows": 2000}, False),
+            ({"nnz": (1000, None)}, {"nnz": 2000}, True),
+            ({"nnz": (1000, None)}, {"nnz": 500}, False),
+            ({"nnz": (None, 1000)}, {"nnz": 500}, True),
+            ({"nnz": (None, 1000)}, {"nnz": 2000}, False),
+            ({"group": "Boeing", "field": "real"}, {"group": "Boeing"}, True),
+            ({"group": "Boeing", "field": "real"}, {"group": "HB"}, False),
+        ],
+        ids=[
+            "rows_in_range",
+            "rows_below_range",
+            "rows_above_range",
+            "nnz_min_only_match",
+            "nnz_min_only_below",
+            "nnz_max_only_match",
+            "nnz_max_only_above",
+            "string_match",
+            "string_wrong_group",
+        ],
+    )
+    def test_criteria(self, filter_kwargs, overrides, expected):
+        """Test range, open-ended range and string criteria."""
+        assert Filter(**filter_kwargs).matches({**BASE_MATRIX, **overrides}) is expected
 
     def test_partial_string_matching(self):
         """Test that string filters use partial matching."""
         filter_obj = Filter(name="stif")
 
         # Should match partial name
-        partial_match = {"name": "ct20stif", "group": "Boeing"}
-        assert filter_obj.matches(partial_match)
+        assert filter_obj.matches({**BASE_MATRIX, "name": "ct20stif"})
 
         # Should not match non-matching name
-        no_match = {"name": "other_matrix", "group": "Boeing"}
-        assert not filter_obj.matches(no_match)
+        assert not filter_obj.matches({**BASE_MATRIX, "name": "other_matrix"})
 
     def test_case_insensitive_matching(self):
         """Test that string matching is case insensitive."""
         filter_obj = Filter(group="boeing")
 
         # Should match different case
-        different_case = {"group": "Boeing", "name": "test"}
-        assert filter_obj.matches(different_case)
+        assert filter_obj.matches({**BASE_MATRIX, "group": "Boeing"})
 
     def test_multiple_criteria(self):
         """Test filtering with multiple criteria."""
         filter_obj = Filter(spd=True, n_rows=(100, 1000), field="real", group="Boeing")
 
         # Should match all criteria (SPD requires symmetric + spd + square)
-        all_match = {
-            "symmetric": True,
-            "spd": True,
-            "num_rows": 500,
-            "num_cols": 500,  # Must be square for SPD
-            "field": "real",
-            "group": "Boeing",
-            "name": "test",
-        }
+        all_match = {**BASE_MATRIX, "num_rows": 500, "num_cols": 500, "group": "Boeing"}
         assert filter_obj.matches(all_match)
 
         # Should not match if one criterion fails
-        one_fail = {
-            "spd": False,  # Fails SPD check
-            "num_rows": 500,
-            "field": "real",
-            "group": "Boeing",
-            "name": "test",
-        }
-        assert not filter_obj.matches(one_fail)
+        assert not filter_obj.matches({**all_match, "spd": False})
 
     def test_to_dict(self):
         """Test conversion to dictionary."""
@@ -208,3 +162,22 @@ class TestFilter:
         # Should work with 'rows' instead of 'num_rows'
         alt_name = {"rows": 500, "name": "test"}
         assert filter_obj.matches(alt_name)
+
+    def test_compiled_predicates(self):
+        """Only criteria that are set should be compiled into predicates."""
+        assert Filter()._predicates == []
+        assert len(Filter(spd=True, group="HB")._predicates) == 2
+
+        # Compiled state should not affect equality or repr
+        assert Filter(group="HB") == Filter(group="HB")
+        assert "_predicates" not in repr(Filter(group="HB"))
+
+    def test_filter_is_immutable(self):
+        """Filters are frozen value objects that can be shared and hashed."""
+        filter_obj = Filter(spd=True)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            filter_obj.spd = False  # type: ignore[misc]
+
+        assert hash(filter_obj) == hash(Filter(spd=True))
+        assert dataclasses.replace(filter_obj, spd=False).matches({"spd": False})
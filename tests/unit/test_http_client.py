@@ -0,0 +1,84 @@
+"""Tests for http_client module."""
+
+import asyncio
+
+import httpx
+
+from ssdownload.http_client import SharedHTTPClient
+
+
+class TestSharedHTTPClient:
+    """Test SharedHTTPClient functionality."""
+
+    async def test_client_is_reused(self):
+        """Requests in the same event loop share one client."""
+        http = SharedHTTPClient(timeout=5.0)
+
+        client = http.get_client()
+
+        assert http.get_client() is client
+        assert client.timeout.read == 5.0
+        await http.aclose()
+        assert client.is_closed
+
+    async def test_closed_client_is_recreated(self):
+        """A closed client is replaced on next use."""
+        http = SharedHTTPClient()
+        client = http.get_client()
+        await http.aclose()
+
+        new_client = http.get_client()
+
+        assert new_client is not client
+        assert not new_client.is_closed
+        await http.aclose()
+
+    def test_client_recreated_per_event_loop(self):
+        """A client is not reused across asyncio.run calls."""
+        http = SharedHTTPClient()
+
+        async def get_client():
+            return http.get_client()
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        assert first is not second
+
+    def test_stale_client_closed_on_loop_change(self):
+        """The client of a finished event loop is closed when it is replaced."""
+        http = SharedHTTPClient()
+
+        async def get_client():
+            client = http.get_client()
+            await asyncio.sleep(0)
+            return client
+
+        first = asyncio.run(get_client())
+        assert not first.is_closed
+
+        second = asyncio.run(get_client())
+
+        assert first.is_closed
+        assert not second.is_closed
+
+    def test_aclose_from_other_loop(self):
+        """aclose() closes a client created in a finished event loop."""
+        http = SharedHTTPClient()
+
+        async def get_client():
+            return http.get_client()
+
+        client = asyncio.run(get_client())
+        asyncio.run(http.aclose())
+
+        assert client.is_closed
+
+    async def test_external_client_not_closed(self):
+        """An externally provided client is used as-is and left open."""
+        async with httpx.AsyncClient() as external:
+            http = SharedHTTPClient(client=external)
+
+            assert http.get_client() is external
+            await http.aclose()
+            assert not external.is_closed
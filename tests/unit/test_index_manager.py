@@ -1,22 +1,32 @@
 """Tests for index_manager module."""
 
+import gzip
 import json
-import tempfile
+import os
 import time
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from ssdownload.config import Config
+from ssdownload.http_client import SharedHTTPClient
 from ssdownload.index_manager import IndexManager
 
 
+@pytest.fixture(scope="module")
+def temp_cache_root(tmp_path_factory):
+    """Temporary directory shared by all tests in this module."""
+    return tmp_path_factory.mktemp("cache")
+
+
 @pytest.fixture
-def temp_cache_dir():
-    """Temporary cache directory for tests."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+def temp_cache_dir(temp_cache_root, request):
+    """Empty cache directory of the current test inside the shared root."""
+    cache_dir = temp_cache_root / request.node.name
+    cache_dir.mkdir()
+    return cache_dir
 
 
 @pytest.fixture
@@ -120,6 +130,18 @@ class TestIndexManager:
             parsed[1]["structure"] == "symmetric"
         )  # bcsstk01 has numerical_symmetry=1.0, so symmetric
 
+    def test_parse_csv_content_crlf(
+        self, temp_cache_dir, sample_csv_content, expected_parsed_data
+    ):
+        """Test CSV content with Windows line endings parses identically."""
+        manager = IndexManager(temp_cache_dir)
+
+        crlf_content = sample_csv_content.replace("\n", "\r\n") + "\r\n"
+        parsed = manager._parse_csv_content(crlf_content)
+
+        assert parsed == manager._parse_csv_content(sample_csv_content)
+        assert parsed[1]["kind"] == "structural problem"
+
     def test_parse_csv_line_valid(self, temp_cache_dir):
         """Test parsing a valid CSV line."""
         manager = IndexManager(temp_cache_dir)
@@ -168,28 +190,156 @@ class TestIndexManager:
         matrix_info = {"real": False, "binary": False}
         assert manager._get_field_type(matrix_info) == "complex"
 
-    @patch("httpx.AsyncClient")
-    async def test_fetch_csv_index(
-        self, mock_client, temp_cache_dir, sample_csv_content
-    ):
+    async def test_fetch_csv_index(self, temp_cache_dir, sample_csv_content):
         """Test fetching CSV index from remote."""
-        # Mock HTTP response
-        mock_response = AsyncMock()
-        mock_response.text = sample_csv_content
-        mock_response.raise_for_status = AsyncMock()
+        requests = []
 
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_response)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock()
-        mock_client.return_value = mock_client_instance
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200, text=sample_csv_content, headers={"ETag": '"v1"'}
+            )
 
-        manager = IndexManager(temp_cache_dir)
-        result = await manager._fetch_csv_index()
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            manager = IndexManager(temp_cache_dir, SharedHTTPClient(client=client))
+            result = await manager._fetch_csv_index()
 
         assert len(result) == 2
         assert result[0]["group"] == "Boeing"
-        mock_client_instance.get.assert_called_once_with(Config.CSV_INDEX_URL)
+        assert manager._index_etag == '"v1"'
+        assert [str(request.url) for request in requests] == [Config.CSV_INDEX_URL]
+        assert "If-None-Match" not in requests[0].headers
+
+    async def test_fetch_csv_index_not_modified(self, temp_cache_dir):
+        """Test conditional fetch returning 304 Not Modified."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(304)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            manager = IndexManager(temp_cache_dir, SharedHTTPClient(client=client))
+            result = await manager._fetch_csv_index_if_modified('"v1"')
+
+        assert result is None
+        assert [str(request.url) for request in requests] == [Config.CSV_INDEX_URL]
+        assert requests[0].headers["If-None-Match"] == '"v1"'
+
+    @patch.object(IndexManager, "_fetch_csv_index_if_modified")
+    async def test_get_index_revalidates_stale_disk_cache(
+        self, mock_fetch, temp_cache_dir, expected_parsed_data
+    ):
+        """Test a stale disk cache is reused when the server reports 304."""
+        mock_fetch.return_value = None
+        manager = IndexManager(temp_cache_dir)
+
+        cache_file = temp_cache_dir / manager.INDEX_CACHE_FILENAME
+        manager._save_index_to_disk(expected_parsed_data, cache_file)
+        (temp_cache_dir / manager.ETAG_CACHE_FILENAME).write_text('"v1"')
+        stale_time = time.time() - Config.CACHE_TTL - 60
+        os.utime(cache_file, (stale_time, stale_time))
+
+        result = await manager.get_index()
+
+        assert result == expected_parsed_data
+        mock_fetch.assert_called_once_with('"v1"')
+        # The revalidated cache is fresh again
+        assert cache_file.stat().st_mtime > stale_time
+
+    @patch.object(IndexManager, "_fetch_csv_index_if_modified")
+    async def test_get_index_migrates_legacy_disk_cache(
+        self, mock_fetch, temp_cache_dir, expected_parsed_data
+    ):
+        """Test an uncompressed cache from earlier versions is replaced."""
+        mock_fetch.return_value = None
+        manager = IndexManager(temp_cache_dir)
+
+        legacy_file = temp_cache_dir / manager.LEGACY_INDEX_CACHE_FILENAME
+        legacy_file.write_text(json.dumps(expected_parsed_data))
+        (temp_cache_dir / manager.ETAG_CACHE_FILENAME).write_text('"v1"')
+        stale_time = time.time() - Config.CACHE_TTL - 60
+        os.utime(legacy_file, (stale_time, stale_time))
+
+        result = await manager.get_index()
+
+        assert result == expected_parsed_data
+        mock_fetch.assert_called_once_with('"v1"')
+        assert not legacy_file.exists()
+        cache_file = temp_cache_dir / manager.INDEX_CACHE_FILENAME
+        assert manager._load_index_from_disk(cache_file) == expected_parsed_data
+        assert (temp_cache_dir / manager.ETAG_CACHE_FILENAME).read_text() == '"v1"'
+
+    @patch.object(IndexManager, "_fetch_csv_index_if_modified")
+    async def test_get_index_saves_etag(
+        self, mock_fetch, temp_cache_dir, expected_parsed_data
+    ):
+        """Test a full fetch stores the index together with its ETag."""
+
+        async def fetch(etag=None):
+            manager._index_etag = '"v2"'
+            return expected_parsed_data
+
+        mock_fetch.side_effect = fetch
+        manager = IndexManager(temp_cache_dir)
+
+        await manager.get_index(force_refresh=True)
+
+        mock_fetch.assert_called_once_with(None)
+        assert (temp_cache_dir / manager.INDEX_CACHE_FILENAME).exists()
+        assert (temp_cache_dir / manager.ETAG_CACHE_FILENAME).read_text() == '"v2"'
+
+    @patch.object(IndexManager, "_fetch_csv_index_if_modified")
+    async def test_get_index_failed_cache_write_drops_etag(
+        self, mock_fetch, temp_cache_dir, expected_parsed_data
+    ):
+        """Test a new ETag is not stored next to an outdated cache file."""
+
+        async def fetch(etag=None):
+            manager._index_etag = '"v2"'
+            return expected_parsed_data
+
+        mock_fetch.side_effect = fetch
+        manager = IndexManager(temp_cache_dir)
+
+        cache_file = temp_cache_dir / manager.INDEX_CACHE_FILENAME
+        manager._save_index_to_disk(expected_parsed_data[:1], cache_file)
+        etag_file = temp_cache_dir / manager.ETAG_CACHE_FILENAME
+        etag_file.write_text('"v1"')
+        stale_time = time.time() - Config.CACHE_TTL - 60
+        os.utime(cache_file, (stale_time, stale_time))
+
+        with patch.object(Path, "replace", side_effect=OSError("disk full")):
+            result = await manager.get_index()
+
+        assert result == expected_parsed_data
+        mock_fetch.assert_called_once_with('"v1"')
+        # The old file stays on disk, so it must not be revalidated next time
+        assert manager._load_index_from_disk(cache_file) == expected_parsed_data[:1]
+        assert not etag_file.exists()
+
+    @patch.object(IndexManager, "_fetch_csv_index")
+    @patch.object(IndexManager, "_fetch_csv_index_if_modified")
+    async def test_get_index_not_modified_unreadable_cache(
+        self, mock_conditional, mock_fetch, temp_cache_dir, expected_parsed_data
+    ):
+        """Test a 304 for an unreadable disk cache falls back to a full fetch."""
+        mock_conditional.return_value = None
+        mock_fetch.return_value = expected_parsed_data
+        manager = IndexManager(temp_cache_dir)
+
+        cache_file = temp_cache_dir / manager.INDEX_CACHE_FILENAME
+        cache_file.write_bytes(b"not gzip")
+        (temp_cache_dir / manager.ETAG_CACHE_FILENAME).write_text('"v1"')
+        stale_time = time.time() - Config.CACHE_TTL - 60
+        os.utime(cache_file, (stale_time, stale_time))
+
+        result = await manager.get_index()
+
+        assert result == expected_parsed_data
+        mock_conditional.assert_called_once_with('"v1"')
+        mock_fetch.assert_called_once_with()
+        assert manager._load_index_from_disk(cache_file) == expected_parsed_data
 
     async def test_get_index_from_cache(self, temp_cache_dir, expected_parsed_data):
         """Test getting index from memory cache."""
@@ -207,7 +357,7 @@ class TestIndexManager:
     async def test_get_index_from_disk_cache(
         self, temp_cache_dir, expected_parsed_data
     ):
-        """Test getting index from disk cache."""
+        """Test getting index from a legacy uncompressed disk cache."""
         manager = IndexManager(temp_cache_dir)
 
         # Create disk cache
@@ -220,6 +370,42 @@ class TestIndexManager:
         assert len(result) == 2
         assert result[0]["group"] == "Boeing"
 
+    async def test_get_index_shares_parsed_disk_cache(
+        self, temp_cache_dir, expected_parsed_data
+    ):
+        """Test instances reuse a parsed disk cache until the file changes."""
+        cache_file = temp_cache_dir / IndexManager.INDEX_CACHE_FILENAME
+        IndexManager(temp_cache_dir)._save_index_to_disk(
+            expected_parsed_data, cache_file
+        )
+        first = await IndexManager(temp_cache_dir).get_index()
+
+        with patch.object(IndexManager, "_load_index_from_disk") as mock_load:
+            second = await IndexManager(temp_cache_dir).get_index()
+        assert second is first
+        mock_load.assert_not_called()
+
+        # A rewritten cache file is parsed again
+        IndexManager(temp_cache_dir)._save_index_to_disk(
+            expected_parsed_data[:1], cache_file
+        )
+        os.utime(cache_file, ns=(time.time_ns(), time.time_ns() + 1000))
+        assert (
+            await IndexManager(temp_cache_dir).get_index() == (expected_parsed_data[:1])
+        )
+
+    def test_load_index_from_disk_interns_strings(self, temp_cache_dir):
+        """Test repeated string values share one object after loading."""
+        manager = IndexManager(temp_cache_dir)
+        cache_file = temp_cache_dir / manager.INDEX_CACHE_FILENAME
+        manager._save_index_to_disk(
+            [{"group": "HB", "name": f"m{i}"} for i in range(2)], cache_file
+        )
+
+        result = manager._load_index_from_disk(cache_file)
+
+        assert result[0]["group"] is result[1]["group"]
+
     def test_save_index_to_disk(self, temp_cache_dir, expected_parsed_data):
         """Test saving index to disk cache."""
         manager = IndexManager(temp_cache_dir)
@@ -234,6 +420,36 @@ class TestIndexManager:
         assert len(saved_data) == 2
         assert saved_data[0]["group"] == "Boeing"
 
+    def test_save_index_to_disk_compressed(self, temp_cache_dir, expected_parsed_data):
+        """Test the default cache file is gzip-compressed JSON."""
+        manager = IndexManager(temp_cache_dir)
+        cache_file = temp_cache_dir / manager.INDEX_CACHE_FILENAME
+
+        manager._save_index_to_disk(expected_parsed_data, cache_file)
+
+        assert json.loads(gzip.decompress(cache_file.read_bytes())) == (
+            expected_parsed_data
+        )
+        assert manager._load_index_from_disk(cache_file) == expected_parsed_data
+
+        cache_file.write_bytes(b"not gzip data")
+        assert manager._load_index_from_disk(cache_file) is None
+
+    def test_save_index_to_disk_keeps_old_cache_on_failure(
+        self, temp_cache_dir, expected_parsed_data
+    ):
+        """Test a failed write leaves the previous cache file intact."""
+        manager = IndexManager(temp_cache_dir)
+        cache_file = temp_cache_dir / manager.INDEX_CACHE_FILENAME
+        manager._save_index_to_disk(expected_parsed_data[:1], cache_file)
+
+        with patch.object(Path, "replace", side_effect=OSError("disk full")):
+            saved = manager._save_index_to_disk(expected_parsed_data, cache_file)
+
+        assert saved is False
+        assert manager._load_index_from_disk(cache_file) == expected_parsed_data[:1]
+        assert list(temp_cache_dir.iterdir()) == [cache_file]
+
     @patch.object(IndexManager, "get_index")
     async def test_get_groups(
         self, mock_get_index, temp_cache_dir, expected_parsed_data
@@ -244,6 +460,7 @@ class TestIndexManager:
         manager = IndexManager(temp_cache_dir)
         groups = await manager.get_groups()
 
+        assert isinstance(groups, frozenset)
         assert len(groups) == 2
         assert "Boeing" in groups
         assert "HB" in groups
@@ -252,7 +469,7 @@ class TestIndexManager:
     async def test_get_groups_cached(self, mock_get_index, temp_cache_dir):
         """Test getting groups from cache."""
         manager = IndexManager(temp_cache_dir)
-        manager._groups_cache = {"Boeing", "HB", "SNAP"}
+        manager._groups_cache = frozenset({"Boeing", "HB", "SNAP"})
 
         groups = await manager.get_groups()
 
@@ -261,6 +478,22 @@ class TestIndexManager:
         # Should not call get_index since we have cached groups
         mock_get_index.assert_not_called()
 
+    @patch.object(IndexManager, "_fetch_csv_index")
+    async def test_get_groups_invalidated_on_refresh(
+        self, mock_fetch, temp_cache_dir, expected_parsed_data
+    ):
+        """Test cached groups are recomputed after the index is refreshed."""
+        mock_fetch.return_value = expected_parsed_data
+        manager = IndexManager(temp_cache_dir)
+
+        assert await manager.get_groups() == {"Boeing", "HB"}
+        assert await manager.get_groups() is await manager.get_groups()
+
+        mock_fetch.return_value = [{"group": "SNAP", "name": "email-Enron"}]
+        await manager.get_index(force_refresh=True)
+
+        assert await manager.get_groups() == {"SNAP"}
+
     @patch.object(IndexManager, "get_index")
     async def test_find_matrix_info(
         self, mock_get_index, temp_cache_dir, expected_parsed_data
@@ -280,6 +513,31 @@ class TestIndexManager:
         result = await manager.find_matrix_info("nonexistent")
         assert result is None
 
+        # A refreshed index is searched instead of the old one
+        mock_get_index.return_value = [{"group": "SNAP", "name": "ct20stif"}]
+        result = await manager.find_matrix_info("ct20stif")
+        assert result["group"] == "SNAP"
+
+    async def test_find_matrix_info_repeated_lookups(
+        self, temp_cache_dir, expected_parsed_data
+    ):
+        """Test many lookups reuse one index and return the first match."""
+        matrices = [*expected_parsed_data, {"group": "Other", "name": "ct20stif"}]
+        manager = IndexManager(temp_cache_dir)
+
+        with patch.object(IndexManager, "get_index", AsyncMock(return_value=matrices)):
+            for _ in range(5):
+                assert (await manager.find_matrix_info("ct20stif"))["group"] == (
+                    "Boeing"
+                )
+                assert (await manager.find_matrix_info("bcsstk01"))["group"] == "HB"
+            name_index = manager._name_index
+
+            assert await manager.find_matrix_info("missing") is None
+
+        # The name index was built once, not per lookup
+        assert manager._name_index is name_index
+
     @patch.object(IndexManager, "find_matrix_info")
     async def test_find_matrix_group(self, mock_find_info, temp_cache_dir):
         """Test finding matrix group by name."""
@@ -30,6 +30,12 @@ class TestParseFloatRange:
         with pytest.raises(ValueError):
             parse_float_range(":")
 
+    def test_is_memoized(self):
+        parse_float_range.cache_clear()
+
+        assert parse_float_range("1e2:1e6") is parse_float_range("1e2:1e6")
+        assert parse_float_range.cache_info().hits == 1
+
 
 class TestPageScrapedFilters:
     def test_condition_number_filter(self):
@@ -4,9 +4,11 @@ import json
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from ssdownload.page_scraper import PageScraper
+from tests.helpers import FakeAsyncClient
 
 SAMPLE_HTML = """
 <html>
@@ -130,18 +132,16 @@ class TestPageScraper:
     async def test_enrich_matrix_info(self):
         scraper = PageScraper()
 
-        mock_response = AsyncMock()
-        mock_response.text = SAMPLE_HTML
-        mock_response.raise_for_status = lambda: None
+        response = httpx.Response(
+            200,
+            text=SAMPLE_HTML,
+            request=httpx.Request("GET", f"{PageScraper.MATRIX_PAGE_URL}/HB/nos5"),
+        )
+        client = FakeAsyncClient(get=AsyncMock(return_value=response))
 
         matrix = {"group": "HB", "name": "nos5", "rows": 468, "cols": 468}
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_client.return_value.__aexit__ = AsyncMock(return_value=False)
-            mock_instance.get = AsyncMock(return_value=mock_response)
-
+        with patch("httpx.AsyncClient", return_value=client):
             enriched = await scraper.enrich_matrix_info(matrix)
 
         assert enriched["rows"] == 468
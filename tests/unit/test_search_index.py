@@ -0,0 +1,175 @@
+"""Tests for search_index module."""
+
+import pytest
+
+from ssdownload.filters import Filter
+from ssdownload.search_index import SearchIndex
+
+
+@pytest.fixture
+def sample_matrices():
+    """Minimal matrix metadata for search tests."""
+    return [
+        {"group": "Boeing", "name": "ct20stif", "num_rows": 52329},
+        {"group": "HB", "name": "bcsstk01", "num_rows": 48},
+    ]
+
+
+class TestSearchIndex:
+    """Test SearchIndex functionality."""
+
+    def test_could_match_empty_filter(self, sample_matrices):
+        """Filters without group/name terms cannot be ruled out."""
+        search_index = SearchIndex(sample_matrices)
+
+        assert search_index.could_match(Filter())
+        assert search_index.could_match(Filter(n_rows=(None, 10)))
+
+    def test_could_match_substring_terms(self, sample_matrices):
+        """Group and name terms use case-insensitive substring semantics."""
+        search_index = SearchIndex(sample_matrices)
+
+        assert search_index.could_match(Filter(group="boe"))
+        assert search_index.could_match(Filter(name="STIF"))
+        assert search_index.could_match(Filter(group="HB", name="bcsstk"))
+
+    def test_could_match_rejects_unknown_terms(self, sample_matrices):
+        """Terms that occur in no matrix are rejected without a scan."""
+        search_index = SearchIndex(sample_matrices)
+
+        assert not search_index.could_match(Filter(group="nonexistent_group"))
+        assert not search_index.could_match(
+            Filter(name="definitely_does_not_exist_12345")
+        )
+        assert not search_index.could_match(Filter(group="Boeing", name="missing"))
+
+    def test_could_match_does_not_span_names(self, sample_matrices):
+        """A term must not match across the boundary of two names."""
+        search_index = SearchIndex(sample_matrices)
+
+        assert not search_index.could_match(Filter(name="stifbcs"))
+
+    def test_candidates_without_indexed_criteria(self, sample_matrices):
+        """Filters without indexed criteria fall back to a full scan."""
+        search_index = SearchIndex(sample_matrices)
+
+        assert search_index.candidates(Filter()) is None
+        assert search_index.candidates(Filter(cholesky_candidate=True)) is None
+
+    def test_candidates_categorical(self, sample_matrices):
+        """Categorical terms are resolved through the inverted index."""
+        search_index = SearchIndex(sample_matrices)
+
+        assert search_index.candidates(Filter(group="hb")) == [1]
+        assert search_index.candidates(Filter(group="o")) == [0]
+        assert search_index.candidates(Filter(group="missing")) == []
+        assert search_index.candidates(Filter(name="STIF")) == [0]
+        assert search_index.candidates(Filter(name="bcsstk", group="hb")) == [1]
+
+    def test_candidates_ranges(self, sample_matrices):
+        """Range criteria are resolved by binary search, bounds inclusive."""
+        search_index = SearchIndex(sample_matrices)
+
+        assert search_index.candidates(Filter(n_rows=(None, 48))) == [1]
+        assert search_index.candidates(Filter(n_rows=(48, None))) == [0, 1]
+        assert search_index.candidates(Filter(n_rows=(49, 52328))) == []
+        # Matrices without a value never satisfy a range
+        assert search_index.candidates(Filter(nnz=(None, None))) == []
+
+    def test_candidates_ranges_with_ties(self):
+        """Rows sharing a bound value are all kept, in original order."""
+        search_index = SearchIndex([{"num_rows": n} for n in (50, 10, 50, 30, 10, 70)])
+
+        assert search_index.candidates(Filter(n_rows=(None, 50))) == [0, 1, 2, 3, 4]
+        assert search_index.candidates(Filter(n_rows=(10, 10))) == [1, 4]
+        assert search_index.candidates(Filter(n_rows=(50, 70))) == [0, 2, 5]
+
+    def test_candidates_multiple_ranges(self):
+        """Every range criterion is applied, not only the most selective."""
+        search_index = SearchIndex(
+            [
+                {"num_rows": 10, "num_cols": 10, "nnz": 50},
+                {"num_rows": 20, "num_cols": 20, "nnz": 5},
+                {"num_rows": 30, "num_cols": 30},
+            ]
+        )
+
+        assert search_index.candidates(Filter(n_rows=(15, None), nnz=(1, 10))) == [1]
+        assert search_index.candidates(Filter(n_rows=(None, 20), n_cols=(20, 30))) == [
+            1
+        ]
+
+    def test_candidates_boolean_flags(self):
+        """Boolean criteria are answered from the row bitmasks like matches()."""
+        matrices = [
+            {"num_rows": 5, "num_cols": 5, "spd": True, "posdef": True},
+            {"num_rows": 5, "num_cols": 5, "spd": False, "posdef": 0},
+            {"rows": 4, "cols": 6, "posdef": 1},
+            {"num_rows": 3},
+            {},
+        ]
+        search_index = SearchIndex(matrices)
+
+        for filter_obj in [
+            Filter(spd=True),
+            Filter(spd=False),
+            Filter(posdef=True),
+            Filter(posdef=False),
+            Filter(square=True),
+            Filter(square=False),
+            Filter(spd=False, posdef=True, square=False),
+            Filter(spd=True, square=False),
+        ]:
+            expected = [i for i, m in enumerate(matrices) if filter_obj.matches(m)]
+            assert search_index.is_exact(filter_obj)
+            assert search_index.candidates(filter_obj) == expected
+        assert search_index.candidates(Filter(posdef=True, square=False)) == [2]
+
+    def test_is_exact(self, sample_matrices):
+        """Only filters made of indexed criteria are answered exactly."""
+        search_index = SearchIndex(sample_matrices)
+
+        assert search_index.is_exact(Filter(group="hb", spd=True, n_rows=(None, 100)))
+        assert not search_index.is_exact(Filter(group="hb", cholesky_candidate=True))
+        assert not search_index.is_exact(Filter(condition_number=(None, 1e6)))
+        # Values the index cannot represent defer to Filter.matches
+        assert not SearchIndex([{"group": 1}]).is_exact(Filter(group="hb"))
+        assert not SearchIndex([{"num_rows": "48"}]).is_exact(Filter(name="x"))
+
+    def test_candidates_keep_nan_values(self):
+        """NaN values are left to matches(), which accepts them in any range."""
+        nan = float("nan")
+        matrices = [
+            {"num_rows": nan, "num_cols": 10, "condition_number": 1e3},
+            {"num_rows": 10, "num_cols": nan, "condition_number": nan},
+            {"num_rows": 500, "num_cols": 500, "condition_number": 1e3},
+        ]
+        search_index = SearchIndex(matrices)
+
+        for filter_obj in [
+            Filter(n_rows=(None, 100)),
+            Filter(n_rows=(1000, None), n_cols=(None, 100)),
+            Filter(n_cols=(1, 1), n_rows=(1, 100)),
+            Filter(n_rows=(None, 100), condition_number=(None, 1e6)),
+        ]:
+            rows = search_index.candidates(filter_obj)
+            expected = [m for m in matrices if filter_obj.matches(m)]
+            assert not search_index.is_exact(filter_obj)
+            assert [matrices[i] for i in rows if filter_obj.matches(matrices[i])] == (
+                expected
+            )
+
+    def test_candidates_agree_with_full_scan(self, sample_matrices):
+        """Candidates filtered by matches() must equal a full scan."""
+        search_index = SearchIndex(sample_matrices)
+
+        for filter_obj in [
+            Filter(group="B", n_rows=(None, 1000)),
+            Filter(spd=False),
+            Filter(group="", n_rows=(1, None)),
+            Filter(group="b", name="c", spd=False, n_rows=(None, 100)),
+        ]:
+            rows = search_index.candidates(filter_obj)
+            expected = [m for m in sample_matrices if filter_obj.matches(m)]
+            assert search_index.is_exact(filter_obj)
+            assert [sample_matrices[i] for i in rows] == expected